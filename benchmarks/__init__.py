@@ -0,0 +1,10 @@
+# File: benchmarks/__init__.py
+"""
+DocuGen benchmark suite.
+
+Usage:
+    python -m benchmarks run --rows 200
+    python -m benchmarks run --compare
+    python -m benchmarks startup --compare
+    python -m benchmarks generate --rows 10000 --output data/synthetic_clients.xlsx
+"""
@@ -0,0 +1,153 @@
+# File: benchmarks/__main__.py
+
+import sys
+from pathlib import Path
+
+import click
+
+from src.core.config_loader import ConfigLoader
+from src.utils.logger import setup_logging
+
+from . import history
+from .synthetic import generate_rows, write_client_map, write_export
+
+RESULTS_DIR = Path('benchmarks/results')
+
+
+@click.group()
+def main():
+    """DocuGen benchmark suite"""
+    pass
+
+@main.command()
+@click.option('--config', default='client_map_da_mapper.yaml', help='Mapper configuration to benchmark')
+@click.option('--rows', type=int, default=200, help='Number of synthetic rows')
+@click.option('--repeat', type=int, default=5, help='Repetitions per micro-benchmark')
+@click.option('--converters', is_flag=True, help='Also benchmark each available PDF converter')
+@click.option('--pdf', is_flag=True, help='Also run the end-to-end benchmark with PDF generation')
+@click.option('--history', 'history_path', default=str(RESULTS_DIR / 'history.json'), help='JSON history file')
+@click.option('--baseline', 'baseline_path', default=str(RESULTS_DIR / 'baseline.json'), help='Baseline file')
+@click.option('--save-baseline', is_flag=True, help='Store this run as the new baseline')
+@click.option('--compare', 'compare_baseline', is_flag=True, help='Flag regressions against the baseline')
+@click.option('--threshold', type=float, default=0.10, help='Allowed throughput drop before flagging (0.10 = 10%)')
+def run(config, rows, repeat, converters, pdf, history_path, baseline_path, save_baseline, compare_baseline, threshold):
+    """Run micro and end-to-end benchmarks on synthetic data."""
+
+    setup_logging('WARNING')
+
+    from .suite import BenchmarkSuite
+
+    config_loader = ConfigLoader()
+    app_config = config_loader.load_app_config()
+    mapper_config = config_loader.load_mapper_config(config)
+
+    suite = BenchmarkSuite(app_config, mapper_config, rows=rows, repeat=repeat)
+    try:
+        results = suite.run(include_converters=converters, include_pdf_e2e=pdf)
+    finally:
+        suite.close()
+
+    click.echo(f"{'Benchmark':<28} {'ops/sec':>12} {'median ms':>12}")
+    click.echo('-' * 54)
+    for name, stats in results.items():
+        click.echo(f"{name:<28} {stats['ops_per_sec']:>12.1f} {stats['median_s'] * 1000:>12.2f}")
+
+    entry = history.build_entry(results, {'config': config, 'rows': rows, 'repeat': repeat})
+    history.append_history(entry, Path(history_path))
+    click.echo(f"\nResults appended to {history_path}")
+
+    if save_baseline:
+        history.save_baseline(entry, Path(baseline_path))
+        click.echo(f"Baseline saved to {baseline_path}")
+
+    if compare_baseline:
+        baseline = history.load_json(Path(baseline_path))
+        if not baseline:
+            raise click.ClickException(f"No baseline found at {baseline_path}; run with --save-baseline first")
+
+        comparison = history.compare(results, baseline['results'], threshold)
+        click.echo(f"\nComparison against baseline {baseline.get('git_rev')} ({baseline.get('timestamp')}):")
+        for item in comparison:
+            flag = '❌ REGRESSION' if item['regression'] else '✅'
+            click.echo(f"  {item['name']:<28} {item['baseline']:>10.1f} → {item['current']:>10.1f} "
+                       f"({item['change']:+.1%}) {flag}")
+
+        if any(item['regression'] for item in comparison):
+            sys.exit(1)
+
+@main.command()
+@click.option('--config', default='client_map_da_mapper.yaml', help='Mapper configuration for the validate timing')
+@click.option('--repeat', type=int, default=5, help='Runs per command')
+@click.option('--history', 'history_path', default=str(RESULTS_DIR / 'history.json'), help='JSON history file')
+@click.option('--baseline', 'baseline_path', default=str(RESULTS_DIR / 'startup_baseline.json'), help='Baseline file')
+@click.option('--save-baseline', is_flag=True, help='Store this run as the new baseline')
+@click.option('--compare', 'compare_baseline', is_flag=True, help='Flag regressions against the baseline')
+@click.option('--threshold', type=float, default=0.20, help='Allowed slowdown before flagging (0.20 = 20%)')
+def startup(config, repeat, history_path, baseline_path, save_baseline, compare_baseline, threshold):
+    """Measure cold CLI startup for --help and validate with -X importtime."""
+
+    from .startup import measure_command
+
+    commands = {
+        'startup_help': ['--help'],
+        'startup_validate': ['validate', '--config', config],
+    }
+
+    results = {}
+    failed = False
+    for name, args in commands.items():
+        try:
+            stats = measure_command(args, repeat)
+        except Exception as e:
+            # A crashing command would otherwise be recorded as a (fast) startup time
+            raise click.ClickException(f"{name}: {e}")
+        results[name] = stats
+        click.echo(f"{name:<20} {stats['median_s'] * 1000:>8.1f} ms (min {stats['min_s'] * 1000:.1f} ms)")
+        for module, ms in stats['top_imports'][:5]:
+            click.echo(f"    {ms:>8.1f} ms  {module}")
+
+    # --help must never pull in the generation stack
+    heavy = results['startup_help']['heavy_imports']
+    if heavy:
+        click.echo(f"❌ --help imports heavy modules: {', '.join(heavy)}")
+        failed = True
+
+    entry = history.build_entry(results, {'benchmark': 'startup', 'config': config, 'repeat': repeat})
+    history.append_history(entry, Path(history_path))
+
+    if save_baseline:
+        history.save_baseline(entry, Path(baseline_path))
+        click.echo(f"Baseline saved to {baseline_path}")
+
+    if compare_baseline:
+        baseline = history.load_json(Path(baseline_path))
+        if not baseline:
+            raise click.ClickException(f"No baseline found at {baseline_path}; run with --save-baseline first")
+        for item in history.compare(results, baseline['results'], threshold):
+            flag = '❌ REGRESSION' if item['regression'] else '✅'
+            click.echo(f"  {item['name']:<20} {1000 / item['baseline']:>8.1f} ms → {1000 / item['current']:>8.1f} ms {flag}")
+            failed = failed or item['regression']
+
+    if failed:
+        sys.exit(1)
+
+@main.command()
+@click.option('--config', default='client_map_da_mapper.yaml', help='Mapper configuration whose columns to generate')
+@click.option('--rows', type=int, default=1000, help='Number of rows / clients')
+@click.option('--output', required=True, help='Output file (.xlsx, .csv or .json for client_map)')
+@click.option('--seed', type=int, default=42, help='Random seed')
+def generate(config, rows, output, seed):
+    """Generate a synthetic export or client_map.json file."""
+
+    output_path = Path(output)
+    if output_path.suffix.lower() == '.json':
+        write_client_map(rows, output_path, seed)
+    else:
+        mapper_config = ConfigLoader().load_mapper_config(config)
+        write_export(generate_rows(mapper_config, rows, seed), output_path)
+
+    click.echo(f"✅ Wrote {rows} synthetic rows to {output_path}")
+
+
+if __name__ == '__main__':
+    main()
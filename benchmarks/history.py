@@ -0,0 +1,83 @@
+# File: benchmarks/history.py
+"""
+Benchmark result history and regression comparison.
+"""
+
+import json
+import platform
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def git_revision() -> Optional[str]:
+    """Return the current short git revision, if available."""
+
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_entry(results: Dict[str, Dict[str, float]], metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Wrap benchmark results with run metadata."""
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_rev': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'metadata': metadata or {},
+        'results': results
+    }
+
+
+def append_history(entry: Dict[str, Any], history_path: Path):
+    """Append a run to the JSON history file."""
+
+    history_path = Path(history_path)
+    history = load_json(history_path) or []
+    history.append(entry)
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_path, 'w') as f:
+        json.dump(history, f, indent=2)
+
+
+def save_baseline(entry: Dict[str, Any], baseline_path: Path):
+    """Store a run as the baseline that `--compare` checks against."""
+
+    baseline_path = Path(baseline_path)
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(baseline_path, 'w') as f:
+        json.dump(entry, f, indent=2)
+
+
+def load_json(path: Path) -> Any:
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """Compare throughput against the baseline; a drop larger than `threshold` is a regression."""
+
+    rows = []
+    for name, stats in current.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['ops_per_sec']
+        after = stats['ops_per_sec']
+        change = (after - before) / before if before else 0.0
+        rows.append({
+            'name': name,
+            'baseline': before,
+            'current': after,
+            'change': change,
+            'regression': change < -threshold
+        })
+    return rows
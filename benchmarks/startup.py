@@ -0,0 +1,65 @@
+# File: benchmarks/startup.py
+"""
+CLI startup-time benchmark based on `python -X importtime`.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Modules that must not be imported just to show `--help`
+HEAVY_MODULES = ('pandas', 'docx', 'jinja2', 'tqdm', 'openpyxl')
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int]]:
+    """Parse `-X importtime` output into (module, cumulative microseconds) pairs.
+
+    Module names keep their indentation, so top-level imports have none.
+    """
+
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        # Nested imports are indented by two spaces per level after the separator space
+        imports.append((name[1:], int(cumulative_us)))
+    return imports
+
+
+def measure_command(args: List[str], repeat: int = 5) -> Dict[str, object]:
+    """Time `python main.py <args>` and report the heaviest top-level imports."""
+
+    durations = []
+    stderr = ''
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime', 'main.py', *args],
+                                capture_output=True, text=True)
+        durations.append(time.perf_counter() - start)
+        stderr = result.stderr
+        if result.returncode != 0:
+            # Skip the importtime lines; the last real lines are the error
+            error = [line for line in stderr.splitlines() if not line.startswith('import time:')]
+            raise Exception(f"`main.py {' '.join(args)}` exited with {result.returncode}: "
+                            f"{error[-1] if error else 'no output'}")
+
+    imports = parse_importtime(stderr)
+    # Top-level packages only (nested imports are indented in the output)
+    top_level = sorted(
+        [(name, us) for name, us in imports if not name.startswith(' ')],
+        key=lambda item: item[1], reverse=True
+    )
+    imported = {name.strip().split('.')[0] for name, _ in imports}
+
+    median = statistics.median(durations)
+    return {
+        'median_s': median,
+        'min_s': min(durations),
+        'units': 1,
+        'ops_per_sec': 1 / median if median > 0 else 0.0,
+        'heavy_imports': sorted(imported.intersection(HEAVY_MODULES)),
+        'top_imports': [(name.strip(), us / 1000) for name, us in top_level[:10]]
+    }
@@ -0,0 +1,180 @@
+# File: benchmarks/suite.py
+"""
+Micro-benchmarks for the pipeline stages and an end-to-end rows/sec benchmark.
+"""
+
+import io
+import logging
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from src.core.document_processor import DocumentProcessor
+from src.core.jinja_processor import JinjaProcessor
+from src.exporters.headless_pdf_exporter import HeadlessPdfExporter
+from src.importers.excel_importer import ExcelImporter
+
+from .synthetic import generate_rows, write_export
+
+# Typical care-plan paragraph with conditionals, used for the _render_text benchmark
+SAMPLE_PARAGRAPH = (
+    "Name: {{ FirstName }} {{ LastName }}  DOB: {{ DOB }}  "
+    "{% if HM_selected %}☑{% else %}☐{% endif %} Home Maintenance  "
+    "{% if DA_selected %}☑{% else %}☐{% endif %} Domestic Assistance"
+)
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5, units: int = 1) -> Dict[str, float]:
+    """Run `fn` `repeat` times; `units` is the number of items each call processes."""
+
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+
+    median = statistics.median(durations)
+    return {
+        'median_s': median,
+        'min_s': min(durations),
+        'units': units,
+        'ops_per_sec': units / median if median > 0 else 0.0
+    }
+
+
+class BenchmarkSuite:
+    """Runs the DocuGen benchmarks against synthetic data for one mapper configuration."""
+
+    def __init__(self, app_config: Dict[str, Any], mapper_config: Dict[str, Any],
+                 rows: int = 200, repeat: int = 5, seed: int = 42):
+        self.app_config = app_config
+        self.mapper_config = mapper_config
+        self.rows = rows
+        self.repeat = repeat
+        self.seed = seed
+        self.logger = logging.getLogger(__name__)
+
+        self.work_dir = Path(tempfile.mkdtemp(prefix='docugen_bench_'))
+        self.export_path = write_export(generate_rows(mapper_config, rows, seed), self.work_dir / 'clients.xlsx')
+        self.template_path = self._template_path()
+
+        importer = ExcelImporter()
+        self.dataframe = importer.read_file(str(self.export_path))
+        self.mapped_rows = importer.map_data(self.dataframe, mapper_config)
+
+    def close(self):
+        """Remove the work directory with the synthetic export and generated documents."""
+
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _template_path(self) -> Path:
+        template_path = Path(self.mapper_config['template_file'])
+        if not template_path.is_absolute():
+            template_path = Path('templates') / template_path
+        return template_path
+
+    def run(self, include_converters: bool = False, include_pdf_e2e: bool = False) -> Dict[str, Dict[str, float]]:
+        """Run all benchmarks and return results keyed by benchmark name."""
+
+        results = {
+            'map_data': self.bench_map_data(),
+            'render_text': self.bench_render_text(),
+            'process_template': self.bench_process_template(),
+            'doc_save': self.bench_doc_save(),
+            'end_to_end_docx': self.bench_end_to_end(generate_pdf=False),
+        }
+
+        if include_converters:
+            results.update(self.bench_converters())
+        if include_pdf_e2e:
+            results['end_to_end_pdf'] = self.bench_end_to_end(generate_pdf=True)
+
+        return results
+
+    def bench_map_data(self) -> Dict[str, float]:
+        importer = ExcelImporter()
+        return measure(lambda: importer.map_data(self.dataframe, self.mapper_config),
+                       self.repeat, units=len(self.dataframe))
+
+    def bench_render_text(self, iterations: int = 1000) -> Dict[str, float]:
+        processor = JinjaProcessor()
+        row = self.mapped_rows[0]
+
+        def render():
+            for _ in range(iterations):
+                processor._render_text(SAMPLE_PARAGRAPH, row)
+
+        return measure(render, self.repeat, units=iterations)
+
+    def bench_process_template(self, documents: int = 10) -> Dict[str, float]:
+        processor = JinjaProcessor()
+        rows = self.mapped_rows[:documents]
+
+        def process():
+            for row in rows:
+                processor.process_template(self.template_path, row)
+
+        return measure(process, self.repeat, units=len(rows))
+
+    def bench_doc_save(self, documents: int = 10) -> Dict[str, float]:
+        processor = JinjaProcessor()
+        docs = [processor.process_template(self.template_path, row) for row in self.mapped_rows[:documents]]
+
+        def save():
+            for doc in docs:
+                doc.save(io.BytesIO())
+
+        return measure(save, self.repeat, units=len(docs))
+
+    def bench_converters(self, documents: int = 3) -> Dict[str, Dict[str, float]]:
+        """Time every available converter on a few rendered documents."""
+
+        exporter = HeadlessPdfExporter(self.app_config)
+        processor = JinjaProcessor()
+        docx_dir = self.work_dir / 'converters'
+        docx_dir.mkdir(exist_ok=True)
+
+        docx_paths = []
+        for index, row in enumerate(self.mapped_rows[:documents]):
+            path = docx_dir / f"doc_{index}.docx"
+            processor.process_template(self.template_path, row).save(str(path))
+            docx_paths.append(path)
+
+        # The pool keeps long-lived listeners; only the one-shot converters are timed here
+        converters = {
+            name: getattr(exporter, f"_try_{name}")
+            for name in exporter.CONVERTERS if name != 'libreoffice_pool'
+        }
+
+        results = {}
+        for name, converter in converters.items():
+            try:
+                converter(docx_paths[0], docx_paths[0].with_suffix('.pdf'))
+            except Exception as e:
+                self.logger.info(f"Skipping converter {name}: {e}")
+                continue
+
+            def convert():
+                for path in docx_paths:
+                    converter(path, path.with_suffix('.pdf'))
+
+            results[f"convert_{name}"] = measure(convert, max(1, self.repeat // 2), units=len(docx_paths))
+
+        return results
+
+    def bench_end_to_end(self, generate_pdf: bool = False) -> Dict[str, float]:
+        """Full read → map → render → save run over the synthetic workbook."""
+
+        run_index = 0
+
+        def process():
+            nonlocal run_index
+            run_index += 1
+            output_dir = self.work_dir / f"e2e_{run_index}"
+            processor = DocumentProcessor(self.app_config, self.mapper_config, str(output_dir))
+            processor.process_documents(str(self.export_path), generate_pdf=generate_pdf)
+
+        return measure(process, max(1, self.repeat // 2), units=self.rows)
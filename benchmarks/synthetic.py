@@ -0,0 +1,147 @@
+# File: benchmarks/synthetic.py
+"""
+Synthetic data generators that match the mapper schemas.
+"""
+
+import csv
+import json
+import random
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+GIVEN_NAMES = ['Margaret', 'John', 'Patricia', 'Robert', 'Barbara', 'William', 'Dorothy', 'James',
+               'Joan', 'Kevin', 'Shirley', 'Peter', 'Beverley', 'Graham', 'Noeline', 'Bruce']
+FAMILY_NAMES = ['Smith', 'Jones', 'Williams', 'Brown', 'Wilson', 'Taylor', 'Nguyen', "O'Brien",
+                'Anderson', 'Thompson', 'Kelly', 'Martin', 'Walker', 'White', 'Lee', 'Harris']
+SUBURBS = [('Parramatta', '2150'), ('Blacktown', '2148'), ('Penrith', '2750'), ('Liverpool', '2170'),
+           ('Hornsby', '2077'), ('Wollongong', '2500'), ('Gosford', '2250'), ('Newcastle', '2300')]
+STREETS = ['George St', 'Church St', 'Victoria Rd', 'Railway Pde', 'King St', 'Queen St']
+CONCERNS = [
+    'Reduced mobility after hip surgery.',
+    'Difficulty managing heavy cleaning tasks.',
+    'Overgrown garden creating trip hazards near the entrance.',
+    'Lives alone and has limited family support nearby.',
+    'Vision impairment makes household tasks difficult.',
+    'Gutters blocked; client cannot use a ladder safely.',
+]
+SERVICE_CODES = {'DA': 'domestic_assistance', 'HM': 'home_maintenance'}
+
+
+def _value_for(template_var: str, index: int, rng: random.Random, service_types: List[str]) -> Any:
+    """Produce a plausible value for a template variable name."""
+
+    key = template_var.lower()
+    if key == 'acn':
+        return f"AC{10000000 + index:08d}"
+    if key in ('firstname', 'givenname'):
+        return rng.choice(GIVEN_NAMES)
+    if key in ('lastname', 'familyname'):
+        return rng.choice(FAMILY_NAMES)
+    if key in ('dob', 'birthdate'):
+        return datetime(1930, 1, 1) + timedelta(days=rng.randint(0, 365 * 30))
+    if key in ('gender', 'gendercode'):
+        return rng.choice(['Male', 'Female'])
+    if key == 'phone':
+        return f"04{rng.randint(10000000, 99999999)}"
+    if key == 'address1':
+        return f"{rng.randint(1, 250)} {rng.choice(STREETS)}"
+    if key == 'address2':
+        return '' if rng.random() < 0.7 else f"Unit {rng.randint(1, 40)}"
+    if key == 'suburb':
+        return SUBURBS[index % len(SUBURBS)][0]
+    if key == 'postcode':
+        return SUBURBS[index % len(SUBURBS)][1]
+    if key in ('servicetype', 'type', 'servicetypes'):
+        return rng.choice(service_types)
+    if key == 'servicestartdate':
+        return (date(2023, 1, 1) + timedelta(days=rng.randint(0, 700))).isoformat()
+    if key == 'concerns':
+        # Vary the length so rows are not all the same size
+        return ' '.join(rng.sample(CONCERNS, rng.randint(1, len(CONCERNS))))
+    return f"{template_var}-{index}"
+
+
+def generate_rows(mapper_config: Dict[str, Any], count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate raw export rows keyed by the mapper's source column names."""
+
+    rng = random.Random(seed)
+    service_types = list(mapper_config.get('service_types', {}).keys()) or ['HM', 'DA']
+    field_mappings = mapper_config.get('field_mappings', {})
+
+    return [
+        {column: _value_for(template_var, index, rng, service_types)
+         for column, template_var in field_mappings.items()}
+        for index in range(count)
+    ]
+
+
+def write_export(rows: List[Dict[str, Any]], output_path: Path) -> Path:
+    """Write rows as an Excel (.xlsx) or CSV export depending on the suffix."""
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if output_path.suffix.lower() == '.csv':
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else [])
+            writer.writeheader()
+            writer.writerows(rows)
+    elif output_path.suffix.lower() == '.xlsx':
+        import pandas as pd
+        pd.DataFrame(rows).to_excel(output_path, index=False, engine='openpyxl')
+    else:
+        raise ValueError(f"Unsupported export format: {output_path.suffix}")
+
+    return output_path
+
+
+def generate_client_map(count: int, seed: int = 42) -> Dict[str, Any]:
+    """Generate a client_map.json structure as read by JsonImporter."""
+
+    rng = random.Random(seed)
+    clients = []
+
+    for index in range(count):
+        suburb, postcode = rng.choice(SUBURBS)
+        codes = rng.sample(list(SERVICE_CODES), rng.randint(1, len(SERVICE_CODES)))
+        clients.append({
+            'personal_info': {
+                'given_name': rng.choice(GIVEN_NAMES),
+                'family_name': rng.choice(FAMILY_NAMES),
+                'birth_date': (date(1930, 1, 1) + timedelta(days=rng.randint(0, 365 * 30))).isoformat(),
+                'gender': rng.choice(['Male', 'Female']),
+                'contact_numbers': [f"04{rng.randint(10000000, 99999999)}"],
+                'concerns': ' '.join(rng.sample(CONCERNS, rng.randint(1, 3)))
+            },
+            'location': {
+                'address_1': f"{rng.randint(1, 250)} {rng.choice(STREETS)}",
+                'address_2': '',
+                'suburb': suburb,
+                'postcode': postcode
+            },
+            'platform_identifiers': [
+                {'platform': 'aged_care', 'identifiers': {'acn': f"AC{10000000 + index:08d}"}}
+            ],
+            'service_information': {
+                'services': [
+                    {
+                        'service_type': SERVICE_CODES[code],
+                        'first_service_date': (date(2023, 1, 1) + timedelta(days=rng.randint(0, 700))).isoformat()
+                    }
+                    for code in codes
+                ]
+            }
+        })
+
+    return {'clients': clients}
+
+
+def write_client_map(count: int, output_path: Path, seed: int = 42) -> Path:
+    """Write a synthetic client_map.json file."""
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(generate_client_map(count, seed), f, indent=2)
+    return output_path
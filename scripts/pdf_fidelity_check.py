@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# File: scripts/pdf_fidelity_check.py
+"""
+Compare the fast-lane (reportlab) PDF renderer against LibreOffice output.
+
+For each .docx both PDFs are produced, their text is extracted (pypdf, or
+the `pdftotext` tool) and compared. Reports text similarity and page counts;
+exits non-zero when any document falls below --threshold. With
+--skip-missing it exits 0 instead of failing when LibreOffice or a text
+extractor is not installed, so it can run as an automated check anywhere.
+
+    python scripts/pdf_fidelity_check.py output/*.docx --threshold 0.95
+"""
+
+import argparse
+import difflib
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Add the project root to the path so we can import our modules
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.config_loader import ConfigLoader
+from src.exporters.headless_pdf_exporter import HeadlessPdfExporter
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+
+def extract_text(pdf_path: Path) -> Tuple[str, Optional[int]]:
+    """Return (normalized text, page count) for a PDF."""
+
+    if PdfReader is not None:
+        reader = PdfReader(str(pdf_path))
+        text = '\n'.join(page.extract_text() or '' for page in reader.pages)
+        pages = len(reader.pages)
+    elif shutil.which('pdftotext'):
+        text = subprocess.run(['pdftotext', '-layout', str(pdf_path), '-'],
+                              capture_output=True, text=True, check=True).stdout
+        pages = text.count('\f') or None
+    else:
+        raise SystemExit("Install pypdf (pip install pypdf) or poppler-utils (pdftotext) to compare PDFs")
+
+    # Checkbox glyphs come out differently per renderer; compare the words only
+    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s.,:;/()&-]', ' ', text)).strip(), pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('docx', nargs='+', help='Rendered .docx files to compare')
+    parser.add_argument('--threshold', type=float, default=0.95, help='Minimum text similarity (0-1)')
+    parser.add_argument('--keep', help='Directory to keep both PDFs in for visual comparison')
+    parser.add_argument('--skip-missing', action='store_true',
+                        help='Exit 0 (skipped) when LibreOffice or a PDF text extractor is missing')
+    args = parser.parse_args()
+
+    missing = []
+    if not shutil.which('libreoffice'):
+        missing.append("LibreOffice (reference renderer)")
+    if PdfReader is None and not shutil.which('pdftotext'):
+        missing.append("pypdf or pdftotext")
+    if missing:
+        if args.skip_missing:
+            print(f"SKIPPED: {', '.join(missing)} not installed")
+            sys.exit(0)
+        raise SystemExit(f"Required for the comparison: {', '.join(missing)}")
+
+    exporter = HeadlessPdfExporter(ConfigLoader().load_app_config())
+
+    work_dir = Path(args.keep) if args.keep else Path(tempfile.mkdtemp(prefix='docugen_fidelity_'))
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"{'Document':<50} {'similarity':>10} {'pages (fast/LO)':>16}")
+    print('-' * 78)
+
+    failures = 0
+    for docx in map(Path, args.docx):
+        fast_pdf = work_dir / f"{docx.stem}.fast.pdf"
+        reference_dir = work_dir / 'libreoffice'
+        reference_dir.mkdir(exist_ok=True)
+        reference_pdf = reference_dir / f"{docx.stem}.pdf"
+
+        exporter._try_python_docx2pdf(docx, fast_pdf)
+        exporter._try_libreoffice(docx, reference_pdf)
+
+        fast_text, fast_pages = extract_text(fast_pdf)
+        reference_text, reference_pages = extract_text(reference_pdf)
+        similarity = difflib.SequenceMatcher(None, fast_text, reference_text, autojunk=False).ratio()
+
+        ok = similarity >= args.threshold
+        failures += not ok
+        flag = '✅' if ok else '❌'
+        print(f"{docx.name[:50]:<50} {similarity:>10.3f} {f'{fast_pages}/{reference_pages}':>16} {flag}")
+
+    exporter.close()
+    if not args.keep:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"\n{len(args.docx) - failures}/{len(args.docx)} documents at or above {args.threshold:.2f} similarity")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,20 @@
 # File: src/cli/commands.py
 
 import os
+from datetime import datetime
 from pathlib import Path
 
 import click
 
 from ..core.config_loader import ConfigLoader
-from ..core.document_processor import DocumentProcessor
-from ..importers.excel_importer import ExcelImporter
+from ..core.job_queue import JobQueue
 from ..utils.logger import setup_logging
+from ..utils.memory_profiler import MemoryProfiler
+from ..utils.profiler import PipelineProfiler
+from ..utils.stage_timer import StageTimer
 
+# Commands import the generation stack (pandas, python-docx, Jinja, tqdm) only
+# when they need it, so `--help` and `validate` start quickly.
 
 @click.group()
 def cli():
@@ -21,14 +26,35 @@ def cli():
 @click.option('--data', required=True, help='Path to Excel data file')
 @click.option('--output', default='output', help='Output directory')
 @click.option('--dry-run', is_flag=True, help='Validate configuration and preview data without generating documents')
+@click.option('--preview-rows', type=int, default=5, help='Rows to map in a dry run')
+@click.option('--preview-sample', is_flag=True, help='Preview a random sample instead of the first rows')
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
 @click.option('--start-row', type=int, help='Start processing from specific row number')
 @click.option('--end-row', type=int, help='End processing at specific row number')
 @click.option('--no-pdf', is_flag=True, help='Skip PDF generation (Word documents only)')
-@click.option('--resume', is_flag=True, help='Resume from previous session')
-def process(config, data, output, dry_run, verbose, start_row, end_row, no_pdf, resume):
+@click.option('--resume', is_flag=True, help='Skip rows whose output already exists')
+@click.option('--archive', help='Stream documents into this .zip, .tar or .tar.zst archive instead of the output directory')
+@click.option('--archive-volume-size', help='Roll over to a new archive volume at this size (e.g. 500M, 2G)')
+@click.option('--print-run', is_flag=True, help='Also combine the PDFs into print-run files (output/print_runs)')
+@click.option('--print-run-group', help='Field to split print runs by, e.g. Suburb or Type')
+@click.option('--profile', is_flag=True, help='Time each pipeline stage and print a p50/p95/p99 report')
+@click.option('--profile-output', help='Path prefix for raw stage timings (.json/.csv); defaults to logs/profile_<timestamp>')
+@click.option('--cprofile', 'cprofile_path', help='Run under cProfile and write stats to this file')
+@click.option('--sample-profile', 'sample_profile_path', help='Run under the sampling profiler and write collapsed stacks to this file')
+@click.option('--profile-rows', help='Only profile rows START:END (1-based, inclusive)')
+@click.option('--profile-top', type=int, default=20, help='Number of hot functions to log')
+@click.option('--memprofile', is_flag=True, help='Take tracemalloc/RSS snapshots at stage boundaries and every N rows')
+@click.option('--memprofile-interval', type=int, default=100, help='Rows between memory snapshots')
+@click.option('--memprofile-output', help='JSON report path; defaults to logs/memprofile_<timestamp>.json')
+def process(config, data, output, dry_run, preview_rows, preview_sample, verbose, start_row, end_row, no_pdf, resume, archive,
+            archive_volume_size, print_run, print_run_group, profile, profile_output,
+            cprofile_path, sample_profile_path, profile_rows, profile_top, memprofile, memprofile_interval,
+            memprofile_output):
     """Process Excel data through templates to generate documents."""
 
+    from ..core.document_processor import DocumentProcessor
+    from ..exporters.archive_writer import parse_size
+
     # Setup logging
     log_level = 'DEBUG' if verbose else 'INFO'
     logger = setup_logging(log_level)
@@ -40,24 +66,304 @@ def process(config, data, output, dry_run, verbose, start_row, end_row, no_pdf,
         mapper_config = config_loader.load_mapper_config(config)
 
         # Initialize processor
+        timer = StageTimer(enabled=profile)
+        profiler = _build_profiler(cprofile_path, sample_profile_path, profile_rows, profile_top)
+        memory_profiler = None
+        if memprofile:
+            memory_profiler = MemoryProfiler(
+                every_n_rows=memprofile_interval,
+                report_path=memprofile_output or f"logs/memprofile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            )
+        processor = DocumentProcessor(app_config, mapper_config, output, timer=timer, profiler=profiler,
+                                      memory_profiler=memory_profiler)
+
+        if profiler:
+            profiler.start()
+        if memory_profiler:
+            memory_profiler.start()
+        try:
+            if dry_run:
+                processor.validate_and_preview(data, start_row, end_row,
+                                               preview_rows=preview_rows, sample=preview_sample)
+            else:
+                processor.process_documents(
+                    data_file=data,
+                    start_row=start_row,
+                    end_row=end_row,
+                    generate_pdf=not no_pdf,
+                    resume=resume,
+                    archive=archive,
+                    archive_volume_size=parse_size(archive_volume_size) if archive_volume_size else None,
+                    print_run=print_run,
+                    print_run_group=print_run_group
+                )
+        finally:
+            if profiler:
+                profiler.finish()
+            if memory_profiler:
+                memory_profiler.finish()
+
+        if profile:
+            prefix = profile_output or f"logs/profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            timer.write_json(Path(f"{prefix}.json"))
+            timer.write_csv(Path(f"{prefix}.csv"))
+            click.echo(timer.format_report())
+            click.echo(f"Raw stage timings written to {prefix}.json and {prefix}.csv")
+
+    except Exception as e:
+        if logger:
+            logger.error(f"Processing failed: {str(e)}")
+        else:
+            click.echo(f"Error: Processing failed: {str(e)}", err=True)
+        raise click.ClickException(str(e))
+
+@cli.command()
+@click.option('--config', required=True, help='Path to mapper configuration file')
+@click.option('--data', required=True, help='Path to Excel data file')
+@click.option('--queue', 'queue_path', default='output/jobs.sqlite', help='Path to the SQLite job queue')
+@click.option('--output', default='output', help='Output directory')
+@click.option('--start-row', type=int, help='Start processing from specific row number')
+@click.option('--end-row', type=int, help='End processing at specific row number')
+@click.option('--no-pdf', is_flag=True, help='Skip PDF generation (Word documents only)')
+@click.option('--reset', is_flag=True, help='Clear existing jobs before enqueueing')
+@click.option('--verbose', is_flag=True, help='Enable verbose logging')
+def enqueue(config, data, queue_path, output, start_row, end_row, no_pdf, reset, verbose):
+    """Load data rows into a job queue for `worker` processes."""
+
+    from ..core.document_processor import DocumentProcessor
+
+    log_level = 'DEBUG' if verbose else 'INFO'
+    logger = setup_logging(log_level)
+
+    try:
+        config_loader = ConfigLoader()
+        app_config = config_loader.load_app_config()
+        mapper_config = config_loader.load_mapper_config(config)
+
         processor = DocumentProcessor(app_config, mapper_config, output)
+        queue = JobQueue(queue_path)
 
-        if dry_run:
-            processor.validate_and_preview(data, start_row, end_row)
+        count = processor.enqueue_documents(
+            data_file=data,
+            queue=queue,
+            config_path=config,
+            start_row=start_row,
+            end_row=end_row,
+            generate_pdf=not no_pdf,
+            reset=reset
+        )
+        click.echo(f"✅ Enqueued {count} jobs in {queue_path}")
+
+    except Exception as e:
+        if logger:
+            logger.error(f"Enqueue failed: {str(e)}")
         else:
-            processor.process_documents(
-                data_file=data,
-                start_row=start_row,
-                end_row=end_row,
-                generate_pdf=not no_pdf,
-                resume=resume
+            click.echo(f"Error: Enqueue failed: {str(e)}", err=True)
+        raise click.ClickException(str(e))
+
+@cli.command()
+@click.option('--queue', 'queue_path', default='output/jobs.sqlite', help='Path to the SQLite job queue')
+@click.option('--config', help='Override the mapper configuration stored in the queue')
+@click.option('--output', help='Override the output directory stored in the queue')
+@click.option('--worker-id', help='Worker name (defaults to host-pid)')
+@click.option('--lease', type=int, default=300, help='Lease duration in seconds')
+@click.option('--max-attempts', type=int, default=3, help='Attempts per job before it is marked failed')
+@click.option('--max-jobs', type=int, help='Stop after processing this many jobs')
+@click.option('--wait', is_flag=True, help='Keep polling while other workers hold leases')
+@click.option('--no-pdf', is_flag=True, help='Skip PDF generation (Word documents only)')
+@click.option('--cprofile', 'cprofile_path', help='Run under cProfile; writes <path>.<worker-id>')
+@click.option('--sample-profile', 'sample_profile_path', help='Run under the sampling profiler; writes <path>.<worker-id>')
+@click.option('--profile-rows', help='Only profile rows START:END (1-based, inclusive)')
+@click.option('--profile-top', type=int, default=20, help='Number of hot functions to log')
+@click.option('--verbose', is_flag=True, help='Enable verbose logging')
+def worker(queue_path, config, output, worker_id, lease, max_attempts, max_jobs, wait, no_pdf,
+           cprofile_path, sample_profile_path, profile_rows, profile_top, verbose):
+    """Claim and process jobs from a queue created by `enqueue`."""
+
+    from ..core.document_processor import DocumentProcessor
+
+    log_level = 'DEBUG' if verbose else 'INFO'
+    logger = setup_logging(log_level)
+
+    try:
+        if not Path(queue_path).exists():
+            raise FileNotFoundError(f"Job queue not found: {queue_path}")
+
+        queue = JobQueue(queue_path, lease_seconds=lease, max_attempts=max_attempts)
+        metadata = queue.get_metadata()
+        if not (config or metadata.get('config')):
+            raise ValueError("Queue has no stored mapper config; pass --config")
+
+        config_loader = ConfigLoader()
+        app_config = config_loader.load_app_config()
+        mapper_config = config_loader.load_mapper_config(config or metadata.get('config'))
+
+        worker_id = worker_id or JobQueue.default_worker_id()
+        # Each worker writes its own profile; combine them with `profile-merge`
+        profiler = _build_profiler(
+            f"{cprofile_path}.{worker_id}" if cprofile_path else None,
+            f"{sample_profile_path}.{worker_id}" if sample_profile_path else None,
+            profile_rows, profile_top
+        )
+
+        processor = DocumentProcessor(app_config, mapper_config, output or metadata.get('output_dir', 'output'),
+                                      profiler=profiler)
+        if profiler:
+            profiler.start()
+        try:
+            processor.process_queue(
+                queue=queue,
+                worker_id=worker_id,
+                generate_pdf=metadata.get('generate_pdf', True) and not no_pdf,
+                max_jobs=max_jobs,
+                wait=wait
             )
+        finally:
+            if profiler:
+                profiler.finish()
 
     except Exception as e:
         if logger:
-            logger.error(f"Processing failed: {str(e)}")
+            logger.error(f"Worker failed: {str(e)}")
         else:
-            click.echo(f"Error: Processing failed: {str(e)}", err=True)
+            click.echo(f"Error: Worker failed: {str(e)}", err=True)
+        raise click.ClickException(str(e))
+
+@cli.command()
+@click.argument('source', type=click.Path(exists=True))
+@click.option('--force', is_flag=True, help='Convert even when an up-to-date PDF exists')
+@click.option('--concurrency', type=int, help='Parallel conversions (overrides pdf.concurrency)')
+@click.option('--verbose', is_flag=True, help='Enable verbose logging')
+def pdf(source, force, concurrency, verbose):
+    """Convert existing .docx files (a directory or .txt/.json manifest) to PDF."""
+
+    from ..exporters.headless_pdf_exporter import HeadlessPdfExporter
+    from ..exporters.pdf_batch import PdfBatchConverter
+
+    log_level = 'DEBUG' if verbose else 'INFO'
+    logger = setup_logging(log_level)
+
+    try:
+        config_loader = ConfigLoader()
+        app_config = config_loader.load_app_config()
+        if concurrency:
+            app_config.setdefault('pdf', {})['concurrency'] = concurrency
+
+        exporter = HeadlessPdfExporter(app_config)
+        converter = PdfBatchConverter(exporter, force=force)
+        documents = converter.collect(Path(source))
+        click.echo(f"📄 {len(documents)} documents in {source}")
+        try:
+            summary = converter.run(documents)
+        finally:
+            exporter.close()
+        click.echo(converter.format_summary(summary))
+
+    except Exception as e:
+        if logger:
+            logger.error(f"PDF conversion failed: {str(e)}")
+        else:
+            click.echo(f"Error: PDF conversion failed: {str(e)}", err=True)
+        raise click.ClickException(str(e))
+
+    if summary['failed']:
+        raise click.ClickException(f"{len(summary['failed'])} document(s) failed to convert")
+
+@cli.command(name='pdf-bench')
+@click.option('--samples', required=True, type=click.Path(exists=True),
+              help='Directory (or .txt/.json manifest) of generated .docx files')
+@click.option('--concurrency', default='1,2,4', help='Comma-separated concurrency levels')
+@click.option('--documents', type=int, default=20, help='Documents converted per converter and level')
+@click.option('--converter', 'converters', multiple=True, help='Only benchmark this converter (repeatable)')
+@click.option('--output', help='Also write the results as JSON to this path')
+@click.option('--verbose', is_flag=True, help='Enable verbose logging')
+def pdf_bench(samples, concurrency, documents, converters, output, verbose):
+    """Benchmark each available PDF converter at several concurrency levels."""
+
+    import json
+
+    from ..exporters.pdf_batch import PdfBatchConverter
+    from ..exporters.pdf_benchmark import PdfBenchmark
+
+    log_level = 'DEBUG' if verbose else 'INFO'
+    logger = setup_logging(log_level)
+
+    try:
+        config_loader = ConfigLoader()
+        app_config = config_loader.load_app_config()
+        levels = [int(level) for level in concurrency.split(',') if level.strip()]
+        if not levels or min(levels) < 1:
+            raise click.BadParameter("concurrency levels must be positive integers", param_hint='--concurrency')
+
+        benchmark = PdfBenchmark(app_config, PdfBatchConverter.collect(Path(samples)),
+                                 concurrency_levels=levels, documents=documents, converters=converters)
+        results = benchmark.run()
+        click.echo(benchmark.format_table(results))
+
+        if output:
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            Path(output).write_text(json.dumps(results, indent=2))
+            click.echo(f"Results written to {output}")
+
+    except click.ClickException:
+        raise
+    except Exception as e:
+        if logger:
+            logger.error(f"PDF benchmark failed: {str(e)}")
+        else:
+            click.echo(f"Error: PDF benchmark failed: {str(e)}", err=True)
+        raise click.ClickException(str(e))
+
+@cli.command()
+@click.option('--config', help='Default mapper configuration for requests that do not name one')
+@click.option('--output', default='output', help='Output directory')
+@click.option('--host', default='127.0.0.1', help='HTTP host (localhost only by default)')
+@click.option('--port', type=int, default=8765, help='HTTP port')
+@click.option('--socket', 'socket_path', help='Serve on this Unix socket instead of HTTP')
+@click.option('--verbose', is_flag=True, help='Enable verbose logging')
+def serve(config, output, host, port, socket_path, verbose):
+    """Run a long-lived render server with warm templates and converters."""
+
+    from ..server.render_server import serve_http, serve_unix
+    from ..server.render_service import RenderService
+
+    log_level = 'DEBUG' if verbose else 'INFO'
+    logger = setup_logging(log_level)
+
+    try:
+        config_loader = ConfigLoader()
+        app_config = config_loader.load_app_config()
+
+        service = RenderService(app_config, output, default_mapper=config)
+        if config:
+            service.warm_up()
+
+        if socket_path:
+            serve_unix(service, socket_path)
+        else:
+            serve_http(service, host, port)
+
+    except Exception as e:
+        if logger:
+            logger.error(f"Server failed: {str(e)}")
+        else:
+            click.echo(f"Error: Server failed: {str(e)}", err=True)
+        raise click.ClickException(str(e))
+
+@cli.command(name='profile-merge')
+@click.argument('profiles', nargs=-1, required=True)
+@click.option('--output', required=True, help='Path for the merged profile')
+@click.option('--mode', type=click.Choice(['cprofile', 'sample']), default='cprofile', help='Profile format')
+@click.option('--top', type=int, default=20, help='Number of hot functions to print')
+def profile_merge(profiles, output, mode, top):
+    """Merge profiles written by several worker processes."""
+
+    try:
+        merged = PipelineProfiler.merge([Path(p) for p in profiles], Path(output), mode)
+        click.echo(PipelineProfiler.summarize(merged, mode, top))
+        click.echo(f"✅ Merged {len(profiles)} profiles into {merged}")
+
+    except Exception as e:
         raise click.ClickException(str(e))
 
 @cli.command()
@@ -72,15 +378,19 @@ def validate(config):
         app_config = config_loader.load_app_config()
         mapper_config = config_loader.load_mapper_config(config)
 
-        # Create processor for validation
-        processor = DocumentProcessor(app_config, mapper_config, 'temp')
-
-        # Validate template
+        # Validate template without building the generation stack
         template_path = Path(mapper_config['template_file'])
         if not template_path.is_absolute():
             template_path = Path('templates') / template_path
 
-        processor.validate_template(template_path)
+        from ..core.jinja_processor import JinjaProcessor
+        JinjaProcessor().validate_template(template_path)
+
+        # Validate the output naming pattern against the mapper's fields
+        from ..generators.filename_pattern import FilenamePattern
+        naming = FilenamePattern(app_config.get('output', {}).get('naming_pattern'))
+        naming.validate(FilenamePattern.available_fields(mapper_config))
+        click.echo(f"✅ Naming pattern: {naming.pattern}")
 
         click.echo("✅ Configuration and template validation successful!")
 
@@ -91,5 +401,20 @@ def validate(config):
             click.echo(f"Error: Validation failed: {str(e)}", err=True)
         raise click.ClickException(str(e))
 
+def _build_profiler(cprofile_path, sample_profile_path, profile_rows, profile_top):
+    """Create a PipelineProfiler from CLI options (None when profiling is off)."""
+
+    if cprofile_path and sample_profile_path:
+        raise click.UsageError("Use either --cprofile or --sample-profile, not both")
+    if not (cprofile_path or sample_profile_path):
+        return None
+
+    return PipelineProfiler(
+        cprofile_path or sample_profile_path,
+        mode='cprofile' if cprofile_path else 'sample',
+        rows=PipelineProfiler.parse_rows(profile_rows),
+        top_n=profile_top
+    )
+
 if __name__ == '__main__':
     cli()
@@ -1,7 +1,21 @@
 # File: src/core/__init__.py
 
-from .config_loader import ConfigLoader
-from .document_processor import DocumentProcessor
-from .jinja_processor import JinjaProcessor
+import importlib
 
-__all__ = ['ConfigLoader', 'DocumentProcessor','JinjaProcessor']
+# Exports are imported on first access so that light consumers (the CLI's
+# ConfigLoader, JobQueue) don't pull in pandas, python-docx and Jinja.
+_EXPORTS = {
+    'ConfigLoader': '.config_loader',
+    'DocumentProcessor': '.document_processor',
+    'JinjaProcessor': '.jinja_processor',
+    'JobQueue': '.job_queue',
+}
+
+__all__ = ['ConfigLoader', 'DocumentProcessor','JinjaProcessor', 'JobQueue']
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,25 @@
 # File: src/core/document_processor.py
 
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from tqdm import tqdm
 
 from ..generators.care_plan_generator import CarePlanGenerator
+from ..generators.filename_pattern import FilenamePattern
 from ..importers.excel_importer import ExcelImporter
 from ..utils.logger import setup_logging
+from ..utils.memory_profiler import MemoryProfiler
+from ..utils.profiler import PipelineProfiler
+from ..utils.stage_timer import StageTimer
 from .jinja_processor import JinjaProcessor
+from .job_queue import JobQueue
+
+# Seconds to wait for a cancelled PDF warm-up before closing the exporter anyway
+WARM_UP_CANCEL_TIMEOUT = 10.0
 
 
 class DocumentProcessor:
@@ -18,22 +28,36 @@ class DocumentProcessor:
     Coordinates data import, template processing, and document generation.
     """
 
-    def __init__(self, app_config: Dict[str, Any], mapper_config: Dict[str, Any], output_dir: str):
+    def __init__(self, app_config: Dict[str, Any], mapper_config: Dict[str, Any], output_dir: str,
+                 timer: Optional[StageTimer] = None, profiler: Optional[PipelineProfiler] = None,
+                 memory_profiler: Optional[MemoryProfiler] = None):
         self.app_config = app_config
         self.mapper_config = mapper_config
         self.output_dir = Path(output_dir)
         self.logger = logging.getLogger(__name__)
+        self.timer = timer or StageTimer(enabled=False)
+        self.profiler = profiler
+        self.memory_profiler = memory_profiler
+        self.print_run = None
 
         # Initialize components
         self.importer = ExcelImporter()
-        self.template_processor = JinjaProcessor()
-        self.generator = CarePlanGenerator(self.output_dir, app_config)
+        self.template_processor = JinjaProcessor(timer=self.timer)
+        self.generator = CarePlanGenerator(self.output_dir, app_config, timer=self.timer)
+        available_fields = FilenamePattern.available_fields(mapper_config)
+        self.generator.naming.validate(available_fields)
+        self.generator.layout.validate(available_fields)
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def validate_and_preview(self, data_file: str, start_row: Optional[int] = None, end_row: Optional[int] = None):
-        """Validate configuration and preview data without generating documents."""
+    def validate_and_preview(self, data_file: str, start_row: Optional[int] = None, end_row: Optional[int] = None,
+                             preview_rows: int = 5, sample: bool = False, seed: Optional[int] = None):
+        """Validate configuration and preview data without generating documents.
+
+        Column coverage is computed over the whole file with vectorized checks;
+        only `preview_rows` rows (the first ones, or a random sample) are mapped.
+        """
 
         self.logger.info("🔍 Starting validation and preview...")
 
@@ -41,28 +65,196 @@ class DocumentProcessor:
         template_path = self._get_template_path()
         self.validate_template(template_path)
 
-        # Load and preview data
-        data = self.importer.read_file(data_file)
+        # Load only the mapped columns
+        columns = list(self.mapper_config.get('field_mappings', {}).keys())
+        data = self.importer.read_file(data_file, columns=columns)
 
         # Apply row filtering
         if start_row or end_row:
             data = self._filter_rows(data, start_row, end_row)
 
-        # Map data
-        mapped_data = self.importer.map_data(data, self.mapper_config)
+        # Coverage over every row, without building row dicts
+        coverage = self.importer.column_coverage(data, self.mapper_config)
+        self._show_coverage(coverage, len(data))
+
+        # Map only the preview rows
+        if sample and len(data) > preview_rows:
+            preview = data.sample(n=preview_rows, random_state=seed)
+        else:
+            preview = data.head(preview_rows)
+        mapped_data = self.importer.map_data(preview, self.mapper_config)
 
         # Show preview
-        self._show_data_preview(mapped_data)
+        self._show_data_preview(mapped_data, len(data))
 
         self.logger.info("✅ Validation and preview completed successfully!")
 
     def process_documents(self, data_file: str, start_row: Optional[int] = None,
                          end_row: Optional[int] = None, generate_pdf: bool = True,
-                         resume: bool = False):
-        """Process all documents from data file."""
+                         resume: bool = False, archive: Optional[str] = None,
+                         archive_volume_size: Optional[int] = None, print_run: bool = False,
+                         print_run_group: Optional[str] = None):
+        """Process all documents from data file.
+
+        With `resume`, rows whose output already exists (in their layout
+        directory) are skipped instead of renamed. With `archive`, documents
+        are streamed into a zip/tar archive instead of the output directory.
+        With `print_run` (or `output.print_run.enabled`), the run's PDFs are
+        also combined into print-run files after conversion.
+        """
+
+        if archive and resume:
+            raise ValueError("--resume cannot be combined with --archive")
+        if archive and self.generator.registry.strategy == 'overwrite':
+            # Archive members cannot be replaced, so an overwrite would add a second member with the same name
+            raise ValueError("duplicate_handling: overwrite cannot be combined with --archive (use rename or skip)")
+
+        print_run_config = self.app_config.get('output', {}).get('print_run', {}) or {}
+        self.print_run = None
+        if generate_pdf and (print_run or print_run_group or print_run_config.get('enabled')):
+            if archive:
+                raise ValueError("Print runs cannot be combined with --archive")
+            from ..exporters.print_run import PrintRunBuilder
+            self.print_run = PrintRunBuilder.from_config(self.output_dir, print_run_config, print_run_group)
+            if self.print_run.group_by and self.print_run.group_by not in FilenamePattern.available_fields(self.mapper_config):
+                raise ValueError(f"Print run group '{self.print_run.group_by}' is not a mapped field")
 
         self.logger.info("🚀 Starting document processing...")
 
+        # Start the PDF backend (soffice profile, UNO pool, renderer) while the data loads
+        warm_up = self._start_pdf_warm_up() if generate_pdf else None
+        try:
+            # Load data
+            with self.timer.stage('read'):
+                data = self.importer.read_file(data_file)
+            if self.memory_profiler:
+                self.memory_profiler.checkpoint('read')
+
+            # Apply row filtering
+            if start_row or end_row:
+                data = self._filter_rows(data, start_row, end_row)
+
+            # Map data
+            with self.timer.stage('map'):
+                mapped_data = self.importer.map_data(data, self.mapper_config)
+            if self.memory_profiler:
+                self.memory_profiler.checkpoint('map')
+
+            # Get template
+            template_path = self._get_template_path()
+
+            # Process each row
+            counts = {'success': 0, 'skipped': 0, 'failed': 0, 'pdf_failed': 0}
+
+            if archive:
+                self.generator.open_archive(Path(archive), archive_volume_size)
+
+            if warm_up is not None:
+                # Only waits when the converter start-up outlasts reading and mapping
+                with self.timer.stage('pdf_warm_up_wait'):
+                    warm_up.join()
+
+            self._generate_rows(mapped_data, template_path, generate_pdf, resume, counts)
+        finally:
+            if warm_up is not None and warm_up.is_alive():
+                # Only still running when the run failed early; don't wait out a slow soffice start
+                self.generator.pdf_exporter.cancel_warm_up()
+                warm_up.join(timeout=WARM_UP_CANCEL_TIMEOUT)
+            volumes = self.generator.close()
+
+        print_runs = []
+        if self.print_run:
+            with self.timer.stage('print_run'):
+                print_runs = self.print_run.build()
+
+        # Summary
+        self.logger.info(f"✅ Processing completed!")
+        self.logger.info(f"   Success: {counts['success']}")
+        if counts['skipped']:
+            reason = "existing output" if resume else "duplicates"
+            self.logger.info(f"   Skipped ({reason}): {counts['skipped']}")
+        self.logger.info(f"   Failed: {counts['failed']}")
+        if counts['pdf_failed']:
+            self.logger.info(f"   PDF failed, .docx kept: {counts['pdf_failed']} (convert later with `docugen pdf`)")
+        if volumes:
+            self.logger.info(f"   Archive: {', '.join(str(volume) for volume in volumes)}")
+        else:
+            self.logger.info(f"   Output: {self.output_dir}")
+        if print_runs:
+            self.logger.info(f"   Print runs: {len(print_runs)} in {self.print_run.output_dir}")
+
+    def _start_pdf_warm_up(self) -> threading.Thread:
+        """Warm up the PDF exporter on a background thread."""
+
+        thread = threading.Thread(target=self.generator.pdf_exporter.warm_up, name='pdf-warm-up', daemon=True)
+        thread.start()
+        return thread
+
+    def _generate_rows(self, mapped_data, template_path: Path, generate_pdf: bool, resume: bool,
+                       counts: Dict[str, int]):
+        """Generate a document per mapped row, updating success/skipped/failed counts."""
+
+        with tqdm(total=len(mapped_data), desc="Generating documents") as pbar:
+            for idx, row_data in enumerate(mapped_data):
+                row_number = row_data.get('_row_number', idx + 1)
+                self.timer.set_row(row_number)
+                if self.profiler:
+                    self.profiler.enter_row(row_number)
+                try:
+                    # Generate document
+                    with self.timer.stage('row_total'):
+                        result = self.generator.generate_document(
+                            template_path=template_path,
+                            data=row_data,
+                            template_processor=self.template_processor,
+                            generate_pdf=generate_pdf,
+                            resume=resume,
+                            batch_pdf=True
+                        )
+                    if result.get('pdf_failed'):
+                        counts['failed'] += 1
+                        counts['pdf_failed'] += 1
+                    elif result and not result.get('skipped'):
+                        counts['success'] += 1
+                    else:
+                        counts['skipped'] += 1
+                    if self.print_run and 'pdf' in result:
+                        self.print_run.add(result['pdf'], row_data)
+
+                except Exception as e:
+                    self.logger.warning(f"Failed to process row {row_number}: {str(e)}")
+                    counts['failed'] += 1
+
+                if self.profiler:
+                    self.profiler.exit_row(row_number)
+                if self.memory_profiler:
+                    self.memory_profiler.row_done()
+                if self.generator.pdf_batch_ready:
+                    self._flush_pdfs(counts)
+                pbar.update(1)
+
+        self._flush_pdfs(counts)
+
+    def _flush_pdfs(self, counts: Dict[str, int]):
+        """Convert queued PDFs and move rows whose PDF failed from success to failed."""
+
+        # A batch covers many rows, so it is not attributed to the current one
+        self.timer.set_row(None)
+        with self.timer.stage('pdf_batch'):
+            failed, kept = self.generator.flush_pdfs()
+        counts['success'] -= len(failed)
+        counts['failed'] += len(failed)
+        counts['pdf_failed'] += kept
+        if self.print_run:
+            self.print_run.discard(failed)
+
+    def enqueue_documents(self, data_file: str, queue: JobQueue, config_path: str,
+                          start_row: Optional[int] = None, end_row: Optional[int] = None,
+                          generate_pdf: bool = True, reset: bool = False) -> int:
+        """Map rows from the data file and load them into a job queue for workers."""
+
+        self.logger.info("📥 Loading rows into job queue...")
+
         # Load data
         data = self.importer.read_file(data_file)
 
@@ -73,52 +265,88 @@ class DocumentProcessor:
         # Map data
         mapped_data = self.importer.map_data(data, self.mapper_config)
 
-        # Get template
-        template_path = self._get_template_path()
+        metadata = {
+            'config': config_path,
+            'data_file': str(data_file),
+            'output_dir': str(self.output_dir),
+            'generate_pdf': generate_pdf
+        }
+        return queue.enqueue(mapped_data, metadata, reset=reset)
+
+    def process_queue(self, queue: JobQueue, worker_id: str, generate_pdf: bool = True,
+                      max_jobs: Optional[int] = None, wait: bool = False, poll_interval: float = 5.0):
+        """Claim and process jobs from a queue until it is drained."""
+
+        self.logger.info(f"👷 Worker {worker_id} started on {queue.db_path}")
 
-        # Process each row
+        template_path = self._get_template_path()
         success_count = 0
         failed_count = 0
 
-        with tqdm(total=len(mapped_data), desc="Generating documents") as pbar:
-            for idx, row_data in enumerate(mapped_data):
-                try:
-                    # Generate document
-                    self.generator.generate_document(
+        while max_jobs is None or success_count + failed_count < max_jobs:
+            job = queue.claim(worker_id)
+
+            if job is None:
+                stats = queue.stats()
+                # Other workers may still hold leases that can expire back into the queue
+                if wait and stats[JobQueue.RUNNING] > 0:
+                    time.sleep(poll_interval)
+                    continue
+                break
+
+            if self.profiler:
+                self.profiler.enter_row(job['row_number'])
+            try:
+                with queue.keep_alive(job['id'], worker_id):
+                    result = self.generator.generate_document(
                         template_path=template_path,
-                        data=row_data,
+                        data=job['data'],
                         template_processor=self.template_processor,
                         generate_pdf=generate_pdf
                     )
-                    success_count += 1
+                if result.get('pdf_failed'):
+                    # Counted as failed like in process; the job is retried, so don't leave the .docx behind
+                    self.generator.discard(result)
+                    raise Exception(f"PDF conversion failed for {result['pdf_failed']}")
+                queue.complete(job['id'], worker_id, {k: str(v) for k, v in result.items()})
+                success_count += 1
 
-                except Exception as e:
-                    self.logger.warning(f"Failed to process row {idx + 1}: {str(e)}")
-                    failed_count += 1
+            except Exception as e:
+                self.logger.warning(f"Failed to process row {job['row_number']} "
+                                    f"(attempt {job['attempt']}): {str(e)}")
+                queue.fail(job['id'], worker_id, str(e))
+                failed_count += 1
 
-                pbar.update(1)
+            if self.profiler:
+                self.profiler.exit_row(job['row_number'])
+
+        self.generator.close()
+        stats = queue.stats()
 
         # Summary
-        self.logger.info(f"✅ Processing completed!")
+        self.logger.info(f"✅ Worker {worker_id} finished!")
         self.logger.info(f"   Success: {success_count}")
         self.logger.info(f"   Failed: {failed_count}")
-        self.logger.info(f"   Output: {self.output_dir}")
+        self.logger.info(f"   Queue: {stats}")
 
-    def validate_template(self, template_path: Path):
-        """Validate template file and extract variables."""
+    def render_row(self, row: Dict[str, Any], generate_pdf: bool = True, mapped: bool = False) -> Dict[str, Path]:
+        """Generate documents for a single row of raw export columns (or already mapped data)."""
 
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template file not found: {template_path}")
+        if not mapped:
+            import pandas as pd
+            row = self.importer.map_data(pd.DataFrame([row]), self.mapper_config)[0]
 
-        # Validate template syntax
-        variables = self.template_processor.extract_template_variables(template_path)
+        return self.generator.generate_document(
+            template_path=self._get_template_path(),
+            data=row,
+            template_processor=self.template_processor,
+            generate_pdf=generate_pdf
+        )
 
-        self.logger.info(f"✅ Template validation successful!")
-        self.logger.info(f"   Template: {template_path}")
-        self.logger.info(f"   Variables found: {len(variables)}")
-        self.logger.debug(f"   Variables: {variables}")
+    def validate_template(self, template_path: Path):
+        """Validate template file and extract variables."""
 
-        return variables
+        return self.template_processor.validate_template(template_path)
 
     def _get_template_path(self) -> Path:
         """Get the full path to the template file."""
@@ -147,11 +375,29 @@ class DocumentProcessor:
         self.logger.info(f"📊 Row filtering: {len(data)} → {len(filtered)} rows")
         return filtered
 
-    def _show_data_preview(self, mapped_data):
+    def _show_coverage(self, coverage: Dict[str, Dict[str, Any]], total_rows: int):
+        """Log fill rates per mapped column and missing required values."""
+
+        self.logger.info(f"📋 Column coverage ({total_rows} rows):")
+        for excel_col, stats in coverage.items():
+            marker = '*' if stats['required'] else ' '
+            if not stats['present']:
+                self.logger.warning(f"   {marker} {excel_col} → {stats['template_var']}: column not found")
+            else:
+                self.logger.info(f"   {marker} {excel_col} → {stats['template_var']}: "
+                                 f"{stats['fill_rate']:.1%} filled ({stats['missing']} missing)")
+
+        missing_required = {col: stats['missing'] for col, stats in coverage.items()
+                            if stats['required'] and stats['missing']}
+        if missing_required:
+            self.logger.warning(f"   Missing required values: {missing_required}")
+
+    def _show_data_preview(self, mapped_data, total_rows: Optional[int] = None):
         """Show a preview of the mapped data."""
 
         self.logger.info(f"📊 Data Preview:")
-        self.logger.info(f"   Total rows: {len(mapped_data)}")
+        self.logger.info(f"   Total rows: {total_rows if total_rows is not None else len(mapped_data)}")
+        self.logger.info(f"   Preview rows: {len(mapped_data)}")
 
         if len(mapped_data) > 0:
             # Show first row as sample
@@ -159,5 +405,3 @@ class DocumentProcessor:
             self.logger.info(f"   Sample data:")
             for key, value in sample_row.items():
                 self.logger.info(f"     {key}: {value}")
-            for key, value in sample_row.items():
-                self.logger.info(f"     {key}: {value}")
@@ -1,18 +1,25 @@
 # File: src/templates/jinja_processor.py
 
+import io
 import logging
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set
 from docx import Document
 from jinja2 import Environment, Template, TemplateError
+from ..utils.stage_timer import StageTimer
 
 class JinjaProcessor:
     """Handles Jinja2 template processing with Word documents."""
     
-    def __init__(self):
+    def __init__(self, timer: Optional[StageTimer] = None):
         self.logger = logging.getLogger(__name__)
         self.jinja_env = Environment()
+        self.timer = timer or StageTimer(enabled=False)
+        
+        # Compiled paragraph templates and raw template file bytes, reused across documents
+        self._compiled: Dict[str, Template] = {}
+        self._template_bytes: Dict[Path, tuple] = {}
     
     def extract_template_variables(self, template_path: Path) -> Set[str]:
         """Extract all Jinja2 variables from a Word document template."""
@@ -41,6 +48,22 @@ class JinjaProcessor:
             self.logger.error(f"Failed to extract variables from template {template_path}: {str(e)}")
             raise
     
+    def validate_template(self, template_path: Path) -> Set[str]:
+        """Validate template file and extract variables."""
+        
+        if not template_path.exists():
+            raise FileNotFoundError(f"Template file not found: {template_path}")
+        
+        # Validate template syntax
+        variables = self.extract_template_variables(template_path)
+        
+        self.logger.info(f"✅ Template validation successful!")
+        self.logger.info(f"   Template: {template_path}")
+        self.logger.info(f"   Variables found: {len(variables)}")
+        self.logger.debug(f"   Variables: {variables}")
+        
+        return variables
+    
     def validate_template_syntax(self, template_path: Path) -> bool:
         """Validate Jinja2 syntax in the template."""
         
@@ -69,41 +92,43 @@ class JinjaProcessor:
         
         try:
             # Load the Word document
-            doc = Document(template_path)
-            
-            # Process all paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    original_text = paragraph.text
-                    rendered_text = self._render_text(original_text, data)
+            with self.timer.stage('template_load'):
+                doc = Document(io.BytesIO(self._load_template_bytes(template_path)))
+            
+            with self.timer.stage('render'):
+                # Process all paragraphs
+                for paragraph in doc.paragraphs:
+                    if paragraph.text.strip():
+                        original_text = paragraph.text
+                        rendered_text = self._render_text(original_text, data)
                     
-                    if original_text != rendered_text:
-                        # Clear the paragraph and add rendered text
-                        paragraph.clear()
-                        paragraph.add_run(rendered_text)
-            
-            # Process all tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        for paragraph in cell.paragraphs:
-                            if paragraph.text.strip():
-                                original_text = paragraph.text
-                                rendered_text = self._render_text(original_text, data)
+                        if original_text != rendered_text:
+                            # Clear the paragraph and add rendered text
+                            paragraph.clear()
+                            paragraph.add_run(rendered_text)
+            
+                # Process all tables
+                for table in doc.tables:
+                    for row in table.rows:
+                        for cell in row.cells:
+                            for paragraph in cell.paragraphs:
+                                if paragraph.text.strip():
+                                    original_text = paragraph.text
+                                    rendered_text = self._render_text(original_text, data)
                                 
-                                if original_text != rendered_text:
-                                    paragraph.clear()
-                                    paragraph.add_run(rendered_text)
-            
-            # Process headers and footers
-            for section in doc.sections:
-                # Headers
-                if section.header:
-                    self._process_header_footer(section.header, data)
+                                    if original_text != rendered_text:
+                                        paragraph.clear()
+                                        paragraph.add_run(rendered_text)
+            
+                # Process headers and footers
+                for section in doc.sections:
+                    # Headers
+                    if section.header:
+                        self._process_header_footer(section.header, data)
                 
-                # Footers
-                if section.footer:
-                    self._process_header_footer(section.footer, data)
+                    # Footers
+                    if section.footer:
+                        self._process_header_footer(section.footer, data)
             
             self.logger.debug(f"Template processed successfully: {template_path}")
             return doc
@@ -140,12 +165,31 @@ class JinjaProcessor:
         
         return '\n'.join(text_parts)
     
+    def _load_template_bytes(self, template_path: Path) -> bytes:
+        """Return the template file contents, re-reading only when the file changes."""
+        
+        mtime = template_path.stat().st_mtime
+        cached = self._template_bytes.get(template_path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, template_path.read_bytes())
+            self._template_bytes[template_path] = cached
+        return cached[1]
+    
+    def _compile(self, text: str) -> Template:
+        """Compile paragraph text once and reuse the template for later documents."""
+        
+        template = self._compiled.get(text)
+        if template is None:
+            template = self.jinja_env.from_string(text)
+            self._compiled[text] = template
+        return template
+    
     def _render_text(self, text: str, data: Dict[str, Any]) -> str:
         """Render text with Jinja2 template engine."""
         
         try:
             # Create Jinja2 template from text
-            template = self.jinja_env.from_string(text)
+            template = self._compile(text)
             
             # Render with data
             rendered = template.render(**data)
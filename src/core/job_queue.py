@@ -0,0 +1,227 @@
+# File: src/core/job_queue.py
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class JobQueue:
+    """
+    File-based job queue backed by SQLite.
+    Rows are enqueued once and claimed by any number of workers using leases,
+    so processes on one host (or hosts sharing a filesystem) can drain the
+    same queue. Expired leases are returned to the queue automatically.
+    """
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, db_path: str, lease_seconds: int = 300, max_attempts: int = 3):
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.logger = logging.getLogger(__name__)
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._create_schema()
+
+    @staticmethod
+    def default_worker_id() -> str:
+        """Build a worker id that is unique across hosts sharing the queue."""
+        return f"{socket.gethostname()}-{os.getpid()}"
+
+    @contextmanager
+    def _transaction(self):
+        """Open a connection and hold the write lock for the whole block."""
+
+        # Rollback journal (not WAL) so the database stays safe on network filesystems
+        conn = sqlite3.connect(str(self.db_path), timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            yield conn
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+    def _create_schema(self):
+        """Create the job and metadata tables if they don't exist."""
+
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    row_number INTEGER,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    worker TEXT,
+                    lease_expires REAL,
+                    result TEXT,
+                    error TEXT,
+                    updated_at REAL
+                )
+            """)
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, id)')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+
+    def enqueue(self, rows: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None,
+                reset: bool = False) -> int:
+        """Add mapped rows to the queue and return the number of jobs created."""
+
+        now = time.time()
+        with self._transaction() as conn:
+            if reset:
+                conn.execute('DELETE FROM jobs')
+                conn.execute('DELETE FROM meta')
+
+            for key, value in (metadata or {}).items():
+                conn.execute(
+                    'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                    (key, json.dumps(value, default=str))
+                )
+
+            conn.executemany(
+                'INSERT INTO jobs (row_number, payload, status, updated_at) VALUES (?, ?, ?, ?)',
+                [
+                    (row.get('_row_number'), json.dumps(row, default=str), self.PENDING, now)
+                    for row in rows
+                ]
+            )
+
+        self.logger.info(f"📥 Enqueued {len(rows)} jobs in {self.db_path}")
+        return len(rows)
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Return the run metadata stored by `enqueue`."""
+
+        with self._transaction() as conn:
+            rows = conn.execute('SELECT key, value FROM meta').fetchall()
+        return {row['key']: json.loads(row['value']) for row in rows}
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Claim the next pending job, re-queueing expired leases first."""
+
+        now = time.time()
+        with self._transaction() as conn:
+            self._requeue_expired(conn, now)
+
+            job = conn.execute(
+                'SELECT id, row_number, payload, attempts FROM jobs WHERE status = ? ORDER BY id LIMIT 1',
+                (self.PENDING,)
+            ).fetchone()
+            if job is None:
+                return None
+
+            conn.execute(
+                'UPDATE jobs SET status = ?, worker = ?, lease_expires = ?, attempts = attempts + 1, '
+                'updated_at = ? WHERE id = ?',
+                (self.RUNNING, worker_id, now + self.lease_seconds, now, job['id'])
+            )
+
+        return {
+            'id': job['id'],
+            'row_number': job['row_number'],
+            'attempt': job['attempts'] + 1,
+            'data': json.loads(job['payload'])
+        }
+
+    def renew_lease(self, job_id: int, worker_id: str) -> bool:
+        """Extend the lease on a running job. Returns False if the lease was lost."""
+
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                'UPDATE jobs SET lease_expires = ?, updated_at = ? WHERE id = ? AND worker = ? AND status = ?',
+                (now + self.lease_seconds, now, job_id, worker_id, self.RUNNING)
+            )
+        return cursor.rowcount == 1
+
+    @contextmanager
+    def keep_alive(self, job_id: int, worker_id: str):
+        """Renew the lease in the background while the job is being processed."""
+
+        stop = threading.Event()
+
+        def renew():
+            while not stop.wait(self.lease_seconds / 3):
+                try:
+                    if not self.renew_lease(job_id, worker_id):
+                        self.logger.warning(f"Lost lease on job {job_id}")
+                        return
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Lease renewal failed for job {job_id}: {e}")
+
+        thread = threading.Thread(target=renew, name=f"lease-{job_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def complete(self, job_id: int, worker_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
+        """Mark a claimed job as done."""
+
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                'UPDATE jobs SET status = ?, result = ?, error = NULL, lease_expires = NULL, updated_at = ? '
+                'WHERE id = ? AND worker = ? AND status = ?',
+                (self.DONE, json.dumps(result or {}, default=str), time.time(), job_id, worker_id, self.RUNNING)
+            )
+        if cursor.rowcount != 1:
+            self.logger.warning(f"Lease lost for job {job_id}; result from {worker_id} discarded")
+            return False
+        return True
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        """Record a failure; the job is retried until `max_attempts` is reached."""
+
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                'UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, '
+                'error = ?, worker = NULL, lease_expires = NULL, updated_at = ? '
+                'WHERE id = ? AND worker = ? AND status = ?',
+                (self.max_attempts, self.FAILED, self.PENDING, error, time.time(),
+                 job_id, worker_id, self.RUNNING)
+            )
+        return cursor.rowcount == 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of jobs in each status."""
+
+        counts = {self.PENDING: 0, self.RUNNING: 0, self.DONE: 0, self.FAILED: 0}
+        with self._transaction() as conn:
+            self._requeue_expired(conn, time.time())
+            for row in conn.execute('SELECT status, COUNT(*) AS n FROM jobs GROUP BY status'):
+                counts[row['status']] = row['n']
+        return counts
+
+    def _requeue_expired(self, conn: sqlite3.Connection, now: float):
+        """Return jobs whose lease expired to the queue (or fail them when out of attempts)."""
+
+        cursor = conn.execute(
+            'UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, '
+            'error = COALESCE(error, ?), worker = NULL, lease_expires = NULL, updated_at = ? '
+            'WHERE status = ? AND lease_expires < ?',
+            (self.max_attempts, self.FAILED, self.PENDING, 'lease expired', now, self.RUNNING, now)
+        )
+        if cursor.rowcount:
+            self.logger.warning(f"Re-queued {cursor.rowcount} jobs with expired leases")
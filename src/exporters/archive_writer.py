@@ -0,0 +1,134 @@
+# File: src/exporters/archive_writer.py
+
+import io
+import logging
+import re
+import tarfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_SIZE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*$', re.IGNORECASE)
+_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+
+def parse_size(value: str) -> int:
+    """Parse a size such as `500M` or `2G` into bytes."""
+
+    match = _SIZE.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid size '{value}' (expected e.g. 500M or 2G)")
+    return int(float(match.group(1)) * _UNITS[match.group(2).upper()])
+
+
+class ArchiveWriter:
+    """
+    Streams generated documents into a .zip, .tar or .tar.zst archive instead
+    of writing one file per document. With `volume_size` the archive rolls over
+    to numbered volumes (out.zip, out_002.zip, ...) once a volume reaches it.
+    """
+
+    FORMATS = ('.tar.zst', '.zip', '.tar')
+
+    def __init__(self, path: Path, volume_size: Optional[int] = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.volume_size = volume_size
+        self.format = self._detect_format(self.path)
+        if self.format == '.tar.zst' and zstandard is None:
+            raise ValueError("Writing .tar.zst archives requires the 'zstandard' package")
+
+        self.volumes: List[Path] = []
+        self.members = 0
+        self._raw = None
+        self._compressor = None
+        self._archive = None
+        self._volume_members = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _detect_format(cls, path: Path) -> str:
+        """Return the archive format from the file name."""
+
+        name = path.name.lower()
+        for suffix in cls.FORMATS:
+            if name.endswith(suffix):
+                return suffix
+        raise ValueError(f"Unsupported archive '{path.name}', use one of: {', '.join(cls.FORMATS)}")
+
+    def _volume_path(self, number: int) -> Path:
+        """Path of the n-th volume; the first volume uses the requested name."""
+
+        if number == 1:
+            return self.path
+        stem = self.path.name[:-len(self.format)]
+        return self.path.with_name(f"{stem}_{number:03d}{self.path.name[-len(self.format):]}")
+
+    def _open_volume(self):
+        """Start a new volume."""
+
+        path = self._volume_path(len(self.volumes) + 1)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._raw = open(path, 'wb')
+        if self.format == '.zip':
+            self._archive = zipfile.ZipFile(self._raw, 'w')
+        elif self.format == '.tar':
+            self._archive = tarfile.open(fileobj=self._raw, mode='w|')
+        else:
+            self._compressor = zstandard.ZstdCompressor().stream_writer(self._raw, closefd=False)
+            self._archive = tarfile.open(fileobj=self._compressor, mode='w|')
+        self.volumes.append(path)
+        self._volume_members = 0
+        self.logger.debug(f"Opened archive volume {path}")
+
+    def _close_volume(self):
+        """Finish the current volume."""
+
+        if self._archive is None:
+            return
+        self._archive.close()
+        if self._compressor is not None:
+            self._compressor.close()
+            self._compressor = None
+        self._raw.close()
+        self._archive = self._raw = None
+
+    def add(self, name: str, data: bytes):
+        """Add one member (a path relative to the archive root)."""
+
+        with self._lock:
+            if self._archive is None:
+                self._open_volume()
+            elif (self.volume_size and self._volume_members
+                  and self._raw.tell() + len(data) > self.volume_size):
+                self._close_volume()
+                self._open_volume()
+
+            if self.format == '.zip':
+                info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+                # .docx files are zip containers already; deflating them again only costs CPU
+                info.compress_type = zipfile.ZIP_STORED if name.endswith('.docx') else zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                self._archive.writestr(info, data)
+            else:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = int(time.time())
+                info.mode = 0o644
+                self._archive.addfile(info, io.BytesIO(data))
+
+            self._volume_members += 1
+            self.members += 1
+
+    def close(self):
+        """Finish the archive."""
+
+        with self._lock:
+            self._close_volume()
@@ -0,0 +1,292 @@
+# File: src/exporters/docx_pdf_renderer.py
+
+import logging
+import re
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Tuple, Union
+from xml.sax.saxutils import escape
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+from docx.table import Table as DocxTable
+from docx.text.paragraph import Paragraph as DocxParagraph
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+except ImportError:
+    colors = None
+
+# Ballot boxes in the templates → ZapfDingbats glyphs (❏ ✔ ✘); the standard fonts have no box characters
+CHECKBOXES = {'☐': 'o', '☑': '4', '☒': '8'}
+_CHECKBOX_SPLIT = re.compile(f"([{''.join(CHECKBOXES)}])")
+
+HEADING_SIZES = {'Title': 20, 'Heading 1': 16, 'Heading 2': 13, 'Heading 3': 11.5}
+BODY_SIZE = 10
+EMU_PER_POINT = 12700
+
+
+class DocxPdfRenderer:
+    """
+    In-process PDF renderer for a rendered python-docx Document, using reportlab.
+
+    Covers what the care-plan templates use: paragraphs with run formatting,
+    headings, bullet/numbered lists, tables (including horizontal merges),
+    page breaks, section margins, header/footer text and checkbox glyphs.
+    Images, text boxes and fields are not rendered.
+    """
+
+    def __init__(self):
+        if colors is None:
+            raise ImportError("The fast-lane PDF renderer requires the 'reportlab' package")
+        self.logger = logging.getLogger(__name__)
+        self._styles: Dict[Tuple[Any, ...], 'ParagraphStyle'] = {}
+
+    def render(self, document, output: Union[str, Path, BinaryIO]):
+        """Render a python-docx Document to a PDF file path or binary stream."""
+
+        section = document.sections[0]
+        page_size = (section.page_width.pt, section.page_height.pt) if section.page_width else A4
+        margins = {
+            'leftMargin': self._length(section.left_margin, 72),
+            'rightMargin': self._length(section.right_margin, 72),
+            'topMargin': self._length(section.top_margin, 72),
+            'bottomMargin': self._length(section.bottom_margin, 72),
+        }
+
+        template = SimpleDocTemplate(str(output) if isinstance(output, Path) else output,
+                                     pagesize=page_size, title=document.core_properties.title or '', **margins)
+        story = self._story(document, template.width)
+
+        header = self._plain_lines(section.header) if not section.header.is_linked_to_previous else []
+        footer = self._plain_lines(section.footer) if not section.footer.is_linked_to_previous else []
+
+        def draw_page(canvas, doc):
+            canvas.saveState()
+            canvas.setFont('Helvetica', 8)
+            header_y = page_size[1] - margins['topMargin'] / 2
+            for offset, (text, alignment) in enumerate(header):
+                self._draw_line(canvas, text, alignment, header_y - offset * 10, margins, page_size[0])
+            footer_y = margins['bottomMargin'] / 2 + (len(footer) - 1) * 10
+            for offset, (text, alignment) in enumerate(footer):
+                self._draw_line(canvas, text, alignment, footer_y - offset * 10, margins, page_size[0])
+            canvas.restoreState()
+
+        template.build(story, onFirstPage=draw_page, onLaterPages=draw_page)
+
+    @staticmethod
+    def _length(value, default: float) -> float:
+        """Convert a python-docx Length to points."""
+
+        return value.pt if value is not None else default
+
+    def _story(self, document, width: float) -> List[Any]:
+        """Flowables for the document body in order."""
+
+        story = []
+        numbering = {}
+        body = document._body
+        for child in document.element.body.iterchildren():
+            if child.tag == qn('w:p'):
+                story.extend(self._paragraph(DocxParagraph(child, body), numbering))
+            elif child.tag == qn('w:tbl'):
+                table = DocxTable(child, body)
+                if not table.rows:
+                    continue
+                story.append(self._table(table, width))
+                story.append(Spacer(1, 6))
+                numbering.clear()
+        return story
+
+    def _paragraph(self, paragraph, numbering: Dict[str, int], in_table: bool = False) -> List[Any]:
+        """Flowables for one paragraph: the paragraph itself and any page break."""
+
+        flowables = []
+        style_name = paragraph.style.name if paragraph.style is not None else 'Normal'
+        markup = ''.join(self._run_markup(run) for run in paragraph.runs)
+        page_break = not in_table and any(
+            br.get(qn('w:type')) == 'page' for br in paragraph._p.iter(qn('w:br'))
+        )
+
+        if not markup.strip():
+            if not in_table:
+                flowables.append(Spacer(1, BODY_SIZE * 0.8))
+        else:
+            style = self._paragraph_style(paragraph, style_name, in_table)
+            bullet = None
+            if style_name.startswith('List Bullet'):
+                bullet = '•'
+            elif style_name.startswith('List Number'):
+                numbering[style_name] = numbering.get(style_name, 0) + 1
+                bullet = f"{numbering[style_name]}."
+            flowables.append(Paragraph(markup, style, bulletText=bullet))
+
+        if page_break:
+            flowables.append(PageBreak())
+        return flowables
+
+    def _paragraph_style(self, paragraph, style_name: str, in_table: bool) -> 'ParagraphStyle':
+        """reportlab style for a paragraph, cached per style name and direct formatting."""
+
+        fmt = paragraph.paragraph_format
+        key = (style_name, paragraph.alignment, fmt.space_before, fmt.space_after, fmt.left_indent, in_table)
+        style = self._styles.get(key)
+        if style is not None:
+            return style
+
+        heading = style_name in HEADING_SIZES
+        size = HEADING_SIZES.get(style_name, BODY_SIZE)
+        style_font = paragraph.style.font if paragraph.style is not None else None
+        if style_font is not None and style_font.size is not None:
+            size = style_font.size.pt
+        bold = heading or bool(style_font is not None and style_font.bold)
+
+        alignment = {
+            WD_ALIGN_PARAGRAPH.CENTER: TA_CENTER,
+            WD_ALIGN_PARAGRAPH.RIGHT: TA_RIGHT,
+            WD_ALIGN_PARAGRAPH.JUSTIFY: TA_JUSTIFY,
+        }.get(paragraph.alignment, TA_LEFT)
+
+        is_list = style_name.startswith(('List Bullet', 'List Number'))
+        style = ParagraphStyle(
+            name=f"{style_name}-{len(self._styles)}",
+            fontName='Helvetica-Bold' if bold else 'Helvetica',
+            fontSize=size,
+            leading=size * 1.25,
+            alignment=alignment,
+            spaceBefore=self._length(fmt.space_before, 8 if heading else 0),
+            spaceAfter=self._length(fmt.space_after, 2 if in_table else (4 if heading else 6)),
+            leftIndent=self._length(fmt.left_indent, 14 if is_list else 0),
+            bulletIndent=4 if is_list else 0,
+            keepWithNext=heading,
+        )
+        self._styles[key] = style
+        return style
+
+    def _run_markup(self, run) -> str:
+        """reportlab paragraph markup for one run."""
+
+        text = run.text
+        if not text:
+            return ''
+
+        font = run.font
+        attributes = []
+        if font.size is not None:
+            attributes.append(f'size="{font.size.pt:g}"')
+        if font.color is not None and font.color.type is not None and font.color.rgb is not None:
+            attributes.append(f'color="#{font.color.rgb}"')
+
+        pieces = []
+        for chunk in _CHECKBOX_SPLIT.split(text):
+            if not chunk:
+                continue
+            if chunk in CHECKBOXES:
+                # Kept outside <b>/<i>: ZapfDingbats has no bold or italic variants
+                pieces.append(f'<font name="ZapfDingbats">{CHECKBOXES[chunk]}</font>')
+                continue
+            markup = escape(self._encodable(chunk)).replace('\t', '&nbsp;' * 4).replace('\n', '<br/>')
+            if run.bold:
+                markup = f'<b>{markup}</b>'
+            if run.italic:
+                markup = f'<i>{markup}</i>'
+            if run.underline:
+                markup = f'<u>{markup}</u>'
+            if font.strike:
+                markup = f'<strike>{markup}</strike>'
+            if attributes:
+                markup = f'<font {" ".join(attributes)}>{markup}</font>'
+            pieces.append(markup)
+        return ''.join(pieces)
+
+    @staticmethod
+    def _encodable(text: str) -> str:
+        """Replace characters the standard PDF fonts (WinAnsi) cannot show."""
+
+        return text.encode('cp1252', 'replace').decode('cp1252')
+
+    def _table(self, table, width: float) -> 'Table':
+        """reportlab Table for a docx table."""
+
+        data = []
+        commands = [
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 4),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+        ]
+
+        previous_row = []
+        for r, row in enumerate(table.rows):
+            cells = row.cells
+            data_row = []
+            c = 0
+            while c < len(cells):
+                end = c
+                # Horizontally merged cells share one <w:tc>
+                while end + 1 < len(cells) and cells[end + 1]._tc is cells[c]._tc:
+                    end += 1
+                if c < len(previous_row) and previous_row[c] is cells[c]._tc:
+                    # Continuation of a vertical merge; the content is in the row above
+                    data_row.append('')
+                else:
+                    data_row.append(self._cell(cells[c]))
+                data_row.extend([''] * (end - c))
+                if end > c:
+                    commands.append(('SPAN', (c, r), (end, r)))
+                c = end + 1
+            previous_row = [cell._tc for cell in cells]
+            data.append(data_row)
+
+        return Table(data, colWidths=self._column_widths(table, width), style=TableStyle(commands),
+                     repeatRows=0, hAlign='LEFT')
+
+    def _cell(self, cell) -> List[Any]:
+        """Flowables for one table cell."""
+
+        flowables = []
+        numbering = {}
+        for paragraph in cell.paragraphs:
+            flowables.extend(self._paragraph(paragraph, numbering, in_table=True))
+        # A table cell needs flowables, not strings, once other cells hold flowables
+        return flowables or [Spacer(1, 0)]
+
+    @staticmethod
+    def _column_widths(table, width: float) -> List[float]:
+        """Column widths in points, scaled down to fit the frame."""
+
+        columns = len(table.columns)
+        try:
+            widths = [column.width / EMU_PER_POINT if column.width else None for column in table.columns]
+        except (AttributeError, IndexError):
+            widths = [None] * columns
+
+        if None in widths or not widths:
+            return [width / columns] * columns
+        total = sum(widths)
+        scale = min(1.0, width / total) if total else 1.0
+        return [w * scale for w in widths]
+
+    def _plain_lines(self, part) -> List[Tuple[str, Any]]:
+        """Header/footer paragraphs as (text, alignment) lines."""
+
+        lines = []
+        for paragraph in part.paragraphs:
+            text = self._encodable(paragraph.text.strip())
+            if text:
+                lines.append((text, paragraph.alignment))
+        return lines
+
+    @staticmethod
+    def _draw_line(canvas, text: str, alignment, y: float, margins: Dict[str, float], page_width: float):
+        """Draw one header/footer line honouring its alignment."""
+
+        if alignment == WD_ALIGN_PARAGRAPH.CENTER:
+            canvas.drawCentredString(page_width / 2, y, text)
+        elif alignment == WD_ALIGN_PARAGRAPH.RIGHT:
+            canvas.drawRightString(page_width - margins['rightMargin'], y, text)
+        else:
+            canvas.drawString(margins['leftMargin'], y, text)
@@ -1,44 +1,617 @@
 # File: src/exporters/headless_pdf_exporter.py
 
+import io
+import itertools
+import json
 import logging
+import os
+import signal
 import subprocess
 import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from collections import Counter
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set, Tuple
+
+from ..utils.memory_profiler import max_rss_bytes
+from ..utils.stage_timer import StageTimer
+from .pdf_cache import PdfCache, converter_key, docx_digest
+from .pdf_optimizer import PdfOptimizer
+from .pdf_scheduler import AdaptiveTimeout, PdfScheduler
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Initial per-document allowance for soffice batches, until batch durations have been observed
+BATCH_DOCUMENT_TIMEOUT = 20.0
+
+# SelectPdfVersion values that produce PDF/A (1 = PDF/A-1b, 2 = PDF/A-2b, 3 = PDF/A-3b)
+PDFA_VERSIONS = (1, 2, 3)
+
+
+def parse_export_format(export_format: str) -> Tuple[str, Dict[str, Any]]:
+    """Split "pdf:<filter>[:Key=Value,...]" into the filter name and typed filter options."""
+    
+    parts = export_format.split(':', 2)
+    filter_name = parts[1] if len(parts) > 1 and parts[1] else 'writer_pdf_Export'
+    options: Dict[str, Any] = {}
+    for item in (parts[2].split(',') if len(parts) > 2 else []):
+        key, _, value = item.partition('=')
+        if not key.strip():
+            continue
+        value = value.strip()
+        if value.lower() in ('true', 'false'):
+            options[key.strip()] = value.lower() == 'true'
+        else:
+            try:
+                options[key.strip()] = int(value)
+            except ValueError:
+                options[key.strip()] = value
+    return filter_name, options
+
 
 class HeadlessPdfExporter:
     """Headless PDF export using multiple conversion tools without GUI dependencies."""
     
-    def __init__(self, app_config: Dict[str, Any]):
+    # Converter (`_try_<name>`) in order of preference → check_available_converters key
+    CONVERTERS = {
+        'libreoffice_pool': 'libreoffice',
+        'libreoffice': 'libreoffice',
+        'pandoc': 'pandoc',
+        'docx2pdf': 'docx2pdf',
+        'unoconv': 'unoconv',
+        'python_docx2pdf': 'python-docx + reportlab'
+    }
+    
+    def __init__(self, app_config: Dict[str, Any], timer: Optional[StageTimer] = None):
         self.app_config = app_config
         self.logger = logging.getLogger(__name__)
+        self.timer = timer or StageTimer(enabled=False)
+        self._scratch_dir: Optional[Path] = None
+        
+        # Persistent soffice listeners (pdf.pool_size > 0), started on first use
+        self.pdf_config = app_config.get('pdf', {})
+        self.pool_size = int(self.pdf_config.get('pool_size', 0) or 0)
+        self._pool = None
+        self.batch_size = int(self.pdf_config.get('batch_size', 0) or 0)
+        
+        # Converter probing happens once; the first converter that works is pinned
+        self._available: Optional[List[str]] = None
+        self._pinned: Optional[str] = None
+        self.stats = {'converted': Counter(), 'failed': Counter(), 'fallbacks': Counter(), 'unconverted': 0}
+        # Child-process accounting per converter (wall, user/sys CPU, peak RSS), see _run_converter
+        self.usage: Dict[str, Dict[str, float]] = {}
+        
+        # Concurrent conversions (pdf.concurrency > 1) go through the async scheduler
+        self.concurrency = int(self.pdf_config.get('concurrency', 1) or 1)
+        self.retries = int(self.pdf_config.get('retries', 2))
+        self.retry_backoff = float(self.pdf_config.get('retry_backoff', 1.0))
+        self.initial_timeout = float(self.pdf_config.get('timeout', 120))
+        self._timeouts: Dict[str, AdaptiveTimeout] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # LibreOffice profile slots in use; a conversion takes the lowest free one (see _profile)
+        self._profile_slots: Set[int] = set()
+        self._cancel_warm_up = threading.Event()
+        
+        # In-process reportlab rendering from the Document object (pdf.fast_lane)
+        self.fast_lane = bool(self.pdf_config.get('fast_lane', False))
+        self._renderer = None
+        
+        # Content-addressed cache of converted PDFs (pdf.cache_dir), shared across runs
+        self.cache: Optional[PdfCache] = None
+        if self.pdf_config.get('cache_dir'):
+            from .archive_writer import parse_size
+            self.cache = PdfCache(Path(self.pdf_config['cache_dir']),
+                                  parse_size(self.pdf_config.get('cache_max_size', '2G')))
+        
+        # Export filter and options (e.g. SelectPdfVersion=1 for PDF/A-1b) from pdf.export_format
+        self.filter_name, self.filter_options = parse_export_format(
+            self.pdf_config.get('export_format', 'pdf:writer_pdf_Export'))
+        
+        # Post-conversion size optimization (pdf.optimize); rewriting a PDF/A file breaks its conformance
+        self.optimizer: Optional[PdfOptimizer] = None
+        optimize_config = self.pdf_config.get('optimize') or {}
+        if optimize_config.get('enabled'):
+            if self.filter_options.get('SelectPdfVersion') in PDFA_VERSIONS:
+                self.logger.warning("PDF optimization is disabled for PDF/A output (pdf.export_format)")
+            else:
+                self.optimizer = PdfOptimizer.from_config(optimize_config)
+        
+        if self.fast_lane:
+            self._check_fast_lane()
+    
+    def _check_fast_lane(self):
+        """Warn about (or disable fast lane for) settings the in-process renderer cannot honour."""
+        
+        if self.filter_options:
+            # reportlab writes plain PDF; PDF/A and other filter options need a real converter
+            self.logger.warning(f"pdf.fast_lane is disabled: it cannot apply the pdf.export_format options "
+                                f"{self.filter_options}")
+            self.fast_lane = False
+            return
+        ignored = [name for name, value in (('pdf.cache_dir', self.cache is not None),
+                                            ('pdf.concurrency', self.concurrency > 1),
+                                            ('pdf.batch_size', self.batch_size > 0)) if value]
+        if ignored:
+            self.logger.warning(f"pdf.fast_lane renders inline and ignores {', '.join(ignored)} "
+                                f"except for documents that fall back to the converters")
+    
+    def convert_bytes(self, docx_bytes: bytes, name: str) -> Optional[bytes]:
+        """Convert an in-memory DOCX to PDF bytes.
+        
+        The converters are command-line tools that need a file, so the document
+        goes through a scratch directory on tmpfs (/dev/shm) when available
+        rather than a round-trip through the output directory.
+        """
+        
+        work_dir = self._work_dir()
+        try:
+            docx_path = work_dir / name
+            docx_path.write_bytes(docx_bytes)
+            pdf_path = self.convert_to_pdf(docx_path)
+            return pdf_path.read_bytes() if pdf_path else None
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    @property
+    def queue_size(self) -> int:
+        """How many documents callers should collect for convert_many (0 = convert inline)."""
+        
+        if self.fast_lane:
+            return 0
+        if self.concurrency > 1:
+            return self.batch_size or self.concurrency * 4
+        if self.batch_size > 0 and self.pool_size == 0:
+            return self.batch_size
+        return 0
+    
+    def convert_many(self, documents: List[Tuple[bytes, str]]) -> List[Optional[bytes]]:
+        """Convert collected documents concurrently, or as one soffice batch."""
+        
+        if self.concurrency > 1:
+            scheduler = PdfScheduler(self.convert_bytes, self.concurrency, self.retries, self.retry_backoff)
+            results = scheduler.run(documents)
+            if scheduler.retried:
+                self.logger.info(f"PDF scheduler retried {scheduler.retried} conversion(s), {scheduler.failed} failed")
+            return results
+        return self.convert_batch(documents)
+    
+    def convert_batch(self, documents: List[Tuple[bytes, str]]) -> List[Optional[bytes]]:
+        """Convert many in-memory DOCX files with a single soffice invocation.
+        
+        Returns PDF bytes (or None) in input order. Documents LibreOffice did not
+        convert are retried one by one through the normal converter chain.
+        """
+        
+        work_dir = self._work_dir()
+        try:
+            docx_paths = []
+            for index, (docx_bytes, name) in enumerate(documents):
+                # Prefixed so equal names from different output directories don't collide
+                docx_path = work_dir / f"{index:05d}_{name}"
+                docx_path.write_bytes(docx_bytes)
+                docx_paths.append(docx_path)
+            
+            # Cached documents never reach soffice; a batch renders like the libreoffice converter
+            digests = [self._cache_digest(path) for path in docx_paths]
+            keys = [digest and converter_key(digest, 'libreoffice') for digest in digests]
+            pending = [path for path, key in zip(docx_paths, keys)
+                       if not (key and self.cache.get(key, path.with_suffix('.pdf')))]
+            
+            binary = shutil.which('soffice') or shutil.which('libreoffice')
+            if binary and pending:
+                with self.timer.stage('pdf:libreoffice_batch'), self._profile() as profile_arg:
+                    cmd = [binary, '--headless', profile_arg, '--convert-to', self._convert_to_arg(),
+                           '--outdir', str(work_dir)]
+                    cmd += [str(path) for path in pending]
+                    try:
+                        start = time.perf_counter()
+                        result = self._run_converter(cmd, self._batch_timeout(len(pending)),
+                                                     converter='libreoffice_batch')
+                        if result.returncode != 0:
+                            self.logger.warning(f"LibreOffice batch exited with {result.returncode}: {result.stderr}")
+                        else:
+                            # Per-document duration, so the allowance adapts to this machine
+                            self._timeout('libreoffice_batch').record((time.perf_counter() - start) / len(pending))
+                    except Exception as e:
+                        self.logger.warning(f"LibreOffice batch of {len(pending)} documents failed: {e}")
+            
+            results = []
+            retried = 0
+            for docx_path, key in zip(docx_paths, keys):
+                pdf_path = docx_path.with_suffix('.pdf')
+                if not pdf_path.exists():
+                    retried += 1
+                    pdf_path = self.convert_to_pdf(docx_path)
+                elif key and docx_path in pending:
+                    self.cache.put(key, pdf_path)
+                results.append(pdf_path.read_bytes() if pdf_path else None)
+            
+            self.logger.debug(f"Converted batch of {len(docx_paths)} documents ({retried} retried individually)")
+            return results
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def _work_dir(self) -> Path:
+        """Fresh working directory inside the run's scratch directory (tmpfs when available)."""
+        
+        with self._lock:
+            if self._scratch_dir is None:
+                shm = '/dev/shm' if os.path.isdir('/dev/shm') else None
+                self._scratch_dir = Path(tempfile.mkdtemp(prefix='docugen_', dir=shm))
+        return Path(tempfile.mkdtemp(dir=self._scratch_dir))
+    
+    @contextmanager
+    def _profile(self):
+        """Check out a LibreOffice profile (as the -env:UserInstallation argument) for one soffice run.
+        
+        Concurrent runs must not share a profile lock, but profiles are slow to
+        create, so they are keyed by slot rather than thread: at most
+        `concurrency` profiles exist and every scheduler flush reuses them.
+        """
+        
+        if self._scratch_dir is None:
+            self._work_dir().rmdir()
+        with self._lock:
+            slot = next(index for index in itertools.count() if index not in self._profile_slots)
+            self._profile_slots.add(slot)
+        try:
+            profile = self._scratch_dir / f"lo_profile_{slot}"
+            yield f"-env:UserInstallation={profile.as_uri()}"
+        finally:
+            with self._lock:
+                self._profile_slots.discard(slot)
+    
+    def _convert_to_arg(self) -> str:
+        """soffice --convert-to value; filter options are passed as LibreOffice's JSON filter data."""
+        
+        if not self.filter_options:
+            return 'pdf' if self.filter_name == 'writer_pdf_Export' else f"pdf:{self.filter_name}"
+        filter_data = {}
+        for key, value in self.filter_options.items():
+            if isinstance(value, bool):
+                filter_data[key] = {'type': 'boolean', 'value': str(value).lower()}
+            elif isinstance(value, int):
+                filter_data[key] = {'type': 'long', 'value': str(value)}
+            else:
+                filter_data[key] = {'type': 'string', 'value': value}
+        return f"pdf:{self.filter_name}:{json.dumps(filter_data, separators=(',', ':'))}"
+    
+    def optimize(self, pdf_bytes: bytes, name: str) -> bytes:
+        """Run the size optimizer over converted PDF bytes (no-op unless pdf.optimize.enabled)."""
+        
+        if self.optimizer is None:
+            return pdf_bytes
+        with self.timer.stage('pdf_optimize'):
+            return self.optimizer.optimize(pdf_bytes, name)
+    
+    def _timeout(self, name: str) -> AdaptiveTimeout:
+        """Adaptive timeout tracker for a converter (per document for 'libreoffice_batch')."""
+        
+        with self._lock:
+            if name not in self._timeouts:
+                if name == 'libreoffice_batch':
+                    self._timeouts[name] = AdaptiveTimeout(initial=BATCH_DOCUMENT_TIMEOUT, minimum=2.0)
+                else:
+                    self._timeouts[name] = AdaptiveTimeout(initial=self.initial_timeout)
+            return self._timeouts[name]
+    
+    def _batch_timeout(self, documents: int) -> float:
+        """Timeout for one soffice batch: a per-document allowance, capped so a hung batch can't stall the run."""
+        
+        tracker = self._timeout('libreoffice_batch')
+        ceiling = max(self.initial_timeout, tracker.maximum)
+        return min(ceiling, max(self.initial_timeout, tracker.current() * documents))
+    
+    def timeout_for(self, name: str) -> float:
+        """Current adaptive timeout for a converter."""
+        
+        return self._timeout(name).current()
+    
+    def _run_converter(self, cmd: List[str], timeout: Optional[float] = None,
+                       converter: Optional[str] = None,
+                       cancel: Optional[threading.Event] = None) -> subprocess.CompletedProcess:
+        """Run a converter in its own process group, kill the whole group if it hangs (or
+        `cancel` is set), and record the process's wall time, user/sys CPU and peak RSS
+        under the converter's name."""
+        
+        converter = converter or getattr(self._local, 'converter', None) or Path(cmd[0]).name
+        if timeout is None:
+            timeout = self.timeout_for(converter)
+        if not hasattr(os, 'wait4'):
+            # Without wait4 (Windows) a cancelled run still ends at its timeout
+            return self._run_converter_portable(cmd, timeout, converter)
+        
+        # Output goes to files rather than pipes: the process is reaped with wait4 (for its
+        # rusage) instead of communicate(), so nothing would drain a full pipe
+        with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+            start = time.perf_counter()
+            process = subprocess.Popen(cmd, stdout=stdout, stderr=stderr,
+                                       start_new_session=hasattr(os, 'killpg'))
+            deadline = start + timeout
+            delay = 0.005
+            timed_out = cancelled = False
+            while True:
+                pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+                if pid:
+                    break
+                cancelled = cancel is not None and cancel.is_set()
+                if cancelled or time.perf_counter() >= deadline:
+                    timed_out = not cancelled
+                    self._kill_group(process)
+                    pid, status, usage = os.wait4(process.pid, 0)
+                    break
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+            
+            process.returncode = self._exit_code(status)
+            self._record_usage(converter, time.perf_counter() - start, usage.ru_utime, usage.ru_stime,
+                               max_rss_bytes(usage))
+            if timed_out:
+                raise Exception(f"{cmd[0]} timed out after {timeout:.0f}s and was killed")
+            if cancelled:
+                raise Exception(f"{cmd[0]} was cancelled")
+            
+            stdout.seek(0)
+            stderr.seek(0)
+            return subprocess.CompletedProcess(cmd, process.returncode,
+                                               stdout.read().decode('utf-8', 'replace'),
+                                               stderr.read().decode('utf-8', 'replace'))
+    
+    def _run_converter_portable(self, cmd: List[str], timeout: float, converter: str) -> subprocess.CompletedProcess:
+        """_run_converter without wait4: CPU and peak RSS come from RUSAGE_CHILDREN deltas."""
+        
+        # Deltas include any other child reaped meanwhile, so they are approximate under concurrency
+        before = resource.getrusage(resource.RUSAGE_CHILDREN) if resource else None
+        start = time.perf_counter()
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                   start_new_session=hasattr(os, 'killpg'))
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._kill_group(process)
+            process.communicate()
+            raise Exception(f"{cmd[0]} timed out after {timeout:.0f}s and was killed")
+        finally:
+            wall = time.perf_counter() - start
+            if before is not None:
+                after = resource.getrusage(resource.RUSAGE_CHILDREN)
+                self._record_usage(converter, wall, after.ru_utime - before.ru_utime,
+                                   after.ru_stime - before.ru_stime, max_rss_bytes(after))
+            else:
+                self._record_usage(converter, wall, 0.0, 0.0, 0)
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+    
+    @staticmethod
+    def _exit_code(status: int) -> int:
+        """Popen-style return code from a wait status (os.waitstatus_to_exitcode needs Python 3.9)."""
+        
+        if os.WIFSIGNALED(status):
+            return -os.WTERMSIG(status)
+        return os.WEXITSTATUS(status)
+    
+    @staticmethod
+    def _kill_group(process: subprocess.Popen):
+        """Kill a converter with all its helpers."""
+        
+        # soffice forks helpers; killing only the parent leaves them holding the profile lock
+        if hasattr(os, 'killpg'):
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+                return
+            except OSError:
+                pass
+        process.kill()
+    
+    def _record_usage(self, converter: str, wall: float, cpu_user: float, cpu_sys: float, max_rss: int):
+        """Add one converter process to the per-converter totals and the stage timings."""
+        
+        with self._lock:
+            usage = self.usage.setdefault(converter, {
+                'runs': 0, 'wall': 0.0, 'cpu_user': 0.0, 'cpu_sys': 0.0, 'max_rss': 0
+            })
+            usage['runs'] += 1
+            usage['wall'] += wall
+            usage['cpu_user'] += cpu_user
+            usage['cpu_sys'] += cpu_sys
+            usage['max_rss'] = max(usage['max_rss'], max_rss)
+        self.timer.record_process(f"proc:{converter}", wall, cpu_user, cpu_sys, max_rss)
+    
+    def format_usage(self) -> str:
+        """Per-converter child-process totals: wall, CPU and peak RSS."""
+        
+        lines = ["Converter processes:"]
+        for converter, usage in sorted(self.usage.items(), key=lambda item: item[1]['wall'], reverse=True):
+            cpu = usage['cpu_user'] + usage['cpu_sys']
+            ratio = cpu / usage['wall'] if usage['wall'] else 0.0
+            lines.append(
+                f"   {converter}: {usage['runs']} runs, wall {usage['wall']:.1f}s, "
+                f"CPU {cpu:.1f}s (user {usage['cpu_user']:.1f}, sys {usage['cpu_sys']:.1f}, {ratio:.0%} of wall), "
+                f"peak RSS {usage['max_rss'] / 1024 / 1024:.0f} MB"
+            )
+        return '\n'.join(lines)
+    
+    def close(self):
+        """Stop the converter pool and remove the scratch directory used by convert_bytes."""
+        
+        if self.stats['converted'] or self.stats['unconverted'] or (self.cache and self.cache.hits):
+            self.logger.info(self.format_stats())
+        if self.usage:
+            self.logger.info(self.format_usage())
+        if self.optimizer is not None and self.optimizer.documents:
+            self.logger.info(self.optimizer.format_report())
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        if self._scratch_dir is not None:
+            shutil.rmtree(self._scratch_dir, ignore_errors=True)
+            self._scratch_dir = None
+    
+    @property
+    def pool(self):
+        """LibreOffice listener pool, created on first use."""
+        
+        if self._pool is None:
+            from .libreoffice_pool import LibreOfficePool
+            self._pool = LibreOfficePool(
+                size=self.pool_size,
+                max_conversions=int(self.pdf_config.get('pool_max_conversions', 200)),
+                timeout=float(self.pdf_config.get('pool_timeout', 120)),
+                base_port=int(self.pdf_config.get('pool_base_port', 2002)),
+                filter_name=self.filter_name,
+                filter_data=self.filter_options
+            )
+        return self._pool
+    
+    def warm_up(self):
+        """Get the preferred converter ready before the first document.
+        
+        Probes the converters, then starts the UNO pool, creates the first
+        LibreOffice profile slot (the one a lone conversion uses), or loads the
+        reportlab renderer. Safe to run on a background thread; see cancel_warm_up.
+        """
+        
+        start = time.perf_counter()
+        converter = None
+        try:
+            with self.timer.stage('pdf_warm_up'):
+                if self.fast_lane:
+                    converter = 'fast_lane'
+                    self.renderer
+                else:
+                    names = self.available_converters()
+                    converter = self._pinned or (names[0] if names else None)
+                    if converter == 'libreoffice_pool':
+                        self.pool.start()
+                    elif converter == 'libreoffice':
+                        # First start with a fresh profile is the slow part; later runs reuse the profile
+                        with self._profile() as profile_arg:
+                            cmd = ['libreoffice', '--headless', profile_arg, '--terminate_after_init']
+                            self._run_converter(cmd, converter='libreoffice_warm_up', cancel=self._cancel_warm_up)
+                    elif converter == 'python_docx2pdf':
+                        self.renderer
+        except Exception as e:
+            # Best effort: the first conversion starts the converter the normal way
+            self.logger.warning(f"PDF converter warm-up failed: {e}")
+            return
+        
+        if converter:
+            self.logger.info(f"🔥 PDF converter {converter} warmed up in {time.perf_counter() - start:.1f}s")
+    
+    def cancel_warm_up(self):
+        """Stop a running warm-up's soffice start (e.g. when the run fails before converting)."""
+        
+        self._cancel_warm_up.set()
     
     def convert_to_pdf(self, docx_path: Path) -> Optional[Path]:
-        """Convert DOCX to PDF using available headless tools."""
+        """Convert DOCX to PDF using available headless tools.
+        
+        The pinned converter (the first one that worked) is tried first; the
+        other available converters are only tried when it fails on a document.
+        """
         
         pdf_path = docx_path.with_suffix('.pdf')
         
-        # Try conversion methods in order of preference
-        converters = [
-            self._try_libreoffice,
-            self._try_pandoc,
-            self._try_docx2pdf,
-            self._try_unoconv,
-            self._try_python_docx2pdf
-        ]
+        names = self.available_converters()
+        if self._pinned in names:
+            names = [self._pinned] + [name for name in names if name != self._pinned]
         
-        for converter in converters:
+        # Only a PDF from the converter that would run first is reused; fallback output is cached under its own key
+        digest = self._cache_digest(docx_path)
+        if digest and names and self.cache.get(converter_key(digest, names[0]), pdf_path):
+            self.logger.debug(f"PDF cache hit for {docx_path}")
+            return pdf_path
+        
+        for attempt, name in enumerate(names):
+            self._local.converter = name
             try:
-                if converter(docx_path, pdf_path):
-                    self.logger.info(f"Successfully converted {docx_path} to PDF using {converter.__name__}")
+                start = time.perf_counter()
+                with self.timer.stage(f"pdf:{name}"):
+                    converted = getattr(self, f"_try_{name}")(docx_path, pdf_path)
+                if converted:
+                    self._timeout(name).record(time.perf_counter() - start)
+                    if digest:
+                        self.cache.put(converter_key(digest, name), pdf_path)
+                    self.logger.debug(f"Converted {docx_path} to PDF using {name}")
+                    with self._lock:
+                        self.stats['converted'][name] += 1
+                        if attempt:
+                            self.stats['fallbacks'][name] += 1
+                        if self._pinned is None:
+                            self._pinned = name
+                            self.logger.info(f"📌 Using {name} for PDF conversion")
                     return pdf_path
             except Exception as e:
-                self.logger.debug(f"{converter.__name__} failed: {e}")
-                continue
+                self.logger.debug(f"{name} failed: {e}")
+            with self._lock:
+                self.stats['failed'][name] += 1
         
+        with self._lock:
+            self.stats['unconverted'] += 1
         self.logger.error(f"All PDF conversion methods failed for {docx_path}")
         return None
     
+    def _cache_digest(self, docx_path: Path) -> Optional[str]:
+        """Content digest of a document, or None when caching is off or the file isn't a valid .docx.
+        
+        Cache keys combine it with the converter (see converter_key).
+        """
+        
+        if self.cache is None:
+            return None
+        try:
+            # The export filter is part of the key, so changing it never serves stale PDFs
+            return docx_digest(docx_path.read_bytes(), salt=self.pdf_config.get('export_format', ''))
+        except (OSError, zipfile.BadZipFile) as e:
+            self.logger.debug(f"Not caching {docx_path}: {e}")
+            return None
+    
+    def available_converters(self) -> List[str]:
+        """Converters in preference order that are installed, probed once per exporter."""
+        
+        with self._lock:
+            if self._available is None:
+                self._available = self._probe_converters()
+        return self._available
+    
+    def _probe_converters(self) -> List[str]:
+        """Check which converters are installed, in preference order."""
+        
+        availability = self.check_available_converters()
+        available = []
+        for name, requirement in self.CONVERTERS.items():
+            if name == 'libreoffice_pool':
+                from .libreoffice_pool import uno
+                installed = self.pool_size > 0 and uno is not None and availability['libreoffice']
+            else:
+                installed = availability.get(requirement, False)
+            if installed:
+                available.append(name)
+        self.logger.info(f"PDF converters available: {', '.join(available) or 'none'}")
+        return available
+    
+    def format_stats(self) -> str:
+        """One-line summary of conversions per converter and fallbacks."""
+        
+        parts = [f"{name} {count}" for name, count in self.stats['converted'].most_common()]
+        fallbacks = sum(self.stats['fallbacks'].values())
+        summary = f"PDF conversions: {', '.join(parts) or 'none'}"
+        if fallbacks:
+            summary += f" (fallbacks: {fallbacks}, " + ', '.join(
+                f"{name} failed {count}x" for name, count in self.stats['failed'].most_common()) + ")"
+        if self.stats['unconverted']:
+            summary += f", not converted: {self.stats['unconverted']}"
+        if self.cache is not None:
+            summary += f", cache hits: {self.cache.hits}/{self.cache.hits + self.cache.misses}"
+        return summary
+    
     def _try_pandoc(self, docx_path: Path, pdf_path: Path) -> bool:
         """Convert using pandoc (requires pandoc + LaTeX)."""
         
@@ -53,28 +626,37 @@ class HeadlessPdfExporter:
             '--variable', 'geometry:margin=1in'
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        result = self._run_converter(cmd)
         
         if result.returncode == 0 and pdf_path.exists():
             return True
         else:
             raise Exception(f"pandoc failed: {result.stderr}")
     
+    def _try_libreoffice_pool(self, docx_path: Path, pdf_path: Path) -> bool:
+        """Convert on a persistent soffice listener over UNO."""
+        
+        if self.pool.convert(docx_path, pdf_path):
+            return True
+        raise Exception("LibreOffice pool did not produce a PDF")
+    
     def _try_libreoffice(self, docx_path: Path, pdf_path: Path) -> bool:
         """Convert using LibreOffice headless mode."""
         
         if not shutil.which('libreoffice'):
             raise Exception("libreoffice not found in PATH")
         
-        cmd = [
-            'libreoffice',
-            '--headless',
-            '--convert-to', 'pdf',
-            '--outdir', str(pdf_path.parent),
-            str(docx_path)
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        with self._profile() as profile_arg:
+            cmd = [
+                'libreoffice',
+                '--headless',
+                profile_arg,
+                '--convert-to', self._convert_to_arg(),
+                '--outdir', str(pdf_path.parent),
+                str(docx_path)
+            ]
+            
+            result = self._run_converter(cmd)
         
         if result.returncode == 0 and pdf_path.exists():
             return True
@@ -105,11 +687,13 @@ class HeadlessPdfExporter:
         cmd = [
             'unoconv',
             '-f', 'pdf',
-            '-o', str(pdf_path),
-            str(docx_path)
+            '-o', str(pdf_path)
         ]
+        for key, value in self.filter_options.items():
+            cmd += ['-e', f"{key}={str(value).lower() if isinstance(value, bool) else value}"]
+        cmd.append(str(docx_path))
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        result = self._run_converter(cmd)
         
         if result.returncode == 0 and pdf_path.exists():
             return True
@@ -117,39 +701,50 @@ class HeadlessPdfExporter:
             raise Exception(f"unoconv failed: {result.stderr}")
     
     def _try_python_docx2pdf(self, docx_path: Path, pdf_path: Path) -> bool:
-        """Convert using python-docx + reportlab (pure Python solution)."""
+        """Convert in-process using python-docx + reportlab (no subprocess)."""
         
         try:
             from docx import Document
-            from reportlab.lib.pagesizes import letter
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-            from reportlab.lib.styles import getSampleStyleSheet
-            
-            # Read DOCX content
-            doc = Document(str(docx_path))
-            
-            # Create PDF
-            pdf_doc = SimpleDocTemplate(str(pdf_path), pagesize=letter)
-            styles = getSampleStyleSheet()
-            story = []
-            
-            # Convert paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    para = Paragraph(paragraph.text, styles['Normal'])
-                    story.append(para)
-                    story.append(Spacer(1, 12))
-            
-            # Build PDF
-            pdf_doc.build(story)
-            
-            if pdf_path.exists():
-                return True
-            else:
-                raise Exception("PDF file was not created")
-                
+            self.renderer.render(Document(str(docx_path)), pdf_path)
         except ImportError as e:
             raise Exception(f"Required packages not installed: {e}")
+        
+        if pdf_path.exists():
+            return True
+        else:
+            raise Exception("PDF file was not created")
+    
+    @property
+    def renderer(self):
+        """Fast-lane reportlab renderer, created on first use (keeps its style cache)."""
+        
+        if self._renderer is None:
+            from .docx_pdf_renderer import DocxPdfRenderer
+            self._renderer = DocxPdfRenderer()
+        return self._renderer
+    
+    def render_document(self, document) -> bytes:
+        """Render an in-memory python-docx Document straight to PDF bytes."""
+        
+        buffer = io.BytesIO()
+        with self.timer.stage('pdf:fast_lane'):
+            self.renderer.render(document, buffer)
+        return buffer.getvalue()
+    
+    def convert_document(self, document, docx_bytes: bytes, name: str) -> Optional[bytes]:
+        """PDF for a freshly rendered document: fast lane when enabled, else the converters."""
+        
+        if self.fast_lane:
+            try:
+                pdf_bytes = self.render_document(document)
+                with self._lock:
+                    self.stats['converted']['fast_lane'] += 1
+                return pdf_bytes
+            except Exception as e:
+                self.logger.warning(f"Fast-lane PDF render failed for {name}, using converters: {e}")
+                with self._lock:
+                    self.stats['failed']['fast_lane'] += 1
+        return self.convert_bytes(docx_bytes, name)
     
     def check_available_converters(self) -> Dict[str, bool]:
         """Check which conversion tools are available on the system."""
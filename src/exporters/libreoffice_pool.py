@@ -0,0 +1,258 @@
+# File: src/exporters/libreoffice_pool.py
+
+import logging
+import os
+import queue
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import uno
+except ImportError:
+    uno = None
+
+
+def _props(**values):
+    """Build a tuple of UNO PropertyValue structs."""
+
+    props = []
+    for name, value in values.items():
+        prop = uno.createUnoStruct('com.sun.star.beans.PropertyValue')
+        prop.Name = name
+        prop.Value = value
+        props.append(prop)
+    return tuple(props)
+
+
+class SofficeInstance:
+    """One headless soffice listener with its own user profile, driven over a UNO socket."""
+
+    def __init__(self, binary: str, port: int, profile_dir: Path):
+        self.binary = binary
+        self.port = port
+        self.profile_dir = profile_dir
+        self.logger = logging.getLogger(__name__)
+        self.process: Optional[subprocess.Popen] = None
+        self.desktop = None
+        self.conversions = 0
+
+    def start(self, connect_timeout: float = 30.0):
+        """Launch soffice and connect to it."""
+
+        cmd = [
+            self.binary,
+            '--headless', '--invisible', '--nologo', '--norestore', '--nodefault', '--nolockcheck',
+            f'-env:UserInstallation={self.profile_dir.resolve().as_uri()}',
+            f'--accept=socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext'
+        ]
+        # Own process group so a hung instance can be killed with all its children
+        self.process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                        start_new_session=True)
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext('com.sun.star.bridge.UnoUrlResolver', local)
+        url = f'uno:socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext'
+
+        deadline = time.monotonic() + connect_timeout
+        while True:
+            try:
+                context = resolver.resolve(url)
+                break
+            except Exception:
+                if self.process.poll() is not None:
+                    raise Exception(f"soffice on port {self.port} exited with code {self.process.returncode}")
+                if time.monotonic() > deadline:
+                    self.kill()
+                    raise Exception(f"soffice on port {self.port} did not accept connections within {connect_timeout}s")
+                time.sleep(0.2)
+
+        self.desktop = context.ServiceManager.createInstanceWithContext('com.sun.star.frame.Desktop', context)
+        self.conversions = 0
+        self.logger.debug(f"soffice listener started on port {self.port} (pid {self.process.pid})")
+
+    def healthy(self) -> bool:
+        """Check that the process is alive and still answers over UNO."""
+
+        if self.process is None or self.process.poll() is not None or self.desktop is None:
+            return False
+        try:
+            self.desktop.getCurrentFrame()
+            return True
+        except Exception:
+            return False
+
+    def convert(self, docx_path: Path, pdf_path: Path, filter_name: str = 'writer_pdf_Export',
+                filter_data: Optional[Dict[str, Any]] = None):
+        """Load a document and store it as PDF, with optional export filter options."""
+
+        document = self.desktop.loadComponentFromURL(
+            Path(docx_path).resolve().as_uri(), '_blank', 0, _props(Hidden=True, ReadOnly=True)
+        )
+        if document is None:
+            raise Exception(f"soffice could not open {docx_path}")
+        try:
+            properties = _props(FilterName=filter_name)
+            if filter_data:
+                # A sequence-typed property value has to be wrapped in uno.Any and passed via uno.invoke
+                properties += _props(FilterData=uno.Any('[]com.sun.star.beans.PropertyValue', _props(**filter_data)))
+                uno.invoke(document, 'storeToURL', (Path(pdf_path).resolve().as_uri(), properties))
+            else:
+                document.storeToURL(Path(pdf_path).resolve().as_uri(), properties)
+        finally:
+            document.close(True)
+        self.conversions += 1
+
+    def kill(self):
+        """Kill the soffice process group without waiting for UNO."""
+
+        self.desktop = None
+        if self.process is not None and self.process.poll() is None:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                self.process.kill()
+            self.process.wait()
+
+    def stop(self):
+        """Ask soffice to terminate, killing it if it does not exit."""
+
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            self.desktop = None
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.kill()
+
+
+class LibreOfficePool:
+    """
+    Pool of long-lived soffice listeners, so each conversion only pays for
+    the load/export instead of a 2-5 second LibreOffice start.
+
+    Instances are recycled after `max_conversions` documents, and restarted
+    when they fail a health check or a conversion exceeds `timeout`.
+    """
+
+    def __init__(self, size: int = 2, max_conversions: int = 200, timeout: float = 120.0,
+                 base_port: int = 2002, filter_name: str = 'writer_pdf_Export', binary: Optional[str] = None,
+                 filter_data: Optional[Dict[str, Any]] = None):
+        self.logger = logging.getLogger(__name__)
+        if uno is None:
+            raise Exception("The LibreOffice pool requires the 'uno' Python bridge (python3-uno)")
+
+        self.binary = binary or shutil.which('soffice') or shutil.which('libreoffice')
+        if not self.binary:
+            raise Exception("soffice not found in PATH")
+
+        self.size = max(1, size)
+        self.max_conversions = max_conversions
+        self.timeout = timeout
+        self.base_port = base_port
+        self.filter_name = filter_name
+        self.filter_data = filter_data or {}
+        self.restarts = 0
+
+        self._base_dir = Path(tempfile.mkdtemp(prefix='docugen_lo_'))
+        self._instances: List[SofficeInstance] = []
+        self._idle: 'queue.Queue[SofficeInstance]' = queue.Queue()
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        """Start all listeners (idempotent)."""
+
+        with self._start_lock:
+            if self._started:
+                return
+            for index in range(self.size):
+                instance = SofficeInstance(self.binary, self.base_port + index, self._base_dir / f'profile_{index}')
+                try:
+                    instance.start()
+                except Exception:
+                    # Don't leave the listeners started so far (or this one) running; a later start() retries all
+                    instance.kill()
+                    for started in self._instances:
+                        started.stop()
+                    self._instances = []
+                    self._idle = queue.Queue()
+                    raise
+                self._instances.append(instance)
+                self._idle.put(instance)
+            self._started = True
+            self.logger.info(f"🖨️  Started {self.size} LibreOffice listener(s) on ports "
+                             f"{self.base_port}-{self.base_port + self.size - 1}")
+
+    def convert(self, docx_path: Path, pdf_path: Path) -> bool:
+        """Convert one document on the next idle instance."""
+
+        self.start()
+        instance = self._idle.get()
+        try:
+            if not instance.healthy():
+                self.logger.warning(f"soffice on port {instance.port} failed its health check, restarting")
+                self._restart(instance)
+
+            self._convert_with_timeout(instance, docx_path, pdf_path)
+
+            if instance.conversions >= self.max_conversions:
+                self.logger.debug(f"Recycling soffice on port {instance.port} after {instance.conversions} conversions")
+                self._restart(instance, graceful=True)
+            return Path(pdf_path).exists()
+        except Exception:
+            if not instance.healthy():
+                self._restart(instance)
+            raise
+        finally:
+            self._idle.put(instance)
+
+    def _convert_with_timeout(self, instance: SofficeInstance, docx_path: Path, pdf_path: Path):
+        """Run a conversion, killing the instance if it hangs."""
+
+        outcome = {}
+
+        def target():
+            try:
+                instance.convert(docx_path, pdf_path, self.filter_name, self.filter_data)
+            except Exception as e:
+                outcome['error'] = e
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(self.timeout)
+        if thread.is_alive():
+            instance.kill()
+            raise Exception(f"soffice on port {instance.port} hung for more than {self.timeout}s on {docx_path}")
+        if 'error' in outcome:
+            raise outcome['error']
+
+    def _restart(self, instance: SofficeInstance, graceful: bool = False):
+        """Replace a listener's process, keeping its port and profile."""
+
+        if graceful:
+            instance.stop()
+        else:
+            instance.kill()
+        self.restarts += 1
+        instance.start()
+
+    def close(self):
+        """Stop all listeners and remove their profiles."""
+
+        with self._start_lock:
+            for instance in self._instances:
+                instance.stop()
+            self._instances = []
+            self._idle = queue.Queue()
+            self._started = False
+        shutil.rmtree(self._base_dir, ignore_errors=True)
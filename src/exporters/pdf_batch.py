@@ -0,0 +1,120 @@
+# File: src/exporters/pdf_batch.py
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from tqdm import tqdm
+
+from .headless_pdf_exporter import HeadlessPdfExporter
+
+
+class PdfBatchConverter:
+    """
+    Converts existing .docx files to PDF outside of `process`, e.g. after a
+    `--no-pdf` run or failed conversions. Each PDF is written next to its
+    .docx; documents whose PDF is newer than the .docx are skipped.
+    """
+
+    def __init__(self, exporter: HeadlessPdfExporter, force: bool = False):
+        self.exporter = exporter
+        self.force = force
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def collect(source: Path) -> List[Path]:
+        """The .docx files in a directory (recursively) or listed in a .txt/.json manifest."""
+
+        source = Path(source)
+        if source.is_dir():
+            # Skip Word lock files (~$name.docx)
+            return sorted(path for path in source.rglob('*.docx') if not path.name.startswith('~$'))
+        if not source.exists():
+            raise ValueError(f"Source not found: {source}")
+
+        if source.suffix.lower() == '.json':
+            entries = json.loads(source.read_text(encoding='utf-8'))
+            if isinstance(entries, dict):
+                entries = entries.get('documents', [])
+            names = [entry['docx'] if isinstance(entry, dict) else entry for entry in entries]
+        elif source.suffix.lower() == '.txt':
+            lines = source.read_text(encoding='utf-8').splitlines()
+            names = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
+        else:
+            raise ValueError(f"Unsupported manifest {source.name} (use a directory, .txt or .json)")
+
+        # Relative manifest entries are relative to the manifest itself
+        return [path if path.is_absolute() else source.parent / path for path in map(Path, names)]
+
+    def is_up_to_date(self, docx_path: Path) -> bool:
+        """True when the document's PDF exists and is not older than the .docx."""
+
+        pdf_path = docx_path.with_suffix('.pdf')
+        return (not self.force and pdf_path.exists()
+                and pdf_path.stat().st_mtime >= docx_path.stat().st_mtime)
+
+    def run(self, documents: List[Path]) -> Dict[str, Any]:
+        """Convert every stale document; returns counts, failures and throughput."""
+
+        start = time.perf_counter()
+        missing = [path for path in documents if not path.exists()]
+        for path in missing:
+            self.logger.error(f"Missing document: {path}")
+        existing = [path for path in documents if path.exists()]
+        pending = [path for path in existing if not self.is_up_to_date(path)]
+        summary = {
+            'total': len(documents),
+            'skipped': len(existing) - len(pending),
+            'converted': 0,
+            'failed': list(missing),
+        }
+
+        # Queue as many documents as the exporter's scheduler/batch wants; 0 means one at a time
+        chunk_size = self.exporter.queue_size or 1
+        with tqdm(total=len(pending), desc="Converting to PDF") as pbar:
+            for offset in range(0, len(pending), chunk_size):
+                chunk = pending[offset:offset + chunk_size]
+                for docx_path, pdf_bytes in zip(chunk, self._convert(chunk)):
+                    if pdf_bytes is None:
+                        summary['failed'].append(docx_path)
+                    else:
+                        pdf_path = docx_path.with_suffix('.pdf')
+                        pdf_path.write_bytes(self.exporter.optimize(pdf_bytes, pdf_path.name))
+                        summary['converted'] += 1
+                    pbar.update(1)
+
+        summary['seconds'] = time.perf_counter() - start
+        return summary
+
+    def _convert(self, chunk: List[Path]) -> List[Optional[bytes]]:
+        """PDF bytes (or None) for each document in the chunk."""
+
+        if len(chunk) == 1:
+            try:
+                return [self.exporter.convert_bytes(chunk[0].read_bytes(), chunk[0].name)]
+            except Exception as e:
+                self.logger.error(f"Error converting {chunk[0]}: {e}")
+                return [None]
+        try:
+            return self.exporter.convert_many([(path.read_bytes(), path.name) for path in chunk])
+        except Exception as e:
+            self.logger.error(f"Error converting batch of {len(chunk)} documents: {e}")
+            return [None] * len(chunk)
+
+    @staticmethod
+    def format_summary(summary: Dict[str, Any]) -> str:
+        """Human-readable run summary with throughput."""
+
+        seconds = summary['seconds']
+        rate = summary['converted'] / seconds if seconds else 0.0
+        lines = [
+            f"Documents: {summary['total']}",
+            f"   Converted: {summary['converted']}",
+            f"   Skipped (up to date): {summary['skipped']}",
+            f"   Failed: {len(summary['failed'])}",
+            f"   Time: {seconds:.1f}s ({rate:.2f} docs/sec)",
+        ]
+        lines += [f"   ❌ {path}" for path in summary['failed']]
+        return '\n'.join(lines)
@@ -0,0 +1,194 @@
+# File: src/exporters/pdf_benchmark.py
+
+import copy
+import itertools
+import logging
+import multiprocessing
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..utils.memory_profiler import max_rss_bytes
+from ..utils.stage_timer import StageTimer
+from .headless_pdf_exporter import HeadlessPdfExporter
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _cpu_seconds(usage) -> float:
+    """User + system CPU seconds of a getrusage() result."""
+
+    return usage.ru_utime + usage.ru_stime
+
+
+def measure_converter(app_config: Dict[str, Any], name: str, concurrency: int, samples: List[str],
+                      documents: int) -> Dict[str, Any]:
+    """
+    Benchmark one converter at one concurrency level. Runs in a fresh process
+    (see PdfBenchmark) so CPU and peak RSS of reaped children belong to this
+    converter alone.
+    """
+
+    config = copy.deepcopy(app_config)
+    pdf_config = config.setdefault('pdf', {})
+    # Measure the converter itself: no cache hits and no post-processing
+    pdf_config['cache_dir'] = ''
+    pdf_config['optimize'] = {}
+    if name == 'libreoffice_pool':
+        pdf_config['pool_size'] = concurrency
+
+    exporter = HeadlessPdfExporter(config)
+    convert = getattr(exporter, f"_try_{name}")
+    work_dir = exporter._work_dir()
+    counter = itertools.count()
+    counter_lock = threading.Lock()
+
+    def convert_one(source: str) -> Optional[float]:
+        exporter._local.converter = name
+        with counter_lock:
+            index = next(counter)
+        target_dir = work_dir / f"{index:05d}"
+        target_dir.mkdir()
+        docx_path = target_dir / Path(source).name
+        shutil.copyfile(source, docx_path)
+        start = time.perf_counter()
+        try:
+            if convert(docx_path, docx_path.with_suffix('.pdf')):
+                return time.perf_counter() - start
+        except Exception as e:
+            exporter.logger.debug(f"{name} failed on {source}: {e}")
+        finally:
+            shutil.rmtree(target_dir, ignore_errors=True)
+        return None
+
+    try:
+        # Cold start (first soffice launch, profile creation, imports) is reported on its own
+        cold_start = convert_one(samples[0])
+        if cold_start is None:
+            return {'converter': name, 'concurrency': concurrency, 'error': 'warm-up conversion failed'}
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Concurrent warm-ups so every LibreOffice profile slot exists before timing
+            barrier = threading.Barrier(concurrency)
+
+            def warm_up(source: str):
+                barrier.wait()
+                return convert_one(source)
+
+            list(executor.map(warm_up, [samples[0]] * concurrency))
+
+            self_before = resource.getrusage(resource.RUSAGE_SELF) if resource else None
+            children_before = resource.getrusage(resource.RUSAGE_CHILDREN) if resource else None
+            start = time.perf_counter()
+            batch = [samples[index % len(samples)] for index in range(documents)]
+            latencies = list(executor.map(convert_one, batch))
+            wall = time.perf_counter() - start
+    finally:
+        # Stops pool listeners, so their CPU time is included in RUSAGE_CHILDREN below
+        exporter.close()
+
+    succeeded = sorted(latency for latency in latencies if latency is not None)
+    result = {
+        'converter': name,
+        'concurrency': concurrency,
+        'documents': documents,
+        'failed': documents - len(succeeded),
+        'cold_start_s': cold_start,
+        'wall_s': wall,
+        'docs_per_sec': len(succeeded) / wall if wall else 0.0,
+        'p50_s': StageTimer._percentile(succeeded, 50) if succeeded else None,
+        'p95_s': StageTimer._percentile(succeeded, 95) if succeeded else None,
+    }
+    if resource is not None:
+        self_after = resource.getrusage(resource.RUSAGE_SELF)
+        children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu = (_cpu_seconds(self_after) - _cpu_seconds(self_before)
+               + _cpu_seconds(children_after) - _cpu_seconds(children_before))
+        result['cpu_s'] = cpu
+        result['cpu_per_doc_s'] = cpu / documents
+        result['cores_used'] = cpu / wall if wall else 0.0
+        # Largest single process: this Python process or any converter child
+        result['peak_rss_mb'] = max(max_rss_bytes(self_after), max_rss_bytes(children_after)) / 1024 / 1024
+    return result
+
+
+class PdfBenchmark:
+    """
+    Benchmarks each available converter of HeadlessPdfExporter at several
+    concurrency levels over sample .docx files: docs/sec, p50/p95 latency,
+    CPU time and peak RSS. Every (converter, concurrency) cell runs in its own
+    process so resource usage does not leak between cells.
+    """
+
+    def __init__(self, app_config: Dict[str, Any], samples: Sequence[Path],
+                 concurrency_levels: Sequence[int] = (1, 2, 4), documents: int = 20,
+                 converters: Optional[Sequence[str]] = None):
+        if not samples:
+            raise ValueError("No sample documents to benchmark")
+
+        self.app_config = app_config
+        self.samples = [str(Path(sample).resolve()) for sample in samples]
+        self.concurrency_levels = sorted(set(concurrency_levels))
+        self.documents = documents
+        self.logger = logging.getLogger(__name__)
+        self.converters = list(converters) if converters else self.available_converters()
+
+    def available_converters(self) -> List[str]:
+        """Installed converters, including the UNO pool whenever the bridge is available."""
+
+        config = copy.deepcopy(self.app_config)
+        config.setdefault('pdf', {})['pool_size'] = max(1, int(config['pdf'].get('pool_size', 0) or 0))
+        exporter = HeadlessPdfExporter(config)
+        try:
+            return exporter.available_converters()
+        finally:
+            exporter.close()
+
+    def run(self) -> List[Dict[str, Any]]:
+        """Run every cell; returns one result dict per converter and concurrency level."""
+
+        results = []
+        context = multiprocessing.get_context('spawn')
+        for name in self.converters:
+            for concurrency in self.concurrency_levels:
+                self.logger.info(f"⏱️  {name} x{concurrency} on {self.documents} documents")
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    future = executor.submit(measure_converter, self.app_config, name, concurrency,
+                                             self.samples, self.documents)
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        results.append({'converter': name, 'concurrency': concurrency, 'error': str(e)})
+        return results
+
+    @staticmethod
+    def format_table(results: List[Dict[str, Any]]) -> str:
+        """Results as a fixed-width table."""
+
+        def ms(value: Optional[float]) -> str:
+            return f"{value * 1000:.0f}" if value is not None else '-'
+
+        lines = [
+            f"{'Converter':<20} {'conc':>4} {'docs/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'cold ms':>8} "
+            f"{'CPU s/doc':>9} {'cores':>6} {'peak MB':>8} {'failed':>6}",
+            '-' * 94,
+        ]
+        for result in results:
+            if 'error' in result:
+                lines.append(f"{result['converter']:<20} {result['concurrency']:>4} ❌ {result['error']}")
+                continue
+            cpu = f"{result['cpu_per_doc_s']:.2f}" if 'cpu_s' in result else '-'
+            cores = f"{result['cores_used']:.2f}" if 'cpu_s' in result else '-'
+            peak = f"{result['peak_rss_mb']:.0f}" if 'peak_rss_mb' in result else '-'
+            lines.append(
+                f"{result['converter']:<20} {result['concurrency']:>4} {result['docs_per_sec']:>8.2f} "
+                f"{ms(result['p50_s']):>8} {ms(result['p95_s']):>8} {ms(result['cold_start_s']):>8} "
+                f"{cpu:>9} {cores:>6} {peak:>8} {result['failed']:>6}"
+            )
+        return '\n'.join(lines)
@@ -0,0 +1,125 @@
+# File: src/exporters/pdf_cache.py
+
+import hashlib
+import io
+import logging
+import os
+import shutil
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Tuple
+
+# Parts that change on every save without changing the rendered document
+VOLATILE_PARTS = ('docProps/core.xml', 'docProps/app.xml')
+
+
+def docx_digest(docx_bytes: bytes, salt: str = '') -> str:
+    """Content hash of a .docx that ignores zip timestamps and document properties."""
+
+    digest = hashlib.sha256(salt.encode('utf-8'))
+    with zipfile.ZipFile(io.BytesIO(docx_bytes)) as archive:
+        for name in sorted(archive.namelist()):
+            if name in VOLATILE_PARTS:
+                continue
+            digest.update(name.encode('utf-8') + b'\0')
+            digest.update(archive.read(name))
+    return digest.hexdigest()
+
+
+def converter_key(digest: str, converter: str) -> str:
+    """Cache key for a document digest as rendered by one converter; converters differ in output."""
+
+    return hashlib.sha256(f"{converter}:{digest}".encode('utf-8')).hexdigest()
+
+
+class PdfCache:
+    """
+    Content-addressed PDF store: normalized .docx hash → PDF.
+    Entries are kept under `<directory>/<aa>/<hash>.pdf` and evicted least
+    recently used first once the cache grows past `max_bytes`.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries: Dict[str, Tuple[int, float]] = {}
+        self._total = 0
+        for entry in self.directory.glob('*/*.pdf'):
+            stat = entry.stat()
+            self._entries[entry.stem] = (stat.st_size, stat.st_mtime)
+            self._total += stat.st_size
+
+    def _path(self, key: str) -> Path:
+        """Storage path for a key."""
+
+        return self.directory / key[:2] / f"{key}.pdf"
+
+    def get(self, key: str, pdf_path: Path) -> bool:
+        """Copy the cached PDF to pdf_path; False on a miss."""
+
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return False
+            cached = self._path(key)
+            now = time.time()
+            self._entries[key] = (self._entries[key][0], now)
+
+        try:
+            shutil.copyfile(cached, pdf_path)
+            os.utime(cached, (now, now))
+        except OSError as e:
+            self.logger.debug(f"PDF cache entry {key} unusable: {e}")
+            with self._lock:
+                self._forget(key)
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def put(self, key: str, pdf_path: Path):
+        """Store a converted PDF and evict old entries beyond the size limit."""
+
+        cached = self._path(key)
+        cached.parent.mkdir(exist_ok=True)
+        temp = cached.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        shutil.copyfile(pdf_path, temp)
+        os.replace(temp, cached)
+
+        size = cached.stat().st_size
+        with self._lock:
+            if key in self._entries:
+                self._total -= self._entries[key][0]
+            self._entries[key] = (size, time.time())
+            self._total += size
+            self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits (lock held)."""
+
+        if self._total <= self.max_bytes:
+            return
+        for key, _ in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if self._total <= self.max_bytes:
+                break
+            self._forget(key)
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def _forget(self, key: str):
+        """Drop a key from the in-memory index (lock held)."""
+
+        size, _ = self._entries.pop(key, (0, 0))
+        self._total -= size
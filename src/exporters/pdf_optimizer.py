@@ -0,0 +1,119 @@
+# File: src/exporters/pdf_optimizer.py
+
+import io
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:
+    PdfReader = PdfWriter = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+class PdfOptimizer:
+    """
+    Post-conversion PDF size optimization with pypdf: image downsampling
+    (Pillow), content stream compression and identical-object deduplication.
+
+    Images are only downsampled when they exceed `max_image_dpi` even if
+    stretched across the whole page, and images with transparency are left
+    alone. The optimized PDF is only used when it is actually smaller.
+    """
+
+    def __init__(self, max_image_dpi: int = 150, jpeg_quality: int = 80, compress_streams: bool = True,
+                 dedupe_objects: bool = True):
+        if PdfWriter is None:
+            raise ValueError("PDF optimization requires the 'pypdf' package (pip install pypdf)")
+
+        self.max_image_dpi = max_image_dpi
+        self.jpeg_quality = jpeg_quality
+        self.compress_streams = compress_streams
+        self.dedupe_objects = dedupe_objects
+        self.logger = logging.getLogger(__name__)
+        if max_image_dpi and Image is None:
+            self.logger.warning("Pillow is not installed; PDF images will not be downsampled")
+
+        self.documents = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'PdfOptimizer':
+        """Build from the `pdf.optimize` config section."""
+
+        return cls(max_image_dpi=int(config.get('max_image_dpi', 150) or 0),
+                   jpeg_quality=int(config.get('jpeg_quality', 80)),
+                   compress_streams=config.get('compress_streams', True),
+                   dedupe_objects=config.get('dedupe_objects', True))
+
+    def optimize(self, pdf_bytes: bytes, name: str = '') -> bytes:
+        """Return an optimized copy of a PDF, or the original when that is not smaller."""
+
+        start = time.perf_counter()
+        try:
+            writer = PdfWriter(clone_from=PdfReader(io.BytesIO(pdf_bytes)))
+
+            if self.max_image_dpi and Image is not None:
+                for page in writer.pages:
+                    self._downsample_images(page)
+
+            if self.compress_streams:
+                for page in writer.pages:
+                    page.compress_content_streams()
+
+            if self.dedupe_objects and hasattr(writer, 'compress_identical_objects'):
+                writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+
+            buffer = io.BytesIO()
+            writer.write(buffer)
+            optimized = buffer.getvalue()
+        except Exception as e:
+            self.logger.warning(f"PDF optimization failed for {name or 'document'}: {e}")
+            optimized = pdf_bytes
+
+        result = optimized if len(optimized) < len(pdf_bytes) else pdf_bytes
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.documents += 1
+            self.bytes_in += len(pdf_bytes)
+            self.bytes_out += len(result)
+            self.seconds += elapsed
+        self.logger.debug(f"Optimized {name}: {len(pdf_bytes)} → {len(result)} bytes in {elapsed * 1000:.0f} ms")
+        return result
+
+    def _downsample_images(self, page):
+        """Downsample images larger than max_image_dpi at full-page size."""
+
+        limit = max(float(page.mediabox.width), float(page.mediabox.height)) / 72 * self.max_image_dpi
+        for image in page.images:
+            try:
+                picture = image.image
+                if picture is None or max(picture.size) <= limit or picture.mode not in ('RGB', 'L', 'CMYK'):
+                    continue
+                scale = limit / max(picture.size)
+                resized = picture.resize((max(1, int(picture.width * scale)), max(1, int(picture.height * scale))),
+                                         Image.LANCZOS)
+                image.replace(resized, quality=self.jpeg_quality)
+            except Exception as e:
+                self.logger.debug(f"Skipping image {getattr(image, 'name', '?')}: {e}")
+
+    def format_report(self) -> str:
+        """Size savings and throughput over all optimized documents."""
+
+        if not self.documents:
+            return "PDF optimization: no documents"
+        saved = self.bytes_in - self.bytes_out
+        ratio = saved / self.bytes_in if self.bytes_in else 0.0
+        rate = self.documents / self.seconds if self.seconds else 0.0
+        return (f"PDF optimization: {self.documents} documents, {self.bytes_in / 1024:.0f} KB → "
+                f"{self.bytes_out / 1024:.0f} KB (saved {ratio:.1%}, "
+                f"avg {saved / self.documents / 1024:.1f} KB/doc), {rate:.1f} docs/sec")
@@ -0,0 +1,110 @@
+# File: src/exporters/pdf_scheduler.py
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+
+class AdaptiveTimeout:
+    """
+    Per-converter timeout that follows observed durations: `factor` x p95 of
+    the last `window` conversions, clamped to [minimum, maximum]. Until
+    `min_samples` conversions have been seen the initial timeout is used.
+    """
+
+    def __init__(self, initial: float = 120.0, minimum: float = 30.0, maximum: float = 600.0,
+                 factor: float = 3.0, min_samples: int = 20, window: int = 200):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self.min_samples = min_samples
+        self._durations = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """Record the duration of a successful conversion."""
+
+        with self._lock:
+            self._durations.append(seconds)
+
+    def p95(self) -> Optional[float]:
+        """95th percentile of the recent durations, or None without enough samples."""
+
+        with self._lock:
+            if len(self._durations) < self.min_samples:
+                return None
+            ordered = sorted(self._durations)
+        return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+
+    def current(self) -> float:
+        """Timeout to use for the next conversion."""
+
+        p95 = self.p95()
+        if p95 is None:
+            return self.initial
+        return max(self.minimum, min(self.maximum, p95 * self.factor))
+
+
+class PdfScheduler:
+    """
+    Runs blocking PDF conversions from an asyncio loop on a bounded thread pool.
+
+    Each document gets up to `retries` extra attempts with exponential backoff.
+    Hung converters are killed by the exporter (per-process-group timeouts),
+    so a stuck document costs one slot for one timeout, not the whole run.
+    """
+
+    def __init__(self, convert: Callable[[bytes, str], Optional[bytes]], concurrency: int = 4,
+                 retries: int = 2, backoff: float = 1.0):
+        self.convert = convert
+        self.concurrency = max(1, concurrency)
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.logger = logging.getLogger(__name__)
+        self.retried = 0
+        self.failed = 0
+
+    def run(self, documents: List[Tuple[bytes, str]]) -> List[Optional[bytes]]:
+        """Convert (docx bytes, name) pairs; returns PDF bytes or None in input order."""
+
+        if not documents:
+            return []
+        return asyncio.run(self._run_all(documents))
+
+    async def _run_all(self, documents: List[Tuple[bytes, str]]) -> List[Optional[bytes]]:
+        """Schedule all conversions and wait for them."""
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='pdf') as executor:
+            return await asyncio.gather(*[
+                self._convert_one(loop, executor, semaphore, docx_bytes, name)
+                for docx_bytes, name in documents
+            ])
+
+    async def _convert_one(self, loop, executor, semaphore, docx_bytes: bytes, name: str) -> Optional[bytes]:
+        """Convert one document, retrying with backoff."""
+
+        for attempt in range(self.retries + 1):
+            async with semaphore:
+                try:
+                    pdf_bytes = await loop.run_in_executor(executor, self.convert, docx_bytes, name)
+                except Exception as e:
+                    self.logger.debug(f"Conversion of {name} raised: {e}")
+                    pdf_bytes = None
+
+            if pdf_bytes is not None:
+                return pdf_bytes
+            if attempt < self.retries:
+                self.retried += 1
+                delay = self.backoff * 2 ** attempt
+                self.logger.debug(f"Retrying {name} in {delay:.1f}s (attempt {attempt + 2}/{self.retries + 1})")
+                await asyncio.sleep(delay)
+
+        self.failed += 1
+        self.logger.warning(f"PDF conversion of {name} failed after {self.retries + 1} attempts")
+        return None
@@ -0,0 +1,104 @@
+# File: src/exporters/print_run.py
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..generators.filename_pattern import resolve_field, sanitize_filename
+
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
+
+# pypdf keeps every appended page in memory until the file is written, so files are capped by default
+DEFAULT_MAX_DOCUMENTS = 250
+
+
+class PrintRunBuilder:
+    """
+    Combines the per-row PDFs of a run into print-run files, one per group
+    (e.g. per suburb or service type) and split every `max_documents`
+    documents, with a bookmark per client. Each file is assembled in memory,
+    so `max_documents` bounds memory use; 0 puts a whole group in one file.
+    """
+
+    def __init__(self, output_dir: Path, group_by: Optional[str] = None,
+                 max_documents: int = DEFAULT_MAX_DOCUMENTS,
+                 bookmarks: bool = True):
+        if PdfWriter is None:
+            raise ValueError("Print runs require the 'pypdf' package (pip install pypdf)")
+
+        self.output_dir = Path(output_dir)
+        self.group_by = group_by or None
+        self.max_documents = max_documents
+        self.bookmarks = bookmarks
+        self.logger = logging.getLogger(__name__)
+        self._groups: Dict[str, List[Tuple[str, Path]]] = {}
+
+    @classmethod
+    def from_config(cls, output_dir: Path, config: Dict[str, Any], group_by: Optional[str] = None):
+        """Build from the `output.print_run` config section; `group_by` overrides it."""
+
+        return cls(Path(output_dir) / 'print_runs',
+                   group_by=group_by or config.get('group_by'),
+                   max_documents=int(config.get('max_documents', DEFAULT_MAX_DOCUMENTS) or 0),
+                   bookmarks=config.get('bookmarks', True))
+
+    def add(self, pdf_path: Path, data: Dict[str, Any]):
+        """Queue one row's PDF for its group."""
+
+        group = ''
+        if self.group_by:
+            group = sanitize_filename(resolve_field(self.group_by, data)) or 'UNKNOWN'
+        label = str(resolve_field('client_name', data)).replace('_', ' ')
+        if data.get('ACN'):
+            label = f"{label} ({data['ACN']})"
+        self._groups.setdefault(group, []).append((label, Path(pdf_path)))
+
+    def discard(self, pdf_paths: Iterable[Path]):
+        """Drop PDFs that were never produced (e.g. failed batch conversions)."""
+
+        missing = set(map(Path, pdf_paths))
+        if missing:
+            for group, entries in self._groups.items():
+                self._groups[group] = [entry for entry in entries if entry[1] not in missing]
+
+    def build(self) -> List[Path]:
+        """Write the print-run files; returns their paths."""
+
+        written = []
+        for group in sorted(self._groups):
+            entries = self._groups[group]
+            size = self.max_documents or len(entries)
+            chunks = [entries[start:start + size] for start in range(0, len(entries), size)]
+            for number, chunk in enumerate(chunks, 1):
+                name = 'print_run' + (f"_{group}" if group else '') + (f"_{number:03d}" if len(chunks) > 1 else '')
+                written.append(self._write(self.output_dir / f"{name}.pdf", chunk))
+        return [path for path in written if path is not None]
+
+    def _write(self, path: Path, entries: List[Tuple[str, Path]]) -> Optional[Path]:
+        """Append each source PDF in turn and write the combined file."""
+
+        writer = PdfWriter()
+        pages = 0
+        documents = 0
+        for label, pdf_path in entries:
+            if not pdf_path.exists():
+                self.logger.warning(f"Print run: missing {pdf_path}, skipped")
+                continue
+            # Sources are read one at a time, but their pages stay in the writer until write()
+            writer.append(str(pdf_path), outline_item=label if self.bookmarks else None)
+            pages = len(writer.pages)
+            documents += 1
+
+        if not pages:
+            writer.close()
+            return None
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as handle:
+            writer.write(handle)
+        writer.close()
+        self.logger.info(f"🖨️  Print run {path} ({documents} documents, {pages} pages)")
+        return path
@@ -7,12 +7,15 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from urllib.parse import quote
 
+from ..utils.stage_timer import StageTimer
+
 class SharePointExporter:
     """Export documents to SharePoint using Microsoft Graph API."""
     
-    def __init__(self, app_config: Dict[str, Any]):
+    def __init__(self, app_config: Dict[str, Any], timer: Optional[StageTimer] = None):
         self.app_config = app_config
         self.logger = logging.getLogger(__name__)
+        self.timer = timer or StageTimer(enabled=False)
         self.access_token = None
         self.base_url = "https://graph.microsoft.com/v1.0"
         
@@ -221,11 +224,12 @@ class SharePointExporter:
         }
         
         try:
-            with open(file_path, 'rb') as f:
-                file_content = f.read()
-            
-            response = requests.put(upload_url, headers=headers, data=file_content)
-            response.raise_for_status()
+            with self.timer.stage('upload'):
+                with open(file_path, 'rb') as f:
+                    file_content = f.read()
+                
+                response = requests.put(upload_url, headers=headers, data=file_content)
+                response.raise_for_status()
             
             upload_response = response.json()
             web_url = upload_response.get('webUrl')
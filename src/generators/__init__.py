@@ -1,5 +1,8 @@
 # File: src/generators/__init__.py
 
 from .care_plan_generator import CarePlanGenerator
+from .filename_pattern import FilenamePattern
+from .filename_registry import FilenameRegistry
+from .output_layout import OutputLayout
 
-__all__ = ['CarePlanGenerator']
\ No newline at end of file
+__all__ = ['CarePlanGenerator', 'FilenamePattern', 'FilenameRegistry', 'OutputLayout']
\ No newline at end of file
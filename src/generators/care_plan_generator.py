@@ -1,9 +1,15 @@
 # File: src/generators/care_plan_generator.py
 
+import io
 import logging
 import subprocess
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+from ..utils.stage_timer import StageTimer
+from .filename_pattern import FilenamePattern
+from .filename_registry import FilenameRegistry
+from .output_layout import OutputLayout
 
 try:
     from docx2pdf import convert
@@ -13,39 +19,102 @@ except ImportError:
 class CarePlanGenerator:
     """Handles care plan document generation and PDF conversion."""
     
-    def __init__(self, output_dir: Path, app_config: Dict[str, Any]):
+    def __init__(self, output_dir: Path, app_config: Dict[str, Any], timer: Optional[StageTimer] = None):
         self.output_dir = Path(output_dir)
         self.app_config = app_config
         self.logger = logging.getLogger(__name__)
+        self.timer = timer or StageTimer(enabled=False)
+        self._pdf_exporter = None
+        self.archive = None
+        self._pending_pdfs: List[Dict[str, Any]] = []
+        
+        # Names are reserved in memory for the whole run instead of probing the disk per file
+        strategy = app_config.get('output', {}).get('duplicate_handling', 'rename')
+        self.registry = FilenameRegistry(strategy)
+        
+        # Parsed once; raises ValueError on a malformed pattern before any rendering
+        self.naming = FilenamePattern(app_config.get('output', {}).get('naming_pattern'))
+        
+        # flat or organized (sharded into sub-directories by organized_keys)
+        output_config = app_config.get('output', {})
+        self.formats = output_config.get('formats', ['docx', 'pdf'])
+        self.layout = OutputLayout(self.output_dir, output_config.get('directory_structure', 'flat'),
+                                   output_config.get('organized_keys'))
         
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
     def generate_document(self, template_path: Path, data: Dict[str, Any], 
-                         template_processor, generate_pdf: bool = True) -> Dict[str, Path]:
-        """Generate a single document from template and data."""
+                         template_processor, generate_pdf: bool = True,
+                         resume: bool = False, batch_pdf: bool = False) -> Dict[str, Path]:
+        """Generate a single document from template and data.
+        
+        Returns the written paths; empty for a skipped duplicate, and
+        {'skipped': True} (plus the existing 'pdf') for a row done before --resume.
+        When the PDF fails but the .docx is kept, 'pdf_failed' holds the PDF
+        path and the row counts as failed (as with failures from flush_pdfs).
+        
+        The rendered .docx stays in memory and is handed to the PDF converter as
+        bytes; it is only written out when `output.formats` includes docx.
+        With `batch_pdf` (and `pdf.batch_size` or `pdf.concurrency` set) the PDF
+        is queued and only written by `flush_pdfs`, which the caller runs once
+        `pdf_batch_ready`.
+        """
         
         try:
-            # Process template
-            doc = template_processor.process_template(template_path, data)
+            keep_docx = self._keep_docx(generate_pdf)
             
-            # Generate filename
+            # Generate filename and reserve it before rendering, so duplicates can be skipped
             filename = self._generate_filename(data)
+            target = self.layout.path_for(data, f"{filename}{'.docx' if keep_docx else '.pdf'}")
+            if resume:
+                # Only complete outputs from the earlier run count; 0-byte placeholders are redone in place
+                target = self.registry.resume_path(target)
+                expected = [target] + ([target.with_suffix('.pdf')] if generate_pdf else [])
+                if all(self.registry.finished(path) for path in expected):
+                    self.logger.debug(f"Resume: output already exists for {target}")
+                    # The existing PDF still belongs in this run's print runs
+                    return {'skipped': True, 'pdf': target.with_suffix('.pdf')} if generate_pdf else {'skipped': True}
+            output_path = self.registry.reserve(target, reuse_leftover=resume)
+            if output_path is None:
+                return {}
             
-            # Save Word document
-            docx_path = self.output_dir / f"{filename}.docx"
-            docx_path = self._handle_duplicate_file(docx_path)
-            
-            doc.save(str(docx_path))
-            self.logger.debug(f"Generated Word document: {docx_path}")
-            
-            result = {'docx': docx_path}
-            
-            # Generate PDF if requested
-            if generate_pdf:
-                pdf_path = self._generate_pdf_headless(docx_path)
-                if pdf_path:
-                    result['pdf'] = pdf_path
+            try:
+                # Process template
+                doc = template_processor.process_template(template_path, data)
+                
+                # Serialize the Word document in memory
+                buffer = io.BytesIO()
+                with self.timer.stage('save'):
+                    doc.save(buffer)
+                docx_bytes = buffer.getvalue()
+                
+                result = {}
+                if keep_docx:
+                    result['docx'] = self._write_output(output_path.with_suffix('.docx'), docx_bytes)
+                    self.logger.debug(f"Generated Word document: {result['docx']}")
+                
+                # Generate PDF if requested
+                if generate_pdf and batch_pdf and self._batching():
+                    self._pending_pdfs.append({
+                        'path': output_path,
+                        'docx_bytes': docx_bytes,
+                        'keep_docx': keep_docx
+                    })
+                    result['pdf'] = output_path.with_suffix('.pdf')
+                elif generate_pdf:
+                    pdf_bytes = self.pdf_exporter.convert_document(doc, docx_bytes, output_path.with_suffix('.docx').name)
+                    if pdf_bytes is not None:
+                        result['pdf'] = self._write_pdf(output_path.with_suffix('.pdf'), pdf_bytes)
+                    elif keep_docx:
+                        # Same rule as flush_pdfs: the row failed, but its .docx stays for `docugen pdf`
+                        self.logger.warning(f"Headless PDF conversion failed for {result['docx']} (docx kept)")
+                        result['pdf_failed'] = output_path.with_suffix('.pdf')
+                    else:
+                        raise Exception("PDF conversion failed and docx is not in output.formats")
+            except Exception:
+                self.registry.release(output_path)
+                raise
             
             return result
             
@@ -53,90 +122,113 @@ class CarePlanGenerator:
             self.logger.error(f"Failed to generate document for {data.get('client_name', 'unknown')}: {str(e)}")
             raise
     
-    def _generate_filename(self, data: Dict[str, Any]) -> str:
-        """Generate filename from data using configured pattern."""
+    def _batching(self) -> bool:
+        """Whether PDFs are collected for soffice batches or the concurrent scheduler."""
         
-        # Use new naming pattern: {client_name}_{ACN}_{service_start_date}
-        pattern = "{client_name}_{ACN}_{service_start_date}"
+        return self.pdf_exporter.queue_size > 0
+    
+    @property
+    def pdf_batch_ready(self) -> bool:
+        """Whether enough PDFs are queued to convert a batch."""
         
-        # Extract client data - support both old and new field names
-        first_name = data.get('FirstName') or data.get('GivenName', 'Unknown')
-        last_name = data.get('LastName') or data.get('FamilyName', 'Client')
-        client_name = f"{first_name}_{last_name}"
-        acn = data.get('ACN', 'UNKNOWN')
-        service_start_date = data.get('ServiceStartDate', 'UNKNOWN')
+        return bool(self._pending_pdfs) and len(self._pending_pdfs) >= self.pdf_exporter.queue_size
+    
+    def flush_pdfs(self) -> Tuple[List[Path], int]:
+        """Convert the queued PDFs together; returns the PDF paths that failed and how many kept their .docx."""
         
-        # Clean service start date for filename
-        if service_start_date and service_start_date != 'UNKNOWN':
-            # Convert date format from YYYY-MM-DD to YYYYMMDD
-            service_start_date = service_start_date.replace('-', '')
+        pending, self._pending_pdfs = self._pending_pdfs, []
+        if not pending:
+            return [], 0
         
-        # Prepare variables for filename
-        filename_data = {
-            'client_name': self._sanitize_filename(client_name),
-            'ACN': acn,
-            'service_start_date': service_start_date
-        }
+        documents = [(item['docx_bytes'], item['path'].with_suffix('.docx').name) for item in pending]
+        converted = self.pdf_exporter.convert_many(documents)
         
-        try:
-            filename = pattern.format(**filename_data)
-        except KeyError as e:
-            self.logger.warning(f"Missing variable in filename pattern: {e}")
-            # Fallback to simple pattern
-            filename = f"{filename_data['client_name']}_{filename_data.get('ACN', 'UNKNOWN')}"
+        failed = []
+        kept = 0
+        for item, pdf_bytes in zip(pending, converted):
+            pdf_path = item['path'].with_suffix('.pdf')
+            if pdf_bytes is not None:
+                self._write_pdf(pdf_path, pdf_bytes)
+                continue
+            failed.append(pdf_path)
+            if item['keep_docx']:
+                kept += 1
+                self.logger.warning(f"Headless PDF conversion failed for {item['path']} (docx kept)")
+            else:
+                self.registry.release(item['path'])
+                self.logger.error(f"PDF conversion failed for {pdf_path} and docx is not in output.formats")
+        return failed, kept
+    
+    def discard(self, result: Dict[str, Any]):
+        """Remove the files a failed row wrote and give back its name (e.g. before a job is retried)."""
+        
+        for key in ('docx', 'pdf'):
+            path = result.get(key)
+            if path is not None and self.archive is None:
+                Path(path).unlink(missing_ok=True)
+                self.registry.release(Path(path))
+    
+    def _keep_docx(self, generate_pdf: bool) -> bool:
+        """Whether the .docx is an output; without a PDF it always is."""
         
-        return filename
+        return not generate_pdf or 'docx' in self.formats
     
-    def _sanitize_filename(self, filename: str) -> str:
-        """Sanitize filename by removing invalid characters."""
+    def _write_output(self, path: Path, data: bytes) -> Path:
+        """Write one output file, or add it to the archive; returns the path or member name."""
+        
+        if self.archive is not None:
+            member = path.relative_to(self.output_dir)
+            with self.timer.stage('archive'):
+                self.archive.add(member.as_posix(), data)
+            return member
+        
+        with self.timer.stage('write'):
+            path.write_bytes(data)
+        return path
+
+    def _write_pdf(self, path: Path, pdf_bytes: bytes) -> Path:
+        """Optimize a converted PDF (pdf.optimize) and write it like any other output."""
+
+        return self._write_output(path, self.pdf_exporter.optimize(pdf_bytes, path.name))
+
+    def open_archive(self, archive_path: Path, volume_size: Optional[int] = None):
+        """Write documents into a zip/tar archive instead of one file per document."""
         
-        import re
-        # Remove or replace invalid filename characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', str(filename))
-        sanitized = re.sub(r'\s+', '_', sanitized)  # Replace spaces with underscores
-        sanitized = sanitized.strip('._')  # Remove leading/trailing dots and underscores
+        from ..exporters.archive_writer import ArchiveWriter
+        self.archive = ArchiveWriter(archive_path, volume_size)
+        # Names only have to be unique inside the archive, nothing is claimed on disk
+        self.registry = FilenameRegistry(self.registry.strategy, claim_on_disk=False)
+    
+    def close(self) -> List[Path]:
+        """Finish the archive (if any) and the exporter's scratch files; returns archive volumes."""
         
-        return sanitized[:50]  # Limit length
+        volumes = []
+        if self.archive is not None:
+            self.archive.close()
+            volumes = self.archive.volumes
+            self.archive = None
+        if self._pdf_exporter is not None:
+            self._pdf_exporter.close()
+        return volumes
     
-    def _get_current_date(self) -> str:
-        """Get current date in YYYYMMDD format."""
-        from datetime import datetime
-        return datetime.now().strftime('%Y%m%d')
+    def _generate_filename(self, data: Dict[str, Any]) -> str:
+        """Generate filename from data using configured pattern."""
+        
+        return self.naming.format(data)
     
-    def _handle_duplicate_file(self, file_path: Path) -> Path:
-        """Handle duplicate files by adding suffix."""
-        
-        if not file_path.exists():
-            return file_path
-        
-        # Get duplicate handling strategy from config
-        strategy = self.app_config.get('output', {}).get('duplicate_handling', 'rename')
-        
-        if strategy == 'overwrite':
-            return file_path
-        elif strategy == 'skip':
-            self.logger.info(f"Skipping duplicate file: {file_path}")
-            return file_path
-        else:  # rename (default)
-            counter = 1
-            stem = file_path.stem
-            suffix = file_path.suffix
-            parent = file_path.parent
-            
-            while True:
-                new_name = f"{stem}_{counter:03d}{suffix}"
-                new_path = parent / new_name
-                if not new_path.exists():
-                    return new_path
-                counter += 1
+    @property
+    def pdf_exporter(self):
+        """Headless PDF exporter, created on first use and kept for the run."""
+        
+        if self._pdf_exporter is None:
+            from ..exporters.headless_pdf_exporter import HeadlessPdfExporter
+            self._pdf_exporter = HeadlessPdfExporter(self.app_config, timer=self.timer)
+        return self._pdf_exporter
     
     def _generate_pdf_headless(self, docx_path: Path) -> Optional[Path]:
         """Generate PDF using headless conversion methods."""
         
-        from ..exporters.headless_pdf_exporter import HeadlessPdfExporter
-        
-        exporter = HeadlessPdfExporter(self.app_config)
-        pdf_path = exporter.convert_to_pdf(docx_path)
+        pdf_path = self.pdf_exporter.convert_to_pdf(docx_path)
         
         if pdf_path:
             self.logger.debug(f"Generated PDF via headless exporter: {pdf_path}")
@@ -0,0 +1,112 @@
+# File: src/generators/filename_pattern.py
+
+import re
+import string
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Compiled once at import instead of on every filename
+_INVALID_CHARS = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def sanitize_filename(value: Any, max_length: int = 50) -> str:
+    """Sanitize a filename component by removing invalid characters."""
+
+    sanitized = _INVALID_CHARS.sub('_', str(value))
+    sanitized = _WHITESPACE.sub('_', sanitized)  # Replace spaces with underscores
+    sanitized = sanitized.strip('._')  # Remove leading/trailing dots and underscores
+
+    return sanitized[:max_length]  # Limit length
+
+
+def resolve_field(field: str, data: Dict[str, Any]) -> Any:
+    """Resolve derived fields, falling back to the mapped row data."""
+
+    if field == 'client_name':
+        # Support both old and new field names
+        first_name = data.get('FirstName') or data.get('GivenName', 'Unknown')
+        last_name = data.get('LastName') or data.get('FamilyName', 'Client')
+        return f"{first_name}_{last_name}"
+
+    if field == 'service_start_date':
+        service_start_date = data.get('ServiceStartDate', 'UNKNOWN')
+        if service_start_date and service_start_date != 'UNKNOWN':
+            # Convert date format from YYYY-MM-DD to YYYYMMDD
+            service_start_date = str(service_start_date).replace('-', '')
+        return service_start_date
+
+    if field == 'date_processed':
+        return datetime.now().strftime('%Y%m%d')
+
+    return data.get(field, 'UNKNOWN')
+
+
+class FilenamePattern:
+    """
+    Filename pattern from `output.naming_pattern`, parsed once into literal
+    text and field slots. Fields can be any mapped template variable plus the
+    derived fields below.
+    """
+
+    DEFAULT = "{client_name}_{ACN}_{service_start_date}"
+    DERIVED_FIELDS = ('client_name', 'service_start_date', 'date_processed')
+
+    def __init__(self, pattern: Optional[str] = None):
+        self.pattern = pattern or self.DEFAULT
+        self._parts = self._parse(self.pattern)
+        self.fields: List[str] = [field for _, field, _ in self._parts if field is not None]
+
+    @staticmethod
+    def _parse(pattern: str) -> List[Tuple[str, Optional[str], str]]:
+        """Split the pattern into (literal, field, format_spec) parts."""
+
+        try:
+            parsed = list(string.Formatter().parse(pattern))
+        except ValueError as e:
+            raise ValueError(f"Invalid naming_pattern '{pattern}': {e}")
+
+        parts = []
+        for literal, field, format_spec, conversion in parsed:
+            if field is not None:
+                if not field or not field.isidentifier():
+                    raise ValueError(f"Invalid field '{{{field}}}' in naming_pattern '{pattern}'")
+                if conversion:
+                    raise ValueError(f"Conversions (!{conversion}) are not supported in naming_pattern")
+            parts.append((literal, field, format_spec or ''))
+
+        if not any(field for _, field, _ in parts):
+            raise ValueError(f"naming_pattern '{pattern}' has no fields, every document would share one name")
+        return parts
+
+    @classmethod
+    def available_fields(cls, mapper_config: Dict[str, Any]) -> Set[str]:
+        """Fields a mapper configuration makes available to the pattern."""
+
+        fields = set(cls.DERIVED_FIELDS)
+        fields.update(mapper_config.get('field_mappings', {}).values())
+        fields.update(mapper_config.get('fixed_values', {}).keys())
+        fields.update({'Type', '_row_number'})
+        for service_code in mapper_config.get('service_types', {}):
+            fields.update({f'{service_code}_selected', f'{service_code}_name'})
+        return fields
+
+    def validate(self, available: Iterable[str]):
+        """Raise ValueError if the pattern uses fields the mapper doesn't provide."""
+
+        unknown = sorted(set(self.fields) - set(available))
+        if unknown:
+            raise ValueError(f"naming_pattern '{self.pattern}' uses unknown fields: {', '.join(unknown)}")
+
+    def format(self, data: Dict[str, Any]) -> str:
+        """Build a filename (without extension) for one row."""
+
+        pieces = []
+        for literal, field, format_spec in self._parts:
+            pieces.append(literal)
+            if field is not None:
+                value = resolve_field(field, data)
+                if format_spec:
+                    value = format(value, format_spec)
+                pieces.append(sanitize_filename(value))
+        return ''.join(pieces)
@@ -0,0 +1,155 @@
+# File: src/generators/filename_registry.py
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+
+class FilenameRegistry:
+    """
+    Run-level registry of output file names.
+    Each output directory is scanned once; names are then reserved in memory
+    and claimed on disk with an exclusive create, so threads and worker
+    processes sharing the directory never pick the same name. Without
+    `claim_on_disk` (archive output) names are tracked in memory only.
+    """
+
+    STRATEGIES = ('rename', 'overwrite', 'skip')
+
+    def __init__(self, strategy: str = 'rename', claim_on_disk: bool = True):
+        self.logger = logging.getLogger(__name__)
+        if strategy not in self.STRATEGIES:
+            self.logger.warning(f"Unknown duplicate_handling '{strategy}', using 'rename'")
+            strategy = 'rename'
+
+        self.strategy = strategy
+        self.claim_on_disk = claim_on_disk
+        self._taken: Dict[Path, Set[str]] = {}
+        self._next_counter: Dict[Path, Dict[str, int]] = {}
+        # Files present and non-empty when each directory was scanned, and stems reserved by this run
+        self._finished: Dict[Path, Set[str]] = {}
+        self._reserved: Dict[Path, Set[str]] = {}
+        self._resume_seen: Dict[Path, int] = {}
+        self._lock = threading.Lock()
+
+    def _stems(self, directory: Path) -> Set[str]:
+        """Return the names already used in a directory, scanning (or creating) it on first use."""
+
+        stems = self._taken.get(directory)
+        if stems is None:
+            stems = set()
+            finished = set()
+            if self.claim_on_disk:
+                # Created once per run; organized layouts fan out into many directories
+                directory.mkdir(parents=True, exist_ok=True)
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            stems.add(entry.name.rsplit('.', 1)[0])
+                            # 0-byte files are placeholders of documents that were never written
+                            if entry.stat().st_size > 0:
+                                finished.add(entry.name)
+            self._taken[directory] = stems
+            self._finished[directory] = finished
+            self._reserved[directory] = set()
+            self._next_counter[directory] = {}
+        return stems
+
+    def resume_path(self, path: Path) -> Path:
+        """Name the n-th document asking for `path` in this run got from an earlier run.
+
+        With the rename strategy the earlier run wrote same-named documents as
+        path, path_001, path_002, ... in row order; otherwise all share `path`.
+        """
+
+        path = Path(path)
+        with self._lock:
+            seen = self._resume_seen.get(path, 0)
+            self._resume_seen[path] = seen + 1
+        if self.strategy != 'rename' or seen == 0:
+            return path
+        return path.parent / f"{path.stem}_{seen:03d}{path.suffix}"
+
+    def finished(self, path: Path) -> bool:
+        """Check whether this file was present and non-empty when its directory was scanned."""
+
+        path = Path(path)
+        with self._lock:
+            self._stems(path.parent)
+            return path.name in self._finished[path.parent]
+
+    def reserve(self, path: Path, reuse_leftover: bool = False) -> Optional[Path]:
+        """
+        Reserve a path for a new document according to the duplicate strategy.
+        Returns the path to write, or None when the document should be skipped.
+        With `reuse_leftover` (resume), a name left by an earlier run that this
+        run has not reserved yet is taken over and overwritten.
+        """
+
+        path = Path(path)
+        directory, stem, suffix = path.parent, path.stem, path.suffix
+
+        with self._lock:
+            stems = self._stems(directory)
+            reserved = self._reserved[directory]
+
+            if reuse_leftover and stem in stems and stem not in reserved:
+                reserved.add(stem)
+                return path
+
+            if stem not in stems and self._claim(path):
+                stems.add(stem)
+                reserved.add(stem)
+                return path
+
+            # Name is taken (possibly by another worker since the scan)
+            stems.add(stem)
+            if self.strategy == 'overwrite':
+                return path
+            if self.strategy == 'skip':
+                self.logger.info(f"Skipping duplicate file: {path}")
+                return None
+
+            counters = self._next_counter[directory]
+            counter = counters.get(stem, 1)
+            while True:
+                candidate_stem = f"{stem}_{counter:03d}"
+                counter += 1
+                candidate = directory / f"{candidate_stem}{suffix}"
+                if candidate_stem not in stems and self._claim(candidate):
+                    stems.add(candidate_stem)
+                    reserved.add(candidate_stem)
+                    counters[stem] = counter
+                    return candidate
+                stems.add(candidate_stem)
+
+    def release(self, path: Path):
+        """Give back a reservation whose document was never written."""
+
+        path = Path(path)
+        with self._lock:
+            if self.claim_on_disk:
+                try:
+                    # Only remove our own empty placeholder
+                    if path.exists() and path.stat().st_size == 0:
+                        path.unlink()
+                except OSError as e:
+                    self.logger.debug(f"Could not remove placeholder {path}: {e}")
+            if not path.exists():
+                self._stems(path.parent).discard(path.stem)
+                self._reserved[path.parent].discard(path.stem)
+
+    def _claim(self, path: Path) -> bool:
+        """Atomically create an empty placeholder; False if the file already exists."""
+
+        if not self.claim_on_disk:
+            return True
+
+        try:
+            fd = os.open(str(path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
@@ -0,0 +1,95 @@
+# File: src/generators/output_layout.py
+
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .filename_pattern import resolve_field, sanitize_filename
+
+
+class OutputLayout:
+    """
+    Maps a row to its output directory according to `output.directory_structure`.
+
+    `flat` writes everything to the output directory. `organized` fans out into
+    one sub-directory level per entry in `output.organized_keys`:
+
+    - `<field>`: the value of a mapped (or derived) field, e.g. `Type`
+    - `hash:<field>:<n>`: first n hex characters of the field's SHA-1, for even shards
+    - `date:<strftime>`: the processing date of the run, e.g. `date:%Y-%m`
+    """
+
+    STRUCTURES = ('flat', 'organized')
+    DEFAULT_KEYS = ['Type', 'hash:ACN:2']
+    UNKNOWN = '_unknown'
+
+    def __init__(self, output_dir: Path, structure: str = 'flat', keys: Optional[List[str]] = None):
+        if structure not in self.STRUCTURES:
+            raise ValueError(f"Unknown directory_structure '{structure}', expected one of: {', '.join(self.STRUCTURES)}")
+
+        self.output_dir = Path(output_dir)
+        self.structure = structure
+        # Fixed at start-up so a run crossing midnight stays in one date directory
+        self.run_date = datetime.now()
+        self._keys = [self._parse_key(key) for key in (keys or self.DEFAULT_KEYS)] if structure == 'organized' else []
+
+    @staticmethod
+    def _parse_key(key: str) -> Tuple[str, str, Any]:
+        """Parse one organized_keys entry into (kind, field or format, argument)."""
+
+        kind, _, rest = str(key).partition(':')
+        if not rest:
+            if not kind.isidentifier():
+                raise ValueError(f"Invalid organized_keys entry '{key}'")
+            return 'field', kind, None
+
+        if kind == 'date':
+            return 'date', rest, None
+
+        if kind == 'hash':
+            field, _, length = rest.partition(':')
+            try:
+                length = int(length or 2)
+            except ValueError:
+                raise ValueError(f"Invalid hash length in organized_keys entry '{key}'")
+            if not field.isidentifier() or not 1 <= length <= 40:
+                raise ValueError(f"Invalid organized_keys entry '{key}'")
+            return 'hash', field, length
+
+        raise ValueError(f"Unknown organized_keys kind '{kind}' in '{key}' (expected a field, hash: or date:)")
+
+    @property
+    def fields(self) -> List[str]:
+        """Row fields the layout reads, for validation against the mapper."""
+
+        return [name for kind, name, _ in self._keys if kind != 'date']
+
+    def validate(self, available):
+        """Raise ValueError if the layout uses fields the mapper doesn't provide."""
+
+        unknown = sorted(set(self.fields) - set(available))
+        if unknown:
+            raise ValueError(f"organized_keys uses unknown fields: {', '.join(unknown)}")
+
+    def directory_for(self, data: Dict[str, Any]) -> Path:
+        """Return the output directory for one row."""
+
+        directory = self.output_dir
+        for kind, name, argument in self._keys:
+            if kind == 'date':
+                part = self.run_date.strftime(name)
+            elif kind == 'hash':
+                value = str(resolve_field(name, data))
+                part = hashlib.sha1(value.encode('utf-8')).hexdigest()[:argument]
+            else:
+                part = resolve_field(name, data)
+                if part is None:
+                    part = ''
+            directory = directory / (sanitize_filename(part) or self.UNKNOWN)
+        return directory
+
+    def path_for(self, data: Dict[str, Any], filename: str) -> Path:
+        """Return the full output path for one row and file name."""
+
+        return self.directory_for(data) / filename
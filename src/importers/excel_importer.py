@@ -12,19 +12,27 @@ class ExcelImporter:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
-    def read_file(self, file_path: str) -> pd.DataFrame:
-        """Read Excel file and return DataFrame."""
+    def read_file(self, file_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read Excel file and return DataFrame (optionally only the given columns)."""
         
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"Excel file not found: {file_path}")
         
+        # Column names are matched after stripping whitespace, as below
+        usecols = None
+        if columns is not None:
+            wanted = set(columns)
+            usecols = lambda name: str(name).strip() in wanted
+        
         try:
             # Read Excel file
             if file_path.suffix.lower() == '.xlsx':
-                df = pd.read_excel(file_path, engine='openpyxl')
+                df = pd.read_excel(file_path, engine='openpyxl', usecols=usecols)
             elif file_path.suffix.lower() == '.xls':
-                df = pd.read_excel(file_path, engine='xlrd')
+                df = pd.read_excel(file_path, engine='xlrd', usecols=usecols)
+            elif file_path.suffix.lower() == '.csv':
+                df = pd.read_csv(file_path, usecols=usecols)
             else:
                 raise ValueError(f"Unsupported file format: {file_path.suffix}")
             
@@ -169,6 +177,41 @@ class ExcelImporter:
             self.logger.warning(f"Transformation failed for value '{value}' with '{transformation}': {str(e)}")
             return value
     
+    def column_coverage(self, df: pd.DataFrame, mapper_config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Compute per-column fill rates and missing required values with vectorized checks."""
+        
+        field_mappings = mapper_config.get('field_mappings', {})
+        required_fields = set(mapper_config.get('required_fields', []))
+        total = len(df)
+        
+        coverage = {}
+        for excel_col, template_var in field_mappings.items():
+            if excel_col not in df.columns:
+                coverage[excel_col] = {
+                    'template_var': template_var,
+                    'present': False,
+                    'required': excel_col in required_fields,
+                    'filled': 0,
+                    'missing': total,
+                    'fill_rate': 0.0
+                }
+                continue
+            
+            column = df[excel_col]
+            # Blank strings count as missing, the same as NaN in map_data
+            missing_mask = column.isna() | (column.astype(str).str.strip() == '')
+            missing = int(missing_mask.sum())
+            coverage[excel_col] = {
+                'template_var': template_var,
+                'present': True,
+                'required': excel_col in required_fields,
+                'filled': total - missing,
+                'missing': missing,
+                'fill_rate': (total - missing) / total if total else 0.0
+            }
+        
+        return coverage
+    
     def validate_columns(self, df: pd.DataFrame, required_columns: List[str]) -> List[str]:
         """Validate that required columns exist in DataFrame."""
         
@@ -0,0 +1,5 @@
+# File: src/server/__init__.py
+
+from .render_service import RenderService
+
+__all__ = ['RenderService']
@@ -0,0 +1,96 @@
+# File: src/server/render_server.py
+"""
+Transports for the render daemon: localhost HTTP and a Unix socket speaking
+newline-delimited JSON.
+"""
+
+import json
+import logging
+import os
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from .render_service import RenderService
+
+logger = logging.getLogger(__name__)
+
+
+def _handle(service: RenderService, payload: bytes) -> dict:
+    """Decode a JSON request, render it and turn failures into error responses."""
+
+    try:
+        return service.render(json.loads(payload))
+    except Exception as e:
+        logger.warning(f"Render request failed: {str(e)}")
+        return {'status': 'error', 'error': str(e)}
+
+
+def serve_http(service: RenderService, host: str = '127.0.0.1', port: int = 8765):
+    """Serve `POST /render` and `GET /health` over HTTP until interrupted."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == '/health':
+                self._reply(200, {'status': 'ok'})
+            else:
+                self._reply(404, {'status': 'error', 'error': 'not found'})
+
+        def do_POST(self):
+            if self.path != '/render':
+                self._reply(404, {'status': 'error', 'error': 'not found'})
+                return
+            length = int(self.headers.get('Content-Length', 0))
+            response = _handle(service, self.rfile.read(length))
+            self._reply(200 if response['status'] == 'ok' else 400, response)
+
+        def _reply(self, code: int, body: dict):
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    logger.info(f"🌐 Render server listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+def serve_unix(service: RenderService, socket_path: str):
+    """Serve newline-delimited JSON render requests on a Unix socket until interrupted."""
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                response = _handle(service, line)
+                self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+                self.wfile.flush()
+
+    path = Path(socket_path)
+    if path.exists():
+        path.unlink()
+
+    server = socketserver.ThreadingUnixStreamServer(str(path), Handler)
+    os.chmod(path, 0o600)
+    logger.info(f"🔌 Render server listening on unix:{path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if path.exists():
+            path.unlink()
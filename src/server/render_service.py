@@ -0,0 +1,103 @@
+# File: src/server/render_service.py
+
+import base64
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..core.config_loader import ConfigLoader
+from ..core.document_processor import DocumentProcessor
+
+
+class RenderService:
+    """
+    Long-lived render backend for the `serve` command.
+    Keeps app and mapper configs, compiled templates and the PDF exporter warm
+    so single-client renders only pay for the render itself.
+    """
+
+    def __init__(self, app_config: Dict[str, Any], output_dir: str, default_mapper: Optional[str] = None):
+        self.app_config = app_config
+        self.output_dir = output_dir
+        self.default_mapper = default_mapper
+        self.logger = logging.getLogger(__name__)
+
+        self.config_loader = ConfigLoader()
+        self._processors: Dict[str, DocumentProcessor] = {}
+        # Renders share the PDF converter, which does not tolerate concurrent use
+        self._lock = threading.Lock()
+
+    def warm_up(self, mapper: Optional[str] = None):
+        """Load the mapper, template and PDF exporter ahead of the first request."""
+
+        processor = self._processor_for(mapper or self.default_mapper)
+        template_path = processor._get_template_path()
+        processor.template_processor._load_template_bytes(template_path)
+        processor.generator.pdf_exporter.warm_up()
+        self.logger.info(f"🔥 Warmed up mapper {mapper or self.default_mapper} ({template_path})")
+
+    def _processor_for(self, mapper: Optional[str]) -> DocumentProcessor:
+        """Return a cached processor for a mapper config."""
+
+        if not mapper:
+            raise ValueError("Request has no 'mapper' and the server has no default mapper")
+
+        processor = self._processors.get(mapper)
+        if processor is None:
+            mapper_config = self.config_loader.load_mapper_config(mapper)
+            processor = DocumentProcessor(self.app_config, mapper_config, self.output_dir)
+            self._processors[mapper] = processor
+        return processor
+
+    def close(self):
+        """Close every cached processor's generator: UNO pool listeners, scratch and profile dirs."""
+
+        with self._lock:
+            processors, self._processors = self._processors, {}
+        for mapper, processor in processors.items():
+            try:
+                processor.generator.close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close processor for {mapper}: {str(e)}")
+
+    def render(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Render one document.
+
+        Request keys: `data` (raw export columns) or `mapped` (template variables),
+        optional `mapper`, `pdf` (default true) and `return` ('path' or 'bytes').
+        A failed PDF or a skipped duplicate gives an error status.
+        """
+
+        start = time.perf_counter()
+
+        if 'mapped' in request:
+            row, mapped = request['mapped'], True
+        elif 'data' in request:
+            row, mapped = request['data'], False
+        else:
+            raise ValueError("Request must contain 'data' or 'mapped'")
+
+        with self._lock:
+            processor = self._processor_for(request.get('mapper') or self.default_mapper)
+            result = processor.render_row(row, generate_pdf=request.get('pdf', True), mapped=mapped)
+
+        response: Dict[str, Any] = {'status': 'ok'}
+        if result.get('pdf_failed'):
+            # Same rule as `process`: the row failed, even though its .docx (if any) was written
+            response = {'status': 'error', 'error': f"PDF conversion failed for {Path(result['pdf_failed']).name}"}
+        elif not result or result.get('skipped'):
+            response = {'status': 'error', 'error': "Duplicate output name skipped, nothing was written "
+                                                    "(output.duplicate_handling)"}
+        for fmt in ('docx', 'pdf'):
+            if fmt not in result:
+                continue
+            path = result[fmt]
+            if request.get('return') == 'bytes':
+                response[fmt] = base64.b64encode(Path(path).read_bytes()).decode('ascii')
+            else:
+                response[fmt] = str(Path(path).resolve())
+        response['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        return response
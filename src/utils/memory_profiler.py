@@ -0,0 +1,175 @@
+# File: src/utils/memory_profiler.py
+"""
+Memory accounting for the processing pipeline using tracemalloc and RSS readings.
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def max_rss_bytes(usage) -> int:
+    """Peak RSS of a getrusage()/wait4() result in bytes."""
+
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+
+
+def current_rss() -> int:
+    """Return the current resident set size in bytes (peak RSS if unavailable)."""
+
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+
+    statm = Path('/proc/self/statm')
+    if statm.exists():
+        pages = int(statm.read_text().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE')
+
+    if resource is None:
+        return 0
+
+    return max_rss_bytes(resource.getrusage(resource.RUSAGE_SELF))
+
+
+class MemoryProfiler:
+    """
+    Takes tracemalloc snapshots and RSS readings at stage boundaries and every
+    N rows, logging the top allocation sites and the growth between snapshots.
+    """
+
+    # Allocations made by the profiler itself are not interesting
+    _IGNORED = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        tracemalloc.Filter(False, '<unknown>'),
+    )
+
+    def __init__(self, every_n_rows: int = 100, top_n: int = 10, frames: int = 1,
+                 report_path: Optional[str] = None):
+        self.every_n_rows = every_n_rows
+        self.top_n = top_n
+        self.frames = frames
+        self.report_path = Path(report_path) if report_path else None
+        self.logger = logging.getLogger(__name__)
+
+        self.checkpoints: List[Dict[str, Any]] = []
+        self._baseline = None
+        self._previous = None
+        self._rows_seen = 0
+
+    def start(self):
+        """Start tracing allocations and take the baseline snapshot."""
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.checkpoint('start')
+
+    def row_done(self):
+        """Count a processed row and take a snapshot every N rows."""
+
+        self._rows_seen += 1
+        if self.every_n_rows and self._rows_seen % self.every_n_rows == 0:
+            self.checkpoint(f"row {self._rows_seen}")
+
+    def checkpoint(self, label: str):
+        """Take a snapshot and log RSS, traced memory and the biggest growth sites."""
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(self._IGNORED)
+        traced_current, traced_peak = tracemalloc.get_traced_memory()
+        rss = current_rss()
+
+        growth = []
+        if self._previous is not None:
+            growth = [
+                {'site': str(stat.traceback), 'size_diff': stat.size_diff, 'count_diff': stat.count_diff}
+                for stat in snapshot.compare_to(self._previous, 'lineno')[:self.top_n]
+                if stat.size_diff > 0
+            ]
+
+        previous_rss = self.checkpoints[-1]['rss'] if self.checkpoints else rss
+        self.checkpoints.append({
+            'label': label,
+            'time': time.time(),
+            'rows': self._rows_seen,
+            'rss': rss,
+            'rss_delta': rss - previous_rss,
+            'traced_current': traced_current,
+            'traced_peak': traced_peak,
+            'growth': growth
+        })
+
+        self.logger.info(
+            f"🧠 [{label}] RSS {self._mb(rss):.1f} MB ({self._mb(rss - previous_rss):+.1f}), "
+            f"traced {self._mb(traced_current):.1f} MB (peak {self._mb(traced_peak):.1f})"
+        )
+        for item in growth[:3]:
+            self.logger.debug(f"     +{self._mb(item['size_diff']):.2f} MB  {item['site']}")
+
+        if self._baseline is None:
+            self._baseline = snapshot
+        self._previous = snapshot
+
+    def finish(self) -> Dict[str, Any]:
+        """Take a final snapshot, log the allocation report and optionally write it as JSON."""
+
+        self.checkpoint('end')
+        snapshot = self._previous
+
+        top_sites = [
+            {'site': str(stat.traceback), 'size': stat.size, 'count': stat.count}
+            for stat in snapshot.statistics('lineno')[:self.top_n]
+        ]
+        top_files = [
+            {'file': str(stat.traceback), 'size': stat.size, 'count': stat.count}
+            for stat in snapshot.statistics('filename')[:self.top_n]
+        ]
+        total_growth = [
+            {'site': str(stat.traceback), 'size_diff': stat.size_diff, 'count_diff': stat.count_diff}
+            for stat in snapshot.compare_to(self._baseline, 'lineno')[:self.top_n]
+            if stat.size_diff > 0
+        ]
+
+        self.logger.info(f"🧠 Memory report ({len(self.checkpoints)} snapshots):")
+        self.logger.info(f"   Top allocation sites:")
+        for item in top_sites:
+            self.logger.info(f"     {self._mb(item['size']):8.2f} MB  {item['count']:>8} blocks  {item['site']}")
+        self.logger.info(f"   Growth since start:")
+        for item in total_growth:
+            self.logger.info(f"     {self._mb(item['size_diff']):+8.2f} MB  {item['site']}")
+
+        tracemalloc.stop()
+
+        report = {
+            'checkpoints': self.checkpoints,
+            'top_sites': top_sites,
+            'top_files': top_files,
+            'growth_since_start': total_growth
+        }
+        if self.report_path:
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.report_path, 'w') as f:
+                json.dump(report, f, indent=2)
+            self.logger.info(f"   Report: {self.report_path}")
+
+        return report
+
+    @staticmethod
+    def _mb(size: int) -> float:
+        return size / (1024 * 1024)
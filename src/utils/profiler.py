@@ -0,0 +1,246 @@
+# File: src/utils/profiler.py
+"""
+cProfile and sampling-profiler hooks for the processing pipeline.
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+MODES = ('cprofile', 'sample')
+
+
+class _StackSampler:
+    """Samples the call stack of one thread at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._running = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='docugen-sampler', daemon=True)
+        self._thread.start()
+
+    def resume(self):
+        self._running.set()
+
+    def pause(self):
+        self._running.clear()
+
+    def close(self):
+        self._stopped.set()
+        self._running.set()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            self._running.wait()
+            if self._stopped.is_set():
+                return
+
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+            time.sleep(self.interval)
+
+
+class PipelineProfiler:
+    """
+    Profiles the whole pipeline, or only a range of rows, with cProfile or a
+    low-overhead stack sampler. Output from several worker processes can be
+    combined with `merge`.
+    """
+
+    def __init__(self, output_path: str, mode: str = 'cprofile',
+                 rows: Optional[Tuple[int, int]] = None, interval: float = 0.005, top_n: int = 20):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiler mode: {mode} (expected one of {MODES})")
+
+        self.output_path = Path(output_path)
+        self.mode = mode
+        self.rows = rows
+        self.interval = interval
+        self.top_n = top_n
+        self.logger = logging.getLogger(__name__)
+
+        self._profile = cProfile.Profile() if mode == 'cprofile' else None
+        self._sampler = None
+        self._active = False
+
+    @staticmethod
+    def parse_rows(value: Optional[str]) -> Optional[Tuple[int, int]]:
+        """Parse a 'START:END' row range (1-based, inclusive)."""
+
+        if not value:
+            return None
+        try:
+            start, end = value.split(':', 1)
+            return int(start), int(end)
+        except ValueError:
+            raise ValueError(f"Invalid row range '{value}', expected START:END")
+
+    def start(self):
+        """Start profiling the whole run (no-op when restricted to a row range)."""
+        if self.rows is None:
+            self._enable()
+
+    def enter_row(self, row_number: int):
+        """Enable profiling if the row is inside the selected range."""
+        if self.rows is not None and self.rows[0] <= row_number <= self.rows[1]:
+            self._enable()
+
+    def exit_row(self, row_number: int):
+        """Pause profiling after a row when profiling a row range."""
+        if self.rows is not None:
+            self._disable()
+
+    def finish(self) -> Optional[Path]:
+        """Stop profiling, write the output file and log the hottest functions.
+
+        Returns None without writing anything when nothing was profiled, e.g.
+        a --profile-rows range outside the data or a dry run.
+        """
+
+        self._disable()
+
+        if not self._has_data():
+            if self._sampler is not None:
+                self._sampler.close()
+            self.logger.info(f"🔬 Nothing was profiled{f' (rows {self.rows[0]}:{self.rows[1]})' if self.rows else ''}; "
+                             f"{self.output_path} not written")
+            return None
+
+        if self.mode == 'cprofile':
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._profile.dump_stats(str(self.output_path))
+        else:
+            stacks = Counter()
+            if self._sampler is not None:
+                self._sampler.close()
+                stacks = self._sampler.stacks
+            self._write_stacks(stacks, self.output_path)
+
+        self.logger.info(f"🔬 Profile written to {self.output_path}")
+        self.logger.info(self.summarize(self.output_path, self.mode, self.top_n))
+        return self.output_path
+
+    def _has_data(self) -> bool:
+        """True when the profiler collected anything."""
+
+        if self.mode == 'cprofile':
+            return bool(self._profile.getstats())
+        return self._sampler is not None and bool(self._sampler.stacks)
+
+    def _enable(self):
+        if self._active:
+            return
+        self._active = True
+
+        if self.mode == 'cprofile':
+            self._profile.enable()
+        else:
+            if self._sampler is None:
+                self._sampler = _StackSampler(threading.get_ident(), self.interval)
+            self._sampler.resume()
+
+    def _disable(self):
+        if not self._active:
+            return
+        self._active = False
+
+        if self.mode == 'cprofile':
+            self._profile.disable()
+        else:
+            self._sampler.pause()
+
+    @staticmethod
+    def _write_stacks(stacks: Counter, path: Path):
+        """Write samples in collapsed-stack format (compatible with flamegraph tools)."""
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    @staticmethod
+    def _read_stacks(path: Path) -> Counter:
+        stacks = Counter()
+        with open(path) as f:
+            for line in f:
+                stack, _, count = line.rstrip('\n').rpartition(' ')
+                if stack:
+                    stacks[stack] += int(count)
+        return stacks
+
+    @classmethod
+    def summarize(cls, path: Path, mode: str, top_n: int = 20) -> str:
+        """Return a short top-N hot-function summary for a profile file."""
+
+        if mode == 'cprofile':
+            stream = io.StringIO()
+            try:
+                stats = pstats.Stats(str(path), stream=stream)
+            except TypeError:
+                # pstats refuses profiles without any recorded calls
+                return f"No profile data in {path}"
+            stats.sort_stats('cumulative').print_stats(top_n)
+            return stream.getvalue()
+
+        stacks = cls._read_stacks(Path(path))
+        total = sum(stacks.values()) or 1
+        self_counts = Counter()
+        total_counts = Counter()
+        for stack, count in stacks.items():
+            frames = stack.split(';')
+            self_counts[frames[-1]] += count
+            for frame in set(frames):
+                total_counts[frame] += count
+
+        lines = [f"Sampled {total} stacks. Top {top_n} functions by self / cumulative samples:"]
+        for frame, count in self_counts.most_common(top_n):
+            lines.append(f"  {count / total:6.1%} self  {total_counts[frame] / total:6.1%} cum  {frame}")
+        return '\n'.join(lines)
+
+    @classmethod
+    def merge(cls, paths: List[Path], output_path: Path, mode: str) -> Path:
+        """Merge profiles written by several processes into one file."""
+
+        if not paths:
+            raise ValueError("No profile files to merge")
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if mode == 'cprofile':
+            stats = None
+            for path in paths:
+                try:
+                    if stats is None:
+                        stats = pstats.Stats(str(path))
+                    else:
+                        stats.add(str(path))
+                except TypeError:
+                    logging.getLogger(__name__).warning(f"Skipping {path}: no profile data")
+            if stats is None:
+                raise ValueError("None of the profiles contain any data")
+            stats.dump_stats(str(output_path))
+        else:
+            stacks = Counter()
+            for path in paths:
+                stacks.update(cls._read_stacks(Path(path)))
+            cls._write_stacks(stacks, output_path)
+
+        return output_path
@@ -0,0 +1,171 @@
+# File: src/utils/stage_timer.py
+"""
+Per-stage timing instrumentation for the document pipeline.
+"""
+
+import csv
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class StageTimer:
+    """Collects per-row durations for each pipeline stage (read, map, render, save, pdf, ...)."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def set_row(self, row: Optional[int]):
+        """Set the row that subsequent stages on this thread are attributed to."""
+        self._local.row = row
+
+    @contextmanager
+    def stage(self, name: str, row: Optional[int] = None):
+        """Time the enclosed block as one occurrence of `name`."""
+
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, row)
+
+    def record(self, name: str, seconds: float, row: Optional[int] = None):
+        """Record a duration measured elsewhere."""
+
+        if not self.enabled:
+            return
+
+        if row is None:
+            row = getattr(self._local, 'row', None)
+
+        with self._lock:
+            self.records.append({'row': row, 'stage': name, 'seconds': seconds})
+
+    def record_process(self, name: str, seconds: float, cpu_user: float, cpu_sys: float, max_rss: int,
+                       row: Optional[int] = None):
+        """Record a child process: wall time, user/sys CPU seconds and peak RSS in bytes."""
+
+        if not self.enabled:
+            return
+
+        if row is None:
+            row = getattr(self._local, 'row', None)
+
+        with self._lock:
+            self.records.append({'row': row, 'stage': name, 'seconds': seconds,
+                                 'cpu_user': cpu_user, 'cpu_sys': cpu_sys, 'max_rss': max_rss})
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return count, total and p50/p95/p99 per stage in seconds."""
+
+        durations: Dict[str, List[float]] = {}
+        with self._lock:
+            for record in self.records:
+                durations.setdefault(record['stage'], []).append(record['seconds'])
+
+        summary = {}
+        for stage, values in durations.items():
+            values.sort()
+            summary[stage] = {
+                'count': len(values),
+                'total': sum(values),
+                'p50': self._percentile(values, 50),
+                'p95': self._percentile(values, 95),
+                'p99': self._percentile(values, 99),
+                'max': values[-1]
+            }
+        return summary
+
+    def process_summary(self) -> Dict[str, Dict[str, float]]:
+        """Return count, wall and CPU totals and peak RSS per child-process stage."""
+
+        summary: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            for record in self.records:
+                if 'cpu_user' not in record:
+                    continue
+                stats = summary.setdefault(record['stage'], {
+                    'count': 0, 'wall': 0.0, 'cpu_user': 0.0, 'cpu_sys': 0.0, 'max_rss': 0
+                })
+                stats['count'] += 1
+                stats['wall'] += record['seconds']
+                stats['cpu_user'] += record['cpu_user']
+                stats['cpu_sys'] += record['cpu_sys']
+                stats['max_rss'] = max(stats['max_rss'], record['max_rss'])
+
+        for stats in summary.values():
+            # Well below 1.0 means the process mostly waited (I/O, locks, start-up sleeps)
+            stats['cpu_ratio'] = (stats['cpu_user'] + stats['cpu_sys']) / stats['wall'] if stats['wall'] else 0.0
+        return summary
+
+    def format_report(self) -> str:
+        """Render the summary as a text table, slowest total first."""
+
+        summary = self.summary()
+        lines = [
+            f"{'Stage':<24} {'Count':>7} {'Total s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+            '-' * 72
+        ]
+        for stage, stats in sorted(summary.items(), key=lambda item: item[1]['total'], reverse=True):
+            lines.append(
+                f"{stage:<24} {stats['count']:>7} {stats['total']:>10.2f} "
+                f"{stats['p50'] * 1000:>9.1f} {stats['p95'] * 1000:>9.1f} {stats['p99'] * 1000:>9.1f}"
+            )
+
+        processes = self.process_summary()
+        if processes:
+            lines += [
+                '',
+                f"{'Child process':<24} {'Count':>7} {'Wall s':>10} {'User s':>9} {'Sys s':>9} {'CPU/wall':>9} {'Peak MB':>9}",
+                '-' * 82
+            ]
+            for stage, stats in sorted(processes.items(), key=lambda item: item[1]['wall'], reverse=True):
+                lines.append(
+                    f"{stage:<24} {stats['count']:>7} {stats['wall']:>10.2f} {stats['cpu_user']:>9.2f} "
+                    f"{stats['cpu_sys']:>9.2f} {stats['cpu_ratio']:>9.2f} {stats['max_rss'] / 1024 / 1024:>9.0f}"
+                )
+        return '\n'.join(lines)
+
+    def write_json(self, path: Path):
+        """Write the summary and raw timings to a JSON file."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            records = list(self.records)
+        with open(path, 'w') as f:
+            json.dump({'summary': self.summary(), 'processes': self.process_summary(), 'records': records},
+                      f, indent=2)
+
+    def write_csv(self, path: Path):
+        """Write the raw timings to a CSV file (one row per stage occurrence; CPU/RSS for child processes)."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            records = list(self.records)
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['row', 'stage', 'seconds', 'cpu_user', 'cpu_sys', 'max_rss'])
+            writer.writeheader()
+            writer.writerows(records)
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], pct: float) -> float:
+        """Linear-interpolated percentile of an already sorted list."""
+
+        if not sorted_values:
+            return 0.0
+        position = (len(sorted_values) - 1) * pct / 100
+        lower = int(position)
+        upper = min(lower + 1, len(sorted_values) - 1)
+        return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)